@@ -0,0 +1,122 @@
+"""Benchmark for deriving style colours.
+
+Measures the per-style cost of constructing a :class:`Style` (which
+derives tints, shades and contrast colours) and computing its template
+variables, once with the previous string based colour helpers and once
+with the current ones built on packed integers.  The current helpers
+are measured both warm and with their parse/format caches cleared
+before every style, so the numbers also cover first use.
+
+Run from the repository root::
+
+    python benchmarks/bench_colours.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from contextlib import contextmanager
+from typing import Iterator, Tuple
+
+from q_materialise import compiler, get_style, list_styles, utils
+from q_materialise.style import Style
+
+
+def _legacy_hex_to_rgb(hex_colour: str) -> Tuple[int, int, int]:
+    s = hex_colour.strip().lstrip("#")
+    if len(s) == 3:
+        s = "".join(ch * 2 for ch in s)
+    if len(s) != 6:
+        raise ValueError(f"Invalid hex colour: {hex_colour}")
+    return (int(s[0:2], 16), int(s[2:4], 16), int(s[4:6], 16))
+
+
+def _legacy_rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
+    r, g, b = (max(0, min(255, int(v))) for v in rgb)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def _legacy_lighten(hex_colour: str, factor: float) -> str:
+    r, g, b = _legacy_hex_to_rgb(hex_colour)
+    r = int(r + (255 - r) * factor)
+    g = int(g + (255 - g) * factor)
+    b = int(b + (255 - b) * factor)
+    return _legacy_rgb_to_hex((r, g, b))
+
+
+def _legacy_darken(hex_colour: str, factor: float) -> str:
+    r, g, b = _legacy_hex_to_rgb(hex_colour)
+    r = int(r * (1 - factor))
+    g = int(g * (1 - factor))
+    b = int(b * (1 - factor))
+    return _legacy_rgb_to_hex((r, g, b))
+
+
+def _legacy_contrast_color(hex_colour: str) -> str:
+    r, g, b = _legacy_hex_to_rgb(hex_colour)
+    return "#000000" if 0.299 * r + 0.587 * g + 0.114 * b >= 186 else "#ffffff"
+
+
+@contextmanager
+def _legacy_helpers() -> Iterator[None]:
+    """Temporarily routes style derivation through the string helpers."""
+    replaced = {
+        (utils, "lighten"): _legacy_lighten,
+        (utils, "darken"): _legacy_darken,
+        (utils, "contrast_color"): _legacy_contrast_color,
+        (compiler, "lighten"): _legacy_lighten,
+        (compiler, "darken"): _legacy_darken,
+        (compiler, "contrast_color"): _legacy_contrast_color,
+    }
+    saved = {key: getattr(*key) for key in replaced}
+    try:
+        for (module, name), func in replaced.items():
+            setattr(module, name, func)
+        yield
+    finally:
+        for (module, name), func in saved.items():
+            setattr(module, name, func)
+
+
+def _derive(source: Style) -> None:
+    style = Style(source.name, source.primary, source.secondary, source.is_dark)
+    style.extras = source.extras
+    compiler._qss_variables(style)
+
+
+def _derive_cold(source: Style) -> None:
+    utils._parse.cache_clear()
+    utils._format.cache_clear()
+    _derive(source)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'style':<22}{'strings':>12}{'packed':>12}{'cold':>12}{'speedup':>10}")
+    totals = [0.0, 0.0, 0.0]
+    for name in list_styles():
+        source = get_style(name)
+        with _legacy_helpers():
+            legacy = compiler._qss_variables(source)
+            t_legacy = timeit.timeit(lambda: _derive(source), number=args.number)
+        assert compiler._qss_variables(source) == legacy
+        t_packed = timeit.timeit(lambda: _derive(source), number=args.number)
+        t_cold = timeit.timeit(lambda: _derive_cold(source), number=args.number)
+        per_call = [t / args.number * 1e6 for t in (t_legacy, t_packed, t_cold)]
+        totals = [a + b for a, b in zip(totals, per_call)]
+        print(
+            f"{name:<22}{per_call[0]:>10.1f}us{per_call[1]:>10.1f}us"
+            f"{per_call[2]:>10.1f}us{per_call[0] / per_call[1]:>9.1f}x"
+        )
+    print(
+        f"{'total':<22}{totals[0]:>10.1f}us{totals[1]:>10.1f}us"
+        f"{totals[2]:>10.1f}us{totals[0] / totals[1]:>9.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
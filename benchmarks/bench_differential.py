@@ -0,0 +1,83 @@
+"""Benchmark for differential theme switching.
+
+Alternates between a built-in style and a copy of it with a different
+``primary`` colour on the demo window, once with full re-styling and
+once with ``inject_style(..., differential=True)``, and reports the
+median cost of applying the stylesheet.  With the differential path
+only the widgets whose rules use the primary colour are re-polished.
+
+Run from the repository root::
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_differential.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from q_materialise import Style, core, get_style, inject_style, list_styles  # noqa: E402
+from q_materialise.binding import QtWidgets  # noqa: E402
+from q_materialise.demo import MegaWindow  # noqa: E402
+
+
+def _timed_switches(app, styles, switches: int, differential: bool):
+    apply_stylesheet = core.apply_stylesheet
+    timings = []
+    results = []
+
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        result = apply_stylesheet(*args, **kwargs)
+        app.processEvents()
+        timings.append((time.perf_counter() - start) * 1e3)
+        results.append(result)
+        return result
+
+    core.apply_stylesheet = timed
+    try:
+        # Start every run from a fully styled application
+        inject_style(app, styles[0])
+        timings.clear()
+        results.clear()
+        for i in range(switches):
+            inject_style(app, styles[(i + 1) % 2], differential=differential)
+    finally:
+        core.apply_stylesheet = apply_stylesheet
+    return timings, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--switches", type=int, default=20)
+    parser.add_argument("-s", "--style", default=list_styles()[0])
+    parser.add_argument("--primary", default="#e91e63")
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    window = MegaWindow()
+    window.show()
+    app.processEvents()
+
+    base = get_style(args.style)
+    styles = [base, Style.from_dict({**base.to_dict(), "primary": args.primary})]
+
+    full, _ = _timed_switches(app, styles, args.switches, differential=False)
+    diff, restyled = _timed_switches(app, styles, args.switches, differential=True)
+
+    widgets = len(app.allWidgets())
+    print(f"style:              {args.style} / primary {args.primary}")
+    print(f"widgets:            {widgets}")
+    print(f"re-polished:        {statistics.median(restyled):.0f} widgets")
+    print(f"full (median):      {statistics.median(full):8.2f} ms")
+    print(f"differential:       {statistics.median(diff):8.2f} ms")
+    print(f"speedup:            {statistics.median(full) / statistics.median(diff):8.2f}x")
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Micro-benchmark for QSS template rendering.
+
+Compares the previous rendering strategy of ``_build_qss`` (dedent and
+``str.format`` over the full template on every call) with the compiled
+template, both for a full render and for re-rendering after a single
+variable changed.  Every built-in style is measured.
+
+Run from the repository root::
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_qss_template.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import textwrap
+import timeit
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from q_materialise.core import (  # noqa: E402
+    _COMPILED_QSS,
+    _QSS_TEMPLATE,
+    _qss_variables,
+    get_style,
+    list_styles,
+)
+from q_materialise.utils import lighten  # noqa: E402
+
+_ARROWS = {
+    "DOWN_ARROW_ACTIVE": "icons:down.svg",
+    "DOWN_ARROW_PRIMARY": "icons:down.svg",
+    "UP_ARROW_ACTIVE": "icons:up.svg",
+    "UP_ARROW_PRIMARY": "icons:up.svg",
+}
+
+
+def _legacy_render(variables):
+    return textwrap.dedent(_QSS_TEMPLATE).format(**variables)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--number", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'style':<22}{'format':>12}{'compiled':>12}{'patch':>12}{'speedup':>10}")
+    totals = [0.0, 0.0, 0.0]
+    for name in list_styles():
+        variables = dict(_qss_variables(get_style(name)), **_ARROWS)
+        parts = _COMPILED_QSS.render_parts(variables)
+        assert "".join(parts) == _legacy_render(variables)
+        change = {"PRIMARY": lighten(variables["PRIMARY"], 0.1)}
+
+        t_format = timeit.timeit(lambda: _legacy_render(variables), number=args.number)
+        t_compiled = timeit.timeit(
+            lambda: _COMPILED_QSS.render(variables), number=args.number
+        )
+        t_patch = timeit.timeit(
+            lambda: _COMPILED_QSS.patch(parts, change), number=args.number
+        )
+        per_call = [t / args.number * 1e6 for t in (t_format, t_compiled, t_patch)]
+        totals = [a + b for a, b in zip(totals, per_call)]
+        print(
+            f"{name:<22}{per_call[0]:>10.1f}us{per_call[1]:>10.1f}us"
+            f"{per_call[2]:>10.1f}us{per_call[0] / per_call[1]:>9.1f}x"
+        )
+    print(
+        f"{'total':<22}{totals[0]:>10.1f}us{totals[1]:>10.1f}us"
+        f"{totals[2]:>10.1f}us{totals[0] / totals[1]:>9.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+"""Benchmark suite for the style application hot paths.
+
+Measures, with a real Qt application on the offscreen platform:
+
+* ``build_qss`` – rendering the stylesheet of every built-in style
+  with :func:`q_materialise.core._build_qss`;
+* ``get_style`` – loading every built-in style by name;
+* ``inject_style[N]`` – applying a style to a synthetic widget tree of
+  ``N`` widgets and processing the resulting events;
+* ``theme_switch[N]`` – switching between two styles on that tree;
+* ``icon_tint`` – tinting and painting a set of standard icons;
+* ``standard_icon`` – ``QStyle.standardIcon`` lookups through the
+  installed proxy style.
+
+Every case reports the median and minimum of several runs in
+milliseconds (fewer runs for the trees of more than 1,000 widgets).
+Results are written as JSON with ``--output`` and compared with a
+baseline: each case whose median moved by more than ``--tolerance`` is
+flagged as slower or faster, and ``--fail-on-regression`` turns slower
+cases into a non-zero exit status.
+
+Timings depend on the machine, so the baseline is recorded locally
+(``benchmarks/baseline.json``, ignored by git) from the unchanged code
+on the machine you compare on.
+
+Run from the repository root::
+
+    # before a change, record the baseline
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_suite.py --update-baseline
+    # after the change, compare against it
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_suite.py \\
+        --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from q_materialise import core, get_style, inject_style, list_styles  # noqa: E402
+from q_materialise import icon_utils  # noqa: E402
+from q_materialise.binding import QtCore, QtGui, QtWidgets, binding  # noqa: E402
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+# Widget types the synthetic trees cycle through.
+_WIDGETS = (
+    QtWidgets.QPushButton,
+    QtWidgets.QCheckBox,
+    QtWidgets.QLineEdit,
+    QtWidgets.QComboBox,
+    QtWidgets.QToolButton,
+    QtWidgets.QLabel,
+    QtWidgets.QSpinBox,
+    QtWidgets.QSlider,
+    QtWidgets.QProgressBar,
+    QtWidgets.QRadioButton,
+)
+
+# Standard pixmaps looked up and tinted by the icon cases.
+_STANDARD_PIXMAPS = [
+    getattr(QtWidgets.QStyle, name)
+    for name in (
+        "SP_DialogOkButton",
+        "SP_DialogCancelButton",
+        "SP_DialogSaveButton",
+        "SP_DialogOpenButton",
+        "SP_DirIcon",
+        "SP_FileIcon",
+        "SP_TrashIcon",
+        "SP_BrowserReload",
+        "SP_ArrowUp",
+        "SP_ArrowDown",
+        "SP_MessageBoxWarning",
+        "SP_TitleBarCloseButton",
+    )
+    if hasattr(QtWidgets.QStyle, name)
+]
+
+
+def _measure(func: Callable[[], None], repeat: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1e3)
+    return {
+        "median_ms": statistics.median(timings),
+        "min_ms": min(timings),
+        "runs": repeat,
+    }
+
+
+def _build_tree(widgets: int) -> QtWidgets.QWidget:
+    """Returns a shown window holding ``widgets`` widgets in group boxes."""
+    window = QtWidgets.QWidget()
+    layout = QtWidgets.QVBoxLayout(window)
+    style = QtWidgets.QApplication.style()
+    group_layout = None
+    for i in range(widgets):
+        if i % 10 == 0:
+            group = QtWidgets.QGroupBox(f"Group {i // 10}")
+            group_layout = QtWidgets.QHBoxLayout(group)
+            layout.addWidget(group)
+        widget = _WIDGETS[i % len(_WIDGETS)]()
+        if isinstance(widget, QtWidgets.QComboBox):
+            widget.addItems(["one", "two"])
+        elif isinstance(widget, QtWidgets.QToolButton):
+            sp = _STANDARD_PIXMAPS[i % len(_STANDARD_PIXMAPS)]
+            widget.setIcon(style.standardIcon(sp))
+        elif hasattr(widget, "setText"):
+            widget.setText(f"Widget {i}")
+        group_layout.addWidget(widget)
+    window.show()
+    return window
+
+
+def _dispose(app: QtWidgets.QApplication, window: QtWidgets.QWidget) -> None:
+    window.close()
+    window.deleteLater()
+    app.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete)
+    app.processEvents()
+
+
+def run(sizes: List[int], repeat: int) -> Dict[str, Dict[str, float]]:
+    """Runs every case and returns the results keyed by case name."""
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    names = list_styles()
+    styles = [get_style(name) for name in names]
+    first, second = names[:2]
+    results: Dict[str, Dict[str, float]] = {}
+
+    def build_qss() -> None:
+        for style in styles:
+            core._build_qss(style)
+
+    def load_styles() -> None:
+        for name in names:
+            get_style(name)
+
+    results["build_qss"] = _measure(build_qss, repeat)
+    results["get_style"] = _measure(load_styles, repeat)
+
+    for size in sizes:
+        window = _build_tree(size)
+        app.processEvents()
+        switch = iter(range(1 << 30))
+        # Large trees take seconds per run; fewer runs keep the suite short.
+        runs = max(2, repeat * 1000 // max(size, 1000))
+
+        def apply_style() -> None:
+            inject_style(app, first)
+            app.processEvents()
+
+        def switch_theme() -> None:
+            inject_style(app, (first, second)[next(switch) % 2])
+            app.processEvents()
+
+        results[f"inject_style[{size}]"] = _measure(apply_style, runs)
+        results[f"theme_switch[{size}]"] = _measure(switch_theme, runs)
+        _dispose(app, window)
+
+    inject_style(app, first)
+    proxy = app.style()
+    base = QtWidgets.QCommonStyle()
+    icons = [base.standardIcon(sp) for sp in _STANDARD_PIXMAPS]
+    colour = QtGui.QColor("#6200ee")
+
+    def tint_icons() -> None:
+        icon_utils.clear_tint_cache()
+        for icon in icons:
+            icon_utils._colorize_icon(icon, colour).pixmap(32, 32)
+
+    def standard_icons() -> None:
+        for sp in _STANDARD_PIXMAPS:
+            proxy.standardIcon(sp).pixmap(24, 24)
+
+    results["icon_tint"] = _measure(tint_icons, repeat)
+    results["standard_icon"] = _measure(standard_icons, repeat)
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """Prints the results next to the baseline; returns the slower cases."""
+    slower = []
+    print(f"{'case':<22}{'median':>12}{'baseline':>12}{'change':>10}")
+    for name, result in results.items():
+        line = f"{name:<22}{result['median_ms']:>10.2f}ms"
+        base = baseline.get(name)
+        if base:
+            ratio = result["median_ms"] / base["median_ms"]
+            line += f"{base['median_ms']:>10.2f}ms{(ratio - 1) * 100:>+9.1f}%"
+            if ratio > 1 + tolerance:
+                line += "  slower"
+                slower.append(name)
+            elif ratio < 1 - tolerance:
+                line += "  faster"
+        print(line)
+    return slower
+
+
+def _read_results(path: Path) -> Optional[Dict[str, Dict[str, float]]]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))["results"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10000],
+        help="widget counts of the synthetic trees",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-o", "--output", type=Path, help="write the results here")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="store the results as baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="relative change reported as slower or faster (default: 0.25)",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="exit with status 1 if a case is slower than the baseline",
+    )
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat)
+    data = {
+        "meta": {
+            "python": platform.python_version(),
+            "binding": binding,
+            "qt": QtCore.qVersion(),
+            "platform": platform.platform(),
+            "qpa": os.environ.get("QT_QPA_PLATFORM", ""),
+        },
+        "results": results,
+    }
+    text = json.dumps(data, indent=1, sort_keys=True) + "\n"
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    if args.update_baseline:
+        args.baseline.write_text(text, encoding="utf-8")
+        print(f"baseline written to {args.baseline}")
+
+    baseline = _read_results(args.baseline)
+    if baseline is None:
+        print(f"no baseline in {args.baseline}; record one with --update-baseline")
+    slower = compare(results, baseline or {}, args.tolerance)
+    if slower and args.fail_on_regression:
+        print(f"slower than the baseline: {', '.join(slower)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Benchmark for repeated theme switches.
+
+Applies two styles alternately to an application with a populated main
+window and reports the cost of each switch.  With idempotent theme
+application the per-switch cost stays flat: the proxy style and the
+icon tint filter are reused instead of stacking one more layer on
+every call, so the last switches cost about as much as the first.
+
+PySide6 6.12.0 on Python 3.11 and older aborts after some switches,
+see "Known binding issues" in ``docs/installation.rst``.
+
+Run from the repository root::
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_theme_switch.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from q_materialise import inject_style, list_styles  # noqa: E402
+from q_materialise.binding import QtWidgets  # noqa: E402
+
+
+def _build_window(widgets: int) -> QtWidgets.QWidget:
+    window = QtWidgets.QWidget()
+    layout = QtWidgets.QVBoxLayout(window)
+    for i in range(widgets):
+        kind = (QtWidgets.QPushButton, QtWidgets.QCheckBox, QtWidgets.QComboBox)[i % 3]
+        widget = kind()
+        if isinstance(widget, QtWidgets.QComboBox):
+            widget.addItems(["one", "two"])
+        else:
+            widget.setText(f"Widget {i}")
+        layout.addWidget(widget)
+    window.show()
+    return window
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--switches", type=int, default=100)
+    parser.add_argument("-w", "--widgets", type=int, default=60)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    window = _build_window(args.widgets)
+    styles = list_styles()[:2]
+
+    timings = []
+    for i in range(args.switches):
+        start = time.perf_counter()
+        inject_style(app, styles[i % 2])
+        app.processEvents()
+        timings.append((time.perf_counter() - start) * 1e3)
+
+    depth = 0
+    style = app._icon_proxy_style
+    while isinstance(style, QtWidgets.QProxyStyle):
+        depth += 1
+        style = style.baseStyle()
+
+    head = statistics.median(timings[:10])
+    tail = statistics.median(timings[-10:])
+    print(f"switches:          {args.switches}")
+    print(f"widgets:           {args.widgets}")
+    print(f"proxy depth:       {depth}")
+    print(f"first 10 (median): {head:8.2f} ms")
+    print(f"last 10 (median):  {tail:8.2f} ms")
+    print(f"ratio:             {tail / head:8.2f}")
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
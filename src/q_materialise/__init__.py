@@ -7,21 +7,39 @@ several submodules:
 
 - `q_materialise.style` contains the `Style` data class representing a complete
   colour scheme. Styles can be created programmatically or loaded from JSON files.
+  `FrozenStyle` is its immutable, hashable counterpart.
 - `q_materialise.utils` provides helper functions for working with colours,
   including RGB/hex conversion, lightening/darkening colours, and calculating
   contrast colours.
 - `q_materialise.colors` defines a small set of base colours used by the palette
   generator.
+- `q_materialise.compiler` turns styles into stylesheets and icon assets
+  without importing Qt.
 - `q_materialise.binding` exposes the Qt classes from whichever binding
   (PySide6, PyQt6, PySide2, or PyQt5) is available.
 
 The high-level functions imported here form the core API:
 
 - `inject_style` — apply a style to a running QApplication.
-- `list_styles` — list the names of the built-in styles.
-- `get_style` — load a built-in style from the package.
+- `list_styles` — list the names of the available styles.
+- `get_style` — load a built-in or user style by name.
+- `add_style_directory` / `remove_style_directory` — make a directory of
+  custom style files available by name.
 - `generate_style` — create a style from a small set of inputs.
+- `generate_styles` / `render_styles` — generate and render many styles at
+  once, optionally across a process pool.
 - `export_style` — write the stylesheet for a style to a QSS file.
+- `compile_qss` — render the stylesheet for a style without Qt.
+- `stylesheet_cache_info` / `clear_stylesheet_cache` — inspect and invalidate
+  the cache of rendered stylesheets used by `inject_style`.
+- `enable_disk_cache` / `disable_disk_cache` — opt in to persisting rendered
+  stylesheets across process restarts.
+- `palette_unsupported` — list the colour changes between two styles that
+  `inject_style(..., use_palette=True)` cannot apply through the palette.
+
+Everything except `Style` and `FrozenStyle` is imported on first access,
+so importing the package stays cheap and does not load a Qt binding until
+one is needed.
 
 Example:
     ```python
@@ -35,34 +53,107 @@ Example:
     ```
 """
 
-from importlib.metadata import version, PackageNotFoundError
-
-try:
-    # use the *distribution* name from pyproject.toml
-    __version__ = version("q-materialise")
-except PackageNotFoundError:
-    # fallback if running from source (not yet installed)
-    __version__ = "0.1.1"
-
-from .binding import QtCore, QtGui, QtWidgets  # re‑export common Qt classes
-from .style import Style
-from .core import (
-    inject_style,
-    export_style,
-    list_styles,
-    get_style,
-    generate_style,
-)
-from .demo import show_demo
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+from .style import FrozenStyle, Style
+
+if TYPE_CHECKING:  # pragma: no cover - imported lazily at run time
+    from .binding import QtCore, QtGui, QtWidgets
+    from .bulk import generate_styles, render_styles
+    from .compiler import (
+        add_style_directory,
+        compile_qss,
+        export_style,
+        generate_style,
+        get_style,
+        list_styles,
+        palette_unsupported,
+        remove_style_directory,
+    )
+    from .core import (
+        clear_stylesheet_cache,
+        disable_disk_cache,
+        enable_disk_cache,
+        inject_style,
+        stylesheet_cache_info,
+    )
+    from .demo import show_demo
+
+    __version__: str
+
+# Public names and the submodules defining them.  They are imported on
+# first access (PEP 562) so that ``import q_materialise`` does not load
+# a Qt binding, QtSvg or the demo gallery until they are needed.
+_LAZY_ATTRIBUTES = {
+    "QtCore": ".binding",  # re‑export common Qt classes
+    "QtGui": ".binding",
+    "QtWidgets": ".binding",
+    "inject_style": ".core",
+    "export_style": ".compiler",
+    "compile_qss": ".compiler",
+    "list_styles": ".compiler",
+    "get_style": ".compiler",
+    "generate_style": ".compiler",
+    "generate_styles": ".bulk",
+    "render_styles": ".bulk",
+    "add_style_directory": ".compiler",
+    "remove_style_directory": ".compiler",
+    "stylesheet_cache_info": ".core",
+    "clear_stylesheet_cache": ".core",
+    "enable_disk_cache": ".core",
+    "disable_disk_cache": ".core",
+    "palette_unsupported": ".compiler",
+    "show_demo": ".demo",
+}
+
+
+def _version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        # use the *distribution* name from pyproject.toml
+        return version("q-materialise")
+    except PackageNotFoundError:
+        # fallback if running from source (not yet installed)
+        return "0.1.1"
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        value: Any = _version()
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__) | {"__version__"})
+
+
 __all__ = [
     "QtCore",
     "QtGui",
     "QtWidgets",
     "Style",
+    "FrozenStyle",
     "inject_style",
     "export_style",
+    "compile_qss",
     "list_styles",
     "get_style",
     "generate_style",
+    "generate_styles",
+    "render_styles",
+    "add_style_directory",
+    "remove_style_directory",
+    "stylesheet_cache_info",
+    "clear_stylesheet_cache",
+    "enable_disk_cache",
+    "disable_disk_cache",
+    "palette_unsupported",
     "show_demo"
 ]
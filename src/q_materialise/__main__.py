@@ -0,0 +1,7 @@
+"""Runs the command line interface, see :mod:`q_materialise.cli`."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -0,0 +1,184 @@
+"""Vectorised colour helpers for many colours at once.
+
+The functions in :mod:`q_materialise.utils` work on one hex string at a
+time.  Generating or scoring thousands of candidate themes (brand
+colour sweeps, palette explorers) calls them in tight loops; the
+functions here do the same computations over whole arrays with NumPy.
+
+Colours are passed either as an ``(N, 3)`` array of integer RGB values
+in ``0–255`` or as a sequence of hex strings, and colour results are
+returned as ``(N, 3)`` ``uint8`` arrays; convert them back to strings
+with :func:`to_hex`.  Every result is identical to calling the scalar
+helper of the same name on each colour.
+
+NumPy is an optional dependency: install it with
+``pip install q-materialise[numpy]``.  Importing this module without it
+raises :class:`ImportError`.
+"""
+
+from __future__ import annotations
+
+from typing import List, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "q_materialise.batch requires NumPy; install it with "
+        "'pip install q-materialise[numpy]'"
+    ) from exc
+
+from .utils import _format, _parse
+
+Colours = Union["np.ndarray", Sequence[str], Sequence[Sequence[int]]]
+Factor = Union[float, "np.ndarray", Sequence[float]]
+
+_BLACK = np.zeros(3, dtype=np.uint8)
+_WHITE = np.full(3, 255, dtype=np.uint8)
+
+# Value of every ASCII character as a hex digit; 255 for non-digits.
+_HEX_VALUES = np.full(256, 255, dtype=np.uint8)
+for _i, _ch in enumerate("0123456789abcdef"):
+    _HEX_VALUES[ord(_ch)] = _HEX_VALUES[ord(_ch.upper())] = _i
+del _i, _ch
+_HEX_WEIGHTS = 16 ** np.arange(5, -1, -1, dtype=np.int64)
+
+
+def _parse_all(items: List[str]) -> np.ndarray:
+    """Parses hex strings into packed ``0xRRGGBB`` integers.
+
+    Lists made up only of ``#rrggbb`` strings are decoded in one go;
+    anything else goes through the scalar parser string by string.
+    """
+    lengths = np.fromiter(map(len, items), np.int64, len(items))
+    if (lengths == 7).all():
+        try:
+            raw = np.frombuffer("".join(items).encode("ascii"), dtype=np.uint8)
+        except UnicodeEncodeError:
+            raw = None
+        if raw is not None:
+            rows = raw.reshape(-1, 7)
+            digits = _HEX_VALUES[rows[:, 1:]]
+            if (rows[:, 0] == ord("#")).all() and (digits < 16).all():
+                return digits.astype(np.int64) @ _HEX_WEIGHTS
+    return np.fromiter((_parse(c) for c in items), np.int64, len(items))
+
+
+def to_rgb(colours: Colours) -> np.ndarray:
+    """Converts colours to an ``(N, 3)`` ``uint8`` array.
+
+    Args:
+        colours (Colours): Hex strings (see
+            :func:`~q_materialise.utils.hex_to_rgb` for the accepted
+            forms) or integer RGB triples in ``0–255``.
+
+    Returns:
+        np.ndarray: The RGB values, one row per colour.
+
+    Raises:
+        ValueError: If a hex string is invalid, or the array does not
+            have shape ``(N, 3)`` or holds values outside ``0–255``.
+    """
+    if isinstance(colours, np.ndarray):
+        array = colours
+    else:
+        items = list(colours)
+        if items and isinstance(items[0], str):
+            packed = _parse_all(items)
+            return np.stack(
+                [packed >> 16, (packed >> 8) & 0xFF, packed & 0xFF], axis=1
+            ).astype(np.uint8)
+        array = np.asarray(items) if items else np.empty((0, 3), dtype=np.uint8)
+    if array.ndim != 2 or array.shape[1] != 3:
+        raise ValueError(f"Expected an (N, 3) array of colours, got {array.shape}")
+    if array.dtype == np.uint8:
+        return array
+    if not np.issubdtype(array.dtype, np.integer):
+        raise ValueError("RGB values must be integers")
+    if array.size and (array.min() < 0 or array.max() > 255):
+        raise ValueError("RGB values must be in the range 0-255")
+    return array.astype(np.uint8)
+
+
+def to_hex(rgb: Union[np.ndarray, Sequence[Sequence[float]]]) -> List[str]:
+    """Converts an ``(N, 3)`` array of RGB values to hex strings.
+
+    Values are truncated to integers and clamped to ``0–255`` like
+    :func:`~q_materialise.utils.rgb_to_hex` does.
+
+    Returns:
+        List[str]: One ``#rrggbb`` string per row.
+    """
+    array = np.asarray(rgb)
+    if array.ndim != 2 or array.shape[-1] != 3:
+        raise ValueError(f"Expected an (N, 3) array of colours, got {array.shape}")
+    array = np.clip(np.trunc(array.astype(np.float64)), 0, 255).astype(np.int64)
+    packed = (array[:, 0] << 16) | (array[:, 1] << 8) | array[:, 2]
+    return [_format(p) for p in packed.tolist()]
+
+
+def _factor(factor: Factor) -> np.ndarray:
+    """Returns ``factor`` shaped to broadcast against ``(N, 3)`` arrays."""
+    f = np.asarray(factor, dtype=np.float64)
+    return f[:, None] if f.ndim == 1 else f
+
+
+def _channels(values: np.ndarray) -> np.ndarray:
+    # Truncates towards zero and clamps like the scalar helpers.
+    return np.clip(np.trunc(values), 0, 255).astype(np.uint8)
+
+
+def lighten(colours: Colours, factor: Factor) -> np.ndarray:
+    """Interpolates colours towards white.
+
+    Args:
+        colours (Colours): The input colours.
+        factor (Factor): Interpolation factor, either one for all
+            colours or one per colour.
+
+    Returns:
+        np.ndarray: The lightened colours as an ``(N, 3)`` array.
+    """
+    rgb = to_rgb(colours).astype(np.float64)
+    return _channels(rgb + (255 - rgb) * _factor(factor))
+
+
+def darken(colours: Colours, factor: Factor) -> np.ndarray:
+    """Interpolates colours towards black.
+
+    Args:
+        colours (Colours): The input colours.
+        factor (Factor): Interpolation factor, either one for all
+            colours or one per colour.
+
+    Returns:
+        np.ndarray: The darkened colours as an ``(N, 3)`` array.
+    """
+    rgb = to_rgb(colours).astype(np.float64)
+    return _channels(rgb * (1 - _factor(factor)))
+
+
+def perceived_brightness(colours: Colours) -> np.ndarray:
+    """Returns the W3C perceived brightness of each colour.
+
+    Returns:
+        np.ndarray: A ``float64`` array of shape ``(N,)`` with values in
+        ``0–255``.
+    """
+    rgb = to_rgb(colours).astype(np.float64)
+    return 0.299 * rgb[:, 0] + 0.587 * rgb[:, 1] + 0.114 * rgb[:, 2]
+
+
+def is_light_color(colours: Colours) -> np.ndarray:
+    """Returns a boolean array telling which colours are light."""
+    return perceived_brightness(colours) >= 186
+
+
+def contrast_color(colours: Colours) -> np.ndarray:
+    """Picks black or white text for each colour.
+
+    Returns:
+        np.ndarray: An ``(N, 3)`` array holding black for light colours
+        and white for dark ones.
+    """
+    return np.where(is_light_color(colours)[:, None], _BLACK, _WHITE)
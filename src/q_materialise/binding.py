@@ -3,58 +3,62 @@
 This module attempts to import one of the supported Qt Python bindings
 in a well‑defined order: PySide6, PyQt6, PySide2, then PyQt5.  If
 none of these are installed an informative :class:`ImportError` is
-raised.
+raised.  Setting the ``QT_API`` environment variable to one of
+``pyside6``, ``pyqt6``, ``pyside2`` or ``pyqt5`` selects that binding
+and no other; other values are ignored so the variable can still be
+shared with libraries accepting more names.
 
 The imported modules are re‑exported as ``QtCore``, ``QtGui`` and
 ``QtWidgets`` so that client code and the rest of this package can
-remain agnostic of the underlying binding.  Where there are API
-differences between bindings (such as the change from ``exec_`` to
-``exec`` in Qt6) the library attempts to cater for them in its own
-code.
+remain agnostic of the underlying binding.  Further modules such as
+``QtSvg`` are only imported when needed, see :func:`import_qt_module`.
+Where there are API differences between bindings (such as the change
+from ``exec_`` to ``exec`` in Qt6) the library attempts to cater for
+them in its own code.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import os
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Optional
+
+# Supported bindings in order of preference: name -> package.
+_PACKAGES = {
+    "pyside6": "PySide6",
+    "pyqt6": "PyQt6",
+    "pyside2": "PySide2",
+    "pyqt5": "PyQt5",
+}
 
 # Determine which binding to use.
 _binding = None
 _error_messages = []
 
-try:
-    from PySide6 import QtCore, QtGui, QtWidgets  # type: ignore[attr-defined]
-
-    _binding = "pyside6"
-except ImportError as exc:
-    _error_messages.append(f"PySide6: {exc}")
-
-if _binding is None:
-    try:
-        from PyQt6 import QtCore, QtGui, QtWidgets  # type: ignore[attr-defined]
-
-        _binding = "pyqt6"
-    except ImportError as exc:
-        _error_messages.append(f"PyQt6: {exc}")
-
-if _binding is None:
-    try:
-        from PySide2 import QtCore, QtGui, QtWidgets  # type: ignore[attr-defined]
-
-        _binding = "pyside2"
-    except ImportError as exc:
-        _error_messages.append(f"PySide2: {exc}")
+_requested = os.environ.get("QT_API", "").strip().lower()
+_candidates = [_requested] if _requested in _PACKAGES else list(_PACKAGES)
 
-if _binding is None:
+for _name in _candidates:
     try:
-        from PyQt5 import QtCore, QtGui, QtWidgets  # type: ignore[attr-defined]
-
-        _binding = "pyqt5"
+        QtCore = import_module(f"{_PACKAGES[_name]}.QtCore")
+        QtGui = import_module(f"{_PACKAGES[_name]}.QtGui")
+        QtWidgets = import_module(f"{_PACKAGES[_name]}.QtWidgets")
     except ImportError as exc:
-        _error_messages.append(f"PyQt5: {exc}")
+        _error_messages.append(f"{_PACKAGES[_name]}: {exc}")
+    else:
+        _binding = _name
+        break
 
 if _binding is None:
     # If no binding could be imported, raise a single ImportError with
     # messages for each attempted binding to aid debugging.
+    if len(_candidates) == 1:
+        raise ImportError(
+            f"QT_API={_requested} selects {_PACKAGES[_requested]}, which "
+            "could not be imported. Install it or unset QT_API. Error "
+            "encountered:\n" + _error_messages[0]
+        )
     raise ImportError(
         "No supported Qt binding could be imported. Please install "
         "PySide6, PyQt6, PySide2 or PyQt5. Errors encountered:\n"
@@ -64,11 +68,67 @@ if _binding is None:
 # Public API: re‑export the imported modules as if they were part of
 # this package.  Downstream code can `from q_materialise.binding import
 # QtWidgets` and remain agnostic as to which binding is in use.
-__all__ = ["QtCore", "QtGui", "QtWidgets", "binding"]
+__all__ = [
+    "QtCore",
+    "QtGui",
+    "QtWidgets",
+    "binding",
+    "import_qt_module",
+    "is_alive",
+]
 
 binding: str = _binding
 
 
+def import_qt_module(name: str) -> Optional[ModuleType]:
+    """Imports another Qt module from the binding in use.
+
+    Modules other than ``QtCore``, ``QtGui`` and ``QtWidgets`` are not
+    needed by every application, so they are only imported on demand.
+
+    Args:
+        name: The module name, for example ``"QtSvg"``.
+
+    Returns:
+        Optional[ModuleType]: The module, or ``None`` if the binding
+        does not provide it (e.g. an optional component that is not
+        installed).
+    """
+    try:
+        return import_module(f"{_PACKAGES[binding]}.{name}")
+    except ImportError:
+        return None
+
+
+def is_alive(obj: Any) -> bool:
+    """Return whether the C++ object behind a Qt wrapper still exists.
+
+    Python wrappers can outlive the Qt objects they refer to, for
+    example when a parent widget deletes its children.  Calling methods
+    on such a wrapper raises :class:`RuntimeError`; this helper lets
+    code check first without depending on a particular binding.
+
+    Args:
+        obj: A wrapper object created by the active binding.
+
+    Returns:
+        bool: ``False`` if the underlying C++ object has been deleted.
+    """
+    if binding == "pyside6":
+        import shiboken6
+
+        return bool(shiboken6.isValid(obj))
+    if binding == "pyside2":
+        import shiboken2  # type: ignore[import-not-found]
+
+        return bool(shiboken2.isValid(obj))
+    if binding == "pyqt6":
+        from PyQt6 import sip  # type: ignore[attr-defined]
+    else:
+        from PyQt5 import sip  # type: ignore[attr-defined]
+    return not sip.isdeleted(obj)
+
+
 def exec_(app: Any) -> int:
     """Execute a Qt application instance and return its exit code.
 
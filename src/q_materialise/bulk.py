@@ -0,0 +1,206 @@
+"""Generating and rendering many styles at once.
+
+:func:`~q_materialise.generate_style` and
+:func:`~q_materialise.compile_qss` handle one style per call.  Building
+and rendering large sets of generated themes (brand colour sweeps,
+build artefacts for every variant) is CPU-bound Python, so the batch
+entry points here take an iterable of seeds and can fan the work out
+over a process pool.
+
+Results are streamed as generators in the order of the seeds.  Seeds
+are consumed in chunks and only a few chunks per worker are in flight
+at a time, so memory use stays bounded however many seeds are passed.
+
+This module has no dependency on Qt.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .compiler import compile_qss, generate_style
+from .style import Style
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Chunks submitted per worker before waiting for the oldest one.
+_CHUNKS_PER_WORKER = 2
+
+
+class StyleSeed(NamedTuple):
+    """The inputs for one generated style.
+
+    Attributes:
+        name (str): Name of the style.
+        primary (str): The primary colour (hex string).
+        secondary (str): The secondary colour (hex string).
+        is_dark (bool): Whether the style should be dark.
+        extra (Optional[Dict[str, Any]]): Overrides used when rendering
+            the style, see :func:`~q_materialise.compile_qss`.  Only
+            :func:`render_styles` uses them; they are not part of the
+            generated :class:`~q_materialise.style.Style`.
+    """
+
+    name: str
+    primary: str
+    secondary: str
+    is_dark: bool = False
+    extra: Optional[Dict[str, Any]] = None
+
+
+Seed = Union[StyleSeed, Sequence[Any], Mapping[str, Any]]
+
+
+def _seed(value: Seed) -> StyleSeed:
+    """Converts a tuple or mapping into a :class:`StyleSeed`.
+
+    Raises:
+        TypeError: If ``value`` is not a sequence or mapping of seed fields.
+    """
+    if isinstance(value, StyleSeed):
+        return value
+    if isinstance(value, Mapping):
+        return StyleSeed(**value)
+    if isinstance(value, (tuple, list)):
+        return StyleSeed(*value)
+    raise TypeError("seeds must be StyleSeed instances, tuples or mappings")
+
+
+def _generate_one(seed: StyleSeed) -> Style:
+    return generate_style(seed.name, seed.primary, seed.secondary, seed.is_dark)
+
+
+def _render_one(seed: StyleSeed, use_palette: bool) -> Tuple[str, str]:
+    return seed.name, compile_qss(_generate_one(seed), seed.extra, use_palette)
+
+
+def _run_chunk(func: Callable[[_T], _R], chunk: List[_T]) -> List[_R]:
+    return [func(item) for item in chunk]
+
+
+def _fan_out(
+    func: Callable[[_T], _R],
+    items: Iterable[_T],
+    workers: Optional[int],
+    chunk_size: int,
+) -> Iterator[_R]:
+    """Maps ``func`` over ``items``, in a process pool unless ``workers == 1``.
+
+    Results are yielded in the order of ``items``.  At most
+    ``_CHUNKS_PER_WORKER`` chunks per worker are submitted ahead of the
+    one being yielded; closing the generator cancels the rest.
+
+    Raises:
+        ValueError: If ``chunk_size`` is less than 1, when called rather
+            than when the results are first requested.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    return _fanned_out(func, iter(items), workers, chunk_size)
+
+
+def _fanned_out(
+    func: Callable[[_T], _R],
+    items: Iterator[_T],
+    workers: Optional[int],
+    chunk_size: int,
+) -> Iterator[_R]:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        yield from map(func, items)
+        return
+    chunks = iter(lambda: list(islice(items, chunk_size)), [])
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            for chunk in chunks:
+                pending.append(pool.submit(_run_chunk, func, chunk))
+                if len(pending) >= workers * _CHUNKS_PER_WORKER:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def generate_styles(
+    seeds: Iterable[Seed], workers: Optional[int] = 1, chunk_size: int = 64
+) -> Iterator[Style]:
+    """Generates a style for every seed.
+
+    Args:
+        seeds (Iterable[Seed]): :class:`StyleSeed` instances, or tuples
+            or mappings of their fields.  The ``extra`` field is ignored:
+            it holds rendering overrides, which a generated style does
+            not carry.  Use :func:`render_styles` to apply them.
+        workers (Optional[int], optional): Number of worker processes.
+            ``1`` generates the styles in this process, ``None`` uses
+            one worker per CPU. Defaults to 1.
+        chunk_size (int, optional): Number of seeds sent to a worker at
+            a time. Defaults to 64.
+
+    Yields:
+        Style: The generated styles, in the order of ``seeds``.
+
+    Raises:
+        ValueError: If ``chunk_size`` is less than 1.
+    """
+    return _fan_out(_generate_one, map(_seed, seeds), workers, chunk_size)
+
+
+def render_styles(
+    seeds: Iterable[Seed],
+    use_palette: bool = False,
+    workers: Optional[int] = 1,
+    chunk_size: int = 64,
+) -> Iterator[Tuple[str, str]]:
+    """Generates a style for every seed and renders its stylesheet.
+
+    Each stylesheet is rendered with the seed's ``extra`` overrides, as
+    :func:`~q_materialise.compile_qss` would.  Worker processes generate
+    the arrow icons the stylesheets refer to in the shared per-user data
+    directory.
+
+    Args:
+        seeds (Iterable[Seed]): :class:`StyleSeed` instances, or tuples
+            or mappings of their fields.
+        use_palette (bool, optional): Refer to palette roles where
+            possible. Defaults to False.
+        workers (Optional[int], optional): Number of worker processes.
+            ``1`` renders in this process, ``None`` uses one worker per
+            CPU. Defaults to 1.
+        chunk_size (int, optional): Number of seeds sent to a worker at
+            a time. Defaults to 64.
+
+    Yields:
+        Tuple[str, str]: The style name and its stylesheet, in the order
+        of ``seeds``.
+
+    Raises:
+        ValueError: If ``chunk_size`` is less than 1.
+    """
+    render = partial(_render_one, use_palette=use_palette)
+    return _fan_out(render, map(_seed, seeds), workers, chunk_size)
@@ -0,0 +1,305 @@
+"""Caching of rendered stylesheets.
+
+Rendering the QSS for a style is deterministic: the same
+:class:`~q_materialise.style.Style` and ``extra`` mapping always produce
+the same stylesheet.  Applications that switch themes frequently (per
+tab theming, dark/light toggles, previews) can therefore reuse earlier
+renders.  This module provides a stable fingerprint for a style and its
+overrides, a small bounded LRU cache keyed by that fingerprint and an
+opt-in persistent cache that survives process restarts.
+
+This module has no dependency on Qt.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Union
+
+from .style import FrozenStyle, Style
+
+
+class CacheInfo(NamedTuple):
+    """Statistics for an :class:`LRUCache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def _digest(data: Any) -> str:
+    text = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def style_fingerprint(style: Union[Style, FrozenStyle]) -> str:
+    """Returns a stable hash of a style's attributes.
+
+    The hash covers everything returned by :meth:`Style.to_dict`,
+    including derived colours and extras, and is stable across
+    processes.  It is computed only once for a
+    :class:`~q_materialise.style.FrozenStyle`.
+
+    Args:
+        style (Union[Style, FrozenStyle]): The style to fingerprint.
+
+    Returns:
+        str: A hex digest.
+    """
+    if isinstance(style, FrozenStyle):
+        digest = style._fingerprint
+        if digest is None:
+            digest = _digest(style.to_dict())
+            object.__setattr__(style, "_fingerprint", digest)
+        return digest
+    return _digest(style.to_dict())
+
+
+def extra_fingerprint(extra: Optional[Mapping[str, Any]]) -> str:
+    """Returns a stable hash of an ``extra`` overrides mapping.
+
+    ``None`` and an empty mapping are equivalent.  Key order does not
+    affect the result.
+
+    Args:
+        extra (Optional[Mapping[str, Any]]): The overrides passed to
+            :func:`~q_materialise.inject_style` or
+            :func:`~q_materialise.export_style`.
+
+    Returns:
+        str: A hex digest.
+    """
+    return _digest(dict(extra or {}))
+
+
+def fingerprint(
+    style: Union[Style, FrozenStyle], extra: Optional[Mapping[str, Any]] = None
+) -> str:
+    """Returns the cache key for rendering ``style`` with ``extra``.
+
+    Args:
+        style (Union[Style, FrozenStyle]): The style to render.
+        extra (Optional[Mapping[str, Any]], optional): Optional overrides.
+
+    Returns:
+        str: A hex digest combining both fingerprints.
+    """
+    return f"{style_fingerprint(style)}-{extra_fingerprint(extra)}"
+
+
+class LRUCache:
+    """A bounded least-recently-used mapping with hit/miss counters.
+
+    ``None`` cannot be stored as a value because :meth:`get` uses it to
+    signal a miss.
+
+    Args:
+        maxsize (int, optional): Maximum number of entries kept.
+            Defaults to 32.
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self._maxsize = max(0, int(maxsize))
+        self._entries: "OrderedDict[Any, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Maximum number of entries; shrinking evicts the oldest ones."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        self._maxsize = max(0, int(value))
+        self._evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def get(self, key: Any) -> Any:
+        """Returns the value cached under ``key`` or ``None``.
+
+        Updates the hit/miss counters and marks the entry as recently
+        used.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Any, value: Any) -> None:
+        """Stores ``value`` under ``key``, evicting old entries if needed."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def invalidate(self, key: Any) -> bool:
+        """Removes a single entry.
+
+        Returns:
+            bool: ``True`` if an entry was removed.
+        """
+        return self._entries.pop(key, None) is not None
+
+    def clear(self, keep_stats: bool = False) -> None:
+        """Removes all entries.
+
+        Args:
+            keep_stats (bool, optional): Keep the hit/miss counters
+                instead of resetting them. Defaults to False.
+        """
+        self._entries.clear()
+        if not keep_stats:
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Returns the current cache statistics."""
+        return CacheInfo(self.hits, self.misses, self._maxsize, len(self._entries))
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+class DiskEntry(NamedTuple):
+    """A stylesheet loaded from a :class:`DiskCache`.
+
+    ``icon_dirs`` maps each icon search-path alias used by the
+    stylesheet to the directory holding its prepared assets.
+    """
+
+    qss: str
+    icon_dirs: Dict[str, str]
+
+
+class DiskCache:
+    """A persistent cache of rendered stylesheets.
+
+    Each entry is stored as a ``.qss`` file whose first line is a QSS
+    comment holding a small JSON header with the format number, library
+    version, cache key, body length and the directories of the prepared
+    icon assets the stylesheet refers to.  Loading an entry only parses
+    that header and checks the body length, so validating a warm cache
+    is cheap.  Entries written by a different library version are
+    treated as misses and overwritten.
+
+    Files are written to a temporary file first and then renamed into
+    place, so concurrent processes never observe partial entries.
+
+    Args:
+        directory (Union[str, Path]): Directory holding the entries.
+            Created on first write.
+        version (str): Library version recorded in every entry.
+    """
+
+    FORMAT = 1
+
+    def __init__(self, directory: Union[str, Path], version: str) -> None:
+        self.directory = Path(directory)
+        self.version = version
+
+    def path_for(self, key: str) -> Path:
+        """Returns the file an entry for ``key`` is stored in."""
+        return self.directory / f"{key}.qss"
+
+    def load(self, key: str) -> Optional[DiskEntry]:
+        """Returns the entry stored under ``key`` or ``None``.
+
+        Missing, truncated, corrupt or outdated entries are reported as
+        ``None``.
+        """
+        try:
+            with self.path_for(key).open(encoding="utf-8", newline="") as f:
+                line = f.readline()
+                if not (line.startswith("/* ") and line.endswith(" */\n")):
+                    return None
+                header = json.loads(line[3:-4])
+                if (
+                    header.get("format") != self.FORMAT
+                    or header.get("version") != self.version
+                    or header.get("key") != key
+                ):
+                    return None
+                qss = f.read()
+        except (OSError, ValueError):
+            return None
+        icons = header.get("icons")
+        if len(qss) != header.get("length") or not isinstance(icons, dict):
+            return None
+        return DiskEntry(qss, {str(k): str(v) for k, v in icons.items()})
+
+    def store(
+        self,
+        key: str,
+        qss: str,
+        icon_dirs: Optional[Mapping[str, Union[str, Path]]] = None,
+    ) -> None:
+        """Writes an entry atomically.
+
+        Errors (for example a read-only cache directory) are ignored:
+        the disk cache is an optimisation and must never break styling.
+        """
+        header = json.dumps(
+            {
+                "format": self.FORMAT,
+                "version": self.version,
+                "key": key,
+                "length": len(qss),
+                "icons": {k: str(v) for k, v in (icon_dirs or {}).items()},
+            },
+            sort_keys=True,
+        )
+        try:
+            _atomic_write(
+                self.path_for(key), f"/* {header} */\n{qss}".encode("utf-8")
+            )
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Deletes all entries in the cache directory."""
+        if not self.directory.is_dir():
+            return
+        for path in self.directory.glob("*.qss"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _atomic_write(dest: Path, data: bytes, mode: int = 0o600) -> None:
+    """Writes ``data`` to ``dest`` via a temporary file and a rename.
+
+    The temporary file lives in the destination directory so the final
+    :func:`os.replace` is atomic; readers in other processes see either
+    the previous file or the complete new one.  It gets its permissions
+    (``mode``, by default readable by the owner only) before the rename,
+    so ``dest`` never appears with other ones.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{dest.name}.", dir=str(dest.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, mode)
+        os.replace(tmp, dest)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,290 @@
+"""Command-line interface for compiling stylesheets.
+
+Installed as the ``q-materialise`` console script and runnable as
+``python -m q_materialise``.  The subcommands only use the Qt-free
+parts of the package (:mod:`q_materialise.compiler` and friends), so
+they work on build machines without a Qt binding and do not pay for
+importing one::
+
+    q-materialise list
+    q-materialise export sapphire_day -o build/sapphire_day.qss
+    q-materialise export my_theme.json --extra '{"density_scale": "-1"}'
+    cat my_theme.json | q-materialise export - > my_theme.qss
+    q-materialise export-all build/qss --variants @variants.json
+    q-materialise bench
+
+Styles are given by name, as the path of a JSON style file or as ``-``
+to read the JSON from standard input.  ``--profile`` reports how long
+each phase of a command took on standard error.
+
+This module has no dependency on Qt.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import timeit
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# The package modules are imported inside the commands so that the
+# ``import`` phase of ``--profile`` covers them.
+
+
+class _Profile:
+    """Collects the wall time of named phases."""
+
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self.phases: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def report(self) -> None:
+        if not self.enabled:
+            return
+        total = sum(seconds for _, seconds in self.phases)
+        for name, seconds in self.phases + [("total", total)]:
+            print(f"{name:<10}{seconds * 1000:>10.2f} ms", file=sys.stderr)
+
+
+class _UsageError(Exception):
+    """An invalid argument the parser cannot detect by itself."""
+
+
+def _load_style(spec: str) -> Any:
+    """Returns a style given by name, JSON file or ``-`` for stdin."""
+    from .compiler import get_style
+    from .style import Style
+
+    try:
+        if spec == "-":
+            data = json.load(sys.stdin)
+        elif Path(spec).suffix == ".json" or Path(spec).is_file():
+            with open(spec, encoding="utf-8") as f:
+                data = json.load(f)
+        else:
+            return get_style(spec)
+        if not isinstance(data, dict):
+            raise ValueError("a style must be a JSON object")
+        return Style.from_dict(data)
+    except (OSError, TypeError, ValueError) as exc:
+        raise _UsageError(f"cannot load style {spec!r}: {exc}") from exc
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def _load_json_object(value: Optional[str], what: str) -> Optional[Dict[str, Any]]:
+    """Parses a JSON object given inline or as ``@path``."""
+    if value is None:
+        return None
+    try:
+        if value.startswith("@"):
+            with open(value[1:], encoding="utf-8") as f:
+                data = json.load(f)
+        else:
+            data = json.loads(value)
+    except (OSError, ValueError) as exc:
+        raise _UsageError(f"cannot read {what}: {exc}") from exc
+    if not isinstance(data, dict):
+        raise _UsageError(f"{what} must be a JSON object")
+    return data
+
+
+def _cmd_list(args: argparse.Namespace, profile: _Profile) -> int:
+    with profile.phase("import"):
+        from .compiler import list_styles
+    with profile.phase("load"):
+        names = list_styles()
+    print(json.dumps(names) if args.json else "\n".join(names))
+    return 0
+
+
+def _cmd_export(args: argparse.Namespace, profile: _Profile) -> int:
+    with profile.phase("import"):
+        from .cache import _atomic_write
+        from .compiler import compile_qss
+    with profile.phase("load"):
+        style = _load_style(args.style)
+        extra = _load_json_object(args.extra, "--extra")
+    with profile.phase("render"):
+        qss = compile_qss(style, extra, use_palette=args.palette)
+    with profile.phase("write"):
+        if args.output in (None, "-"):
+            sys.stdout.write(qss)
+        else:
+            dest = Path(args.output)
+            _atomic_write(dest, qss.encode("utf-8"), 0o644)
+    return 0
+
+
+def _cmd_export_all(args: argparse.Namespace, profile: _Profile) -> int:
+    with profile.phase("import"):
+        from .export import export_all, format_summary
+    with profile.phase("load"):
+        variants: Dict[str, Any] = {"": None}
+        variants.update(_load_json_object(args.variants, "--variants") or {})
+    with profile.phase("export"):
+        summary = export_all(
+            args.output_dir,
+            styles=args.styles,
+            variants=variants,
+            use_palette=args.palette,
+            workers=args.workers,
+            force=args.force,
+        )
+    print(format_summary(summary))
+    return 0
+
+
+def _cmd_bench(args: argparse.Namespace, profile: _Profile) -> int:
+    with profile.phase("import"):
+        from .compiler import compile_qss, generate_style, get_style, list_styles
+    with profile.phase("load"):
+        names = args.styles or list_styles()
+        if not names:
+            raise _UsageError("no styles to benchmark")
+        styles = [get_style(name) for name in names]
+    cases = {
+        "get_style": lambda: [get_style(name) for name in names],
+        "generate_style": lambda: [
+            generate_style(s.name, s.primary, s.secondary, s.is_dark) for s in styles
+        ],
+        "compile_qss": lambda: [compile_qss(s) for s in styles],
+    }
+    print(f"{'operation':<18}{'per style':>12}  ({len(names)} styles)")
+    with profile.phase("bench"):
+        for label, func in cases.items():
+            seconds = min(timeit.repeat(func, number=args.number, repeat=3))
+            per_style = seconds / args.number / len(names) * 1e6
+            print(f"{label:<18}{per_style:>10.1f}us")
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    profile_help = "report the time spent in each phase on stderr"
+    parser = argparse.ArgumentParser(
+        prog="q-materialise", description="Compile Material Design Qt stylesheets."
+    )
+    parser.add_argument("--profile", action="store_true", help=profile_help)
+    # Also accept --profile after the command without resetting it there.
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--profile", action="store_true", default=argparse.SUPPRESS, help=profile_help
+    )
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    commands.required = True
+
+    sub = commands.add_parser(
+        "list", parents=[common], help="list the available styles"
+    )
+    sub.add_argument("--json", action="store_true", help="print a JSON array")
+    sub.set_defaults(func=_cmd_list)
+
+    sub = commands.add_parser(
+        "export", parents=[common], help="write the stylesheet for one style"
+    )
+    sub.add_argument("style", help="style name, JSON style file, or - for stdin")
+    sub.add_argument("-o", "--output", help="file to write; standard output by default")
+    sub.add_argument("--extra", metavar="JSON", help="extra overrides as JSON or @file")
+    sub.add_argument(
+        "--palette", action="store_true", help="refer to palette roles where possible"
+    )
+    sub.set_defaults(func=_cmd_export)
+
+    sub = commands.add_parser(
+        "export-all",
+        parents=[common],
+        help="export many styles and variants incrementally",
+    )
+    sub.add_argument("output_dir", help="directory to write the stylesheets to")
+    sub.add_argument(
+        "--style",
+        action="append",
+        dest="styles",
+        metavar="NAME",
+        help="style to export (repeatable); defaults to all styles",
+    )
+    sub.add_argument(
+        "--variants",
+        metavar="JSON",
+        help="variant names mapped to extra overrides, as JSON or @file",
+    )
+    sub.add_argument(
+        "--palette", action="store_true", help="refer to palette roles where possible"
+    )
+    sub.add_argument(
+        "--workers", type=int, help="worker processes (default: one per CPU)"
+    )
+    sub.add_argument(
+        "--force", action="store_true", help="rewrite files that are up to date"
+    )
+    sub.set_defaults(func=_cmd_export_all)
+
+    sub = commands.add_parser(
+        "bench", parents=[common], help="time loading and rendering styles"
+    )
+    sub.add_argument(
+        "--style",
+        action="append",
+        dest="styles",
+        metavar="NAME",
+        help="style to benchmark (repeatable); defaults to all styles",
+    )
+    sub.add_argument(
+        "-n",
+        "--number",
+        type=_positive_int,
+        default=20,
+        help="iterations per measurement (default: 20)",
+    )
+    sub.set_defaults(func=_cmd_bench)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the command line interface.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): The arguments, without
+            the program name. Defaults to ``sys.argv[1:]``.
+
+    Returns:
+        int: The exit status.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    profile = _Profile(args.profile)
+    try:
+        status = args.func(args, profile)
+        sys.stdout.flush()
+    except _UsageError as exc:
+        parser.exit(2, f"{parser.prog}: error: {exc}\n")
+    except FileNotFoundError as exc:
+        parser.exit(1, f"{parser.prog}: error: {exc}\n")
+    except BrokenPipeError:
+        # The reader went away, e.g. ``q-materialise list | head``.  Point
+        # stdout at devnull so that flushing it at exit fails quietly too.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    profile.report()
+    return status
@@ -0,0 +1,391 @@
+"""Differential application of stylesheets.
+
+``QApplication.setStyleSheet`` re-parses the whole stylesheet and
+re-polishes every widget in the application, even when a theme switch
+only changes a single colour.  This module applies such switches
+incrementally.
+
+The application keeps the stylesheet it was last fully styled with
+(the *base*).  When a new set of template variables differs from the
+base only in variables used by rules aimed at specific widget types,
+the application stylesheet is left alone.  Instead each widget matched
+by a changed rule gets a small *overlay* stylesheet of its own.  Qt
+lets a widget's own stylesheet win over the application's for every
+property both set, so the overlay holds every template rule matching
+the widget that sets a property in the same family (``border``,
+``background``, ...) as a changed rule, rendered with the new
+variables.  The overlaid widget then looks exactly as if the new
+stylesheet had been applied globally, while all other widgets are not
+touched at all.  Widgets created later receive their overlay when they
+are polished.
+
+A full ``setStyleSheet`` is used instead when a changed rule applies to
+every widget (``*`` or ``QWidget`` rules), when an affected widget has
+a stylesheet of its own, or when the application stylesheet was
+changed behind our back.
+
+Templates may also refer to colours through palette roles
+(``palette(highlight)``).  When only variables reaching the stylesheet
+that way change, the stylesheet text stays the same and nothing needs
+re-parsing.  Qt resolves palette references when a widget is polished,
+though, so the widgets matched by rules using the changed roles are
+re-polished to pick up the new palette.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from .binding import QtCore, QtWidgets, is_alive  # type: ignore
+from .template import CompiledTemplate, selector_specificity, selector_subject
+
+# First line of every overlay so they can be told apart from stylesheets
+# set by the application.
+_OVERLAY_MARKER = "/* q_materialise overlay */\n"
+
+# Subject types matching every widget; changing their rules needs a
+# full re-style.
+_GLOBAL_TYPES = frozenset({"", "QObject", "QWidget"})
+# Selector types Qt matches by something other than class inheritance.
+_ALIASED_TYPES = frozenset({"QToolTip"})
+
+_MISSING = object()
+
+
+def changed_names(
+    old: Mapping[str, Any], new: Mapping[str, Any]
+) -> FrozenSet[str]:
+    """Returns the variable names whose values differ between two maps."""
+    return frozenset(
+        name
+        for name in set(old) | set(new)
+        if old.get(name, _MISSING) != new.get(name, _MISSING)
+    )
+
+
+def changed_rules(
+    template: CompiledTemplate, names: FrozenSet[str]
+) -> FrozenSet[int]:
+    """Returns the indices of the template rules using any of ``names``."""
+    return frozenset(
+        index for index, rule in enumerate(template.rules) if rule.names & names
+    )
+
+
+def affected_types(
+    template: CompiledTemplate, rules: FrozenSet[int]
+) -> FrozenSet[str]:
+    """Returns the subject types of the given rules.
+
+    An empty type name stands for a universal subject.
+    """
+    return frozenset(
+        selector_subject(selector)[1]
+        for index in rules
+        for selector in template.rules[index].selectors
+    )
+
+
+def _family(prop: str) -> str:
+    # Shorthands and their long forms (``border``/``border-color``)
+    # override each other, so they are compared by their first word.
+    return prop if prop.startswith("qproperty-") else prop.split("-", 1)[0]
+
+
+def _qss_type(widget: QtCore.QObject) -> str:
+    return widget.metaObject().className().replace("::", "--")
+
+
+def _embedded(widget: QtWidgets.QWidget) -> bool:
+    """Whether Qt styles ``widget`` through its parent's rules.
+
+    Mirrors the widgets ``QStyleSheetStyle`` leaves alone unless they
+    have a stylesheet of their own: giving them an overlay would style
+    them where the application stylesheet does not.
+    """
+    parent = widget.parentWidget()
+    if parent is None:
+        return False
+    if isinstance(widget, QtWidgets.QLineEdit):
+        return isinstance(parent, (QtWidgets.QComboBox, QtWidgets.QAbstractSpinBox))
+    if isinstance(parent, QtWidgets.QAbstractScrollArea) and parent.viewport() is widget:
+        return True
+    if isinstance(widget, QtWidgets.QFrame):
+        return isinstance(parent, QtWidgets.QComboBox)
+    return type(widget) is QtWidgets.QWidget and isinstance(parent, QtWidgets.QTabBar)
+
+
+class _SheetState:
+    """What an application was styled with.
+
+    Args:
+        template (CompiledTemplate): The stylesheet template.
+        qss (str): The stylesheet applied to the application.
+        signature (Mapping[str, Any]): Values the stylesheet was
+            rendered from, compared to tell which rules changed.
+    """
+
+    def __init__(
+        self, template: CompiledTemplate, qss: str, signature: Mapping[str, Any]
+    ) -> None:
+        self.template = template
+        self.base_qss = qss
+        self.base_signature = dict(signature)
+        # Values of the most recent switch, overlays included.
+        self.signature = self.base_signature
+        self.variables: Mapping[str, Any] = {}
+        self.changed: FrozenSet[int] = frozenset()
+        self.filter: Optional[_OverlayFilter] = None
+        # Per widget type: (selector, rule index) for every selector
+        # matching the type, retargeted at it and in cascade order.
+        self._matching: Dict[str, List[Tuple[str, int]]] = {}
+        self._overlays: Dict[str, str] = {}
+        self._bodies: Dict[int, str] = {}
+
+    def update(self, variables: Mapping[str, Any], changed: FrozenSet[int]) -> None:
+        """Switches the overlays to new variables and changed rules."""
+        self.variables = variables
+        self.changed = changed
+        self._overlays.clear()
+        self._bodies.clear()
+
+    def overlay(self, widget: QtWidgets.QWidget) -> str:
+        """Returns the overlay for ``widget`` or ``""`` if it needs none."""
+        if not self.changed or _embedded(widget):
+            return ""
+        name = _qss_type(widget)
+        text = self._overlays.get(name)
+        if text is None:
+            text = self._render_overlay(self._matching_rules(widget, name))
+            self._overlays[name] = text
+        return text
+
+    def _matching_rules(
+        self, widget: QtWidgets.QWidget, name: str
+    ) -> List[Tuple[str, int]]:
+        matching = self._matching.get(name)
+        if matching is not None:
+            return matching
+        # The subject is retargeted at the widget's own type so the
+        # overlay does not leak onto children of other types.
+        # Retargeting ``*`` adds a type to the selector; ordering by the
+        # original specificity keeps ties resolving as they would in the
+        # full stylesheet.
+        entries = []
+        inherits: Dict[str, bool] = {}
+        for index, rule in enumerate(self.template.rules):
+            for selector in rule.selectors:
+                prefix, type_name, rest = selector_subject(selector)
+                if type_name:
+                    if type_name not in inherits:
+                        inherits[type_name] = bool(widget.inherits(type_name))
+                    if not inherits[type_name]:
+                        continue
+                entries.append(
+                    (
+                        selector_specificity(selector),
+                        len(entries),
+                        f"{prefix}{name}{rest}",
+                        index,
+                    )
+                )
+        entries.sort()
+        matching = [(selector, index) for _, _, selector, index in entries]
+        self._matching[name] = matching
+        return matching
+
+    def _render_overlay(self, matching: List[Tuple[str, int]]) -> str:
+        rules = self.template.rules
+        families = {
+            _family(prop)
+            for _, index in matching
+            if index in self.changed
+            for prop in rules[index].properties
+        }
+        if not families:
+            return ""
+        lines = [_OVERLAY_MARKER]
+        for selector, index in matching:
+            rule = rules[index]
+            if not any(_family(prop) in families for prop in rule.properties):
+                continue
+            body = self._bodies.get(index)
+            if body is None:
+                body = rule.body.render(self.variables)
+                self._bodies[index] = body
+            lines.append(f"{selector} {body}\n")
+        return "".join(lines)
+
+
+class _OverlayFilter(QtCore.QObject):
+    """Gives newly polished widgets the overlay for their type."""
+
+    def __init__(self, state: _SheetState, parent=None) -> None:
+        super().__init__(parent)
+        self.state = state
+
+    def eventFilter(self, obj, ev):
+        if ev.type() == QtCore.QEvent.Type.Polish and isinstance(
+            obj, QtWidgets.QWidget
+        ):
+            text = self.state.overlay(obj)
+            if text and not obj.styleSheet():
+                obj.setStyleSheet(text)
+        return super().eventFilter(obj, ev)
+
+
+def _is_overlay(text: str) -> bool:
+    return text.startswith(_OVERLAY_MARKER)
+
+
+def _set_filter(app: QtWidgets.QApplication, state: _SheetState) -> None:
+    """Installs or removes the overlay filter to match ``state``."""
+    if state.changed and state.filter is None:
+        state.filter = _OverlayFilter(state, parent=app)
+        app.installEventFilter(state.filter)
+    elif not state.changed and state.filter is not None:
+        if is_alive(state.filter):
+            app.removeEventFilter(state.filter)
+            state.filter.deleteLater()
+        state.filter = None
+
+
+def _repolish(
+    app: QtWidgets.QApplication, template: CompiledTemplate, roles: FrozenSet[str]
+) -> int:
+    """Re-polishes the widgets styled with any of the palette ``roles``."""
+    rules = frozenset(
+        index for index, rule in enumerate(template.rules) if rule.roles & roles
+    )
+    if not rules:
+        return 0
+    types = affected_types(template, rules)
+    everything = bool(types & (_GLOBAL_TYPES | _ALIASED_TYPES))
+    widgets = app.allWidgets()
+    selected = {
+        widget
+        for widget in widgets
+        if everything or any(widget.inherits(name) for name in types)
+    }
+    # Embedded widgets take their looks from their parent's rules.
+    selected.update(
+        widget
+        for widget in widgets
+        if _embedded(widget) and widget.parentWidget() in selected
+    )
+    for widget in selected:
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+    return len(selected)
+
+
+def _remove_overlays(app: QtWidgets.QApplication, state: _SheetState) -> None:
+    if state.changed:
+        for widget in app.allWidgets():
+            if _is_overlay(widget.styleSheet()):
+                widget.setStyleSheet("")
+        state.update({}, frozenset())
+    _set_filter(app, state)
+
+
+def apply_stylesheet(
+    app: QtWidgets.QApplication,
+    template: CompiledTemplate,
+    qss: str,
+    variables: Mapping[str, Any],
+    signature: Optional[Mapping[str, Any]] = None,
+    differential: bool = False,
+    palette: Optional[Mapping[str, str]] = None,
+) -> int:
+    """Applies a rendered template to an application.
+
+    Args:
+        app (QtWidgets.QApplication): The application to style.
+        template (CompiledTemplate): The template ``qss`` was rendered
+            from.
+        qss (str): The rendered stylesheet.
+        variables (Mapping[str, Any]): The variables ``qss`` was
+            rendered with.
+        signature (Optional[Mapping[str, Any]], optional): Values to
+            compare against the previous switch to find changed rules.
+            Needed when a variable's value can stay the same while what
+            it refers to changes.  Defaults to ``variables``.
+        differential (bool, optional): Try to restyle only the widgets
+            affected by the change. Defaults to False.
+        palette (Optional[Mapping[str, str]], optional): Maps variables
+            the template refers to through ``palette(...)`` to the names
+            of those roles.  The caller must already have updated the
+            application palette.  Defaults to none.
+
+    Returns:
+        int: The number of widgets whose overlay was set, changed or
+        removed or that were re-polished, or ``-1`` if the whole
+        application was re-styled.
+    """
+    signature = variables if signature is None else signature
+    palette = palette or {}
+    state: Optional[_SheetState] = getattr(app, "_qss_state", None)
+    if (
+        (differential or palette)
+        and state is not None
+        and state.template is template
+        and app.styleSheet() == state.base_qss
+    ):
+        names = changed_names(state.signature, signature)
+        roles = frozenset(palette[name] for name in names if name in palette)
+        if names.isdisjoint(template.names):
+            # The stylesheet text would not change.
+            state.signature = dict(signature)
+            return _repolish(app, template, roles)
+        if differential:
+            count = _apply_overlays(app, state, variables, signature)
+            if count >= 0:
+                return count + _repolish(app, template, roles)
+
+    new_state = _SheetState(template, qss, signature)
+    if state is not None:
+        _remove_overlays(app, state)
+        if state.template is template:
+            new_state._matching = state._matching
+    app.setStyleSheet(qss)
+    app._qss_state = new_state
+    return -1
+
+
+def _apply_overlays(
+    app: QtWidgets.QApplication,
+    state: _SheetState,
+    variables: Mapping[str, Any],
+    signature: Mapping[str, Any],
+) -> int:
+    """Moves the overlays to new variables; ``-1`` if that is not enough."""
+    template = state.template
+    changed = changed_rules(
+        template, changed_names(state.base_signature, signature)
+    )
+    if affected_types(template, changed) & (_GLOBAL_TYPES | _ALIASED_TYPES):
+        return -1
+
+    previous = state.variables, state.changed
+    state.update(variables, changed)
+    updates = []
+    for widget in app.allWidgets():
+        current = widget.styleSheet()
+        text = state.overlay(widget)
+        if current == text:
+            continue
+        if current and not _is_overlay(current):
+            if text:
+                # The application styles this widget itself; overlaying
+                # would replace its stylesheet.
+                state.update(*previous)
+                return -1
+            continue
+        updates.append((widget, text))
+
+    for widget, text in updates:
+        widget.setStyleSheet(text)
+    _set_filter(app, state)
+    state.signature = dict(signature)
+    return len(updates)
@@ -0,0 +1,270 @@
+"""Incremental bulk export of stylesheets.
+
+:func:`export_all` writes the QSS for a set of styles (by default every
+built-in one) times a set of ``extra`` variants into a directory, for
+shipping the stylesheets as build artefacts.  The rendering is spread
+over a process pool, see :mod:`q_materialise.bulk`.
+
+The arrow icons the stylesheets use are written next to them, to
+``icons/<digest>/`` in the output directory, and referred to by
+relative ``url()`` references, so the directory can be shipped as a
+whole.  Qt resolves relative URLs against the application's working
+directory.
+
+A manifest in the output directory records the fingerprint of the
+inputs each file was rendered from: the style, its ``extra`` overrides,
+the package version, the stylesheet template, the built-in style pack
+and the bundled arrow icons.  Files whose
+fingerprint is unchanged, that have not been modified since they were
+written and whose icons are still present are skipped.  Files and the
+manifest are written atomically, so an interrupted export never leaves
+a truncated stylesheet behind.
+
+Run it from the command line with ``q-materialise export-all`` (or
+``python -m q_materialise.export``, which takes the same arguments)::
+
+    q-materialise export-all build/qss --variants @variants.json
+
+This module has no dependency on Qt.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+import time
+from functools import partial
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from . import cli, compiler, pack
+from .bulk import _fan_out
+from .cache import _atomic_write, fingerprint
+from .style import FrozenStyle, Style
+
+MANIFEST_NAME = "qss-manifest.json"
+
+# Directory in the output directory holding the arrow icons.
+ICONS_DIR = "icons"
+
+# Bump when the layout of the manifest changes; manifests in another
+# format are ignored and every file is written again.
+FORMAT = 2
+
+Variants = Mapping[str, Optional[Mapping[str, Any]]]
+
+
+class ExportSummary(NamedTuple):
+    """The outcome of :func:`export_all`.
+
+    Attributes:
+        written (List[Path]): Files that were rendered and written.
+        skipped (List[Path]): Files that were already up to date.
+        timings (Dict[str, float]): Seconds spent preparing (loading
+            styles and checking the manifest), rendering and writing.
+    """
+
+    written: List[Path]
+    skipped: List[Path]
+    timings: Dict[str, float]
+
+
+class _Job(NamedTuple):
+    dest: Path
+    style: Style
+    extra: Optional[Dict[str, Any]]
+    fingerprint: str
+
+
+def _renderer_fingerprint(use_palette: bool) -> str:
+    # Only data is hashed: the sources of the rendering code may not be
+    # installed (byte-code only installs, zipapps, frozen applications).
+    from . import __version__
+
+    digest = hashlib.sha1(f"{__version__}:{use_palette}".encode("utf-8"))
+    digest.update(compiler._QSS_TEMPLATE.encode("utf-8"))
+    try:
+        digest.update(pack.PACK_PATH.read_bytes())
+    except OSError:
+        pass  # No pack; the built-in styles are read from their files
+    # The icon directories named in the stylesheets depend on these.
+    for source in sorted(compiler._ARROW_SOURCES.values()):
+        digest.update((compiler._ICONS_DIR / source).read_bytes())
+    return digest.hexdigest()
+
+
+def _file_name(style_name: str, variant: str) -> str:
+    return f"{style_name}-{variant}.qss" if variant else f"{style_name}.qss"
+
+
+def _read_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        with path.open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("format") != FORMAT:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _is_current(output: Path, dest: Path, entry: Any, digest: str) -> bool:
+    if not isinstance(entry, dict) or entry.get("fingerprint") != digest:
+        return False
+    try:
+        stat = dest.stat()
+    except OSError:
+        return False
+    icons = entry.get("icons")
+    if not isinstance(icons, list) or not all(
+        (output / icon).is_file() for icon in icons
+    ):
+        return False
+    return [stat.st_size, stat.st_mtime_ns] == entry.get("stamp")
+
+
+def _render_job(
+    job: Tuple[Style, Optional[Dict[str, Any]]], output: Path, use_palette: bool
+) -> Tuple[str, List[str]]:
+    """Writes a job's arrow icons; returns its QSS and the icon paths."""
+    the_style, extra = job
+    arrow_dirs = {}
+    for alias, colour in compiler._arrow_icon_colours(the_style).items():
+        outdir = compiler._write_arrow_icons(output / ICONS_DIR, colour, 0o644)
+        arrow_dirs[alias] = outdir.relative_to(output).as_posix()
+    icons = sorted(
+        f"{directory}/{name}"
+        for directory in set(arrow_dirs.values())
+        for name in compiler._ARROW_SOURCES
+    )
+    qss = compiler._compile_qss(the_style, extra, use_palette, arrow_dirs)
+    return qss, icons
+
+
+def export_all(
+    output_dir: Union[str, Path],
+    styles: Optional[Iterable[Union[str, Style, FrozenStyle, Dict[str, Any]]]] = None,
+    variants: Optional[Variants] = None,
+    use_palette: bool = False,
+    workers: Optional[int] = None,
+    force: bool = False,
+) -> ExportSummary:
+    """Writes the stylesheet of every style and variant to a directory.
+
+    Each style is written as ``<name>.qss`` for the variant named ``""``
+    and ``<name>-<variant>.qss`` for the others.  Their arrow icons are
+    written to ``icons/<digest>/`` and referred to relative to
+    ``output_dir``.
+
+    Args:
+        output_dir (Union[str, Path]): Directory for the stylesheets and
+            the manifest.  Created if necessary.
+        styles (Optional[Iterable[...]], optional): Style names, dicts or
+            Style instances.  Defaults to every available style.
+        variants (Optional[Variants], optional): Variant names mapped to
+            the ``extra`` overrides to render them with.  Defaults to a
+            single unnamed variant without overrides.
+        use_palette (bool, optional): Refer to palette roles where
+            possible. Defaults to False.
+        workers (Optional[int], optional): Number of worker processes;
+            ``None`` uses one per CPU. Defaults to None.
+        force (bool, optional): Write every file even if it is up to
+            date. Defaults to False.
+
+    Returns:
+        ExportSummary: The written and skipped files and the timings.
+    """
+    start = time.perf_counter()
+    output = Path(output_dir)
+    manifest_path = output / MANIFEST_NAME
+    manifest = {} if force else _read_manifest(manifest_path)
+    renderer = _renderer_fingerprint(use_palette)
+    if styles is None:
+        styles = compiler.list_styles()
+    if variants is None:
+        variants = {"": None}
+
+    jobs: List[_Job] = []
+    skipped: List[Path] = []
+    for item in styles:
+        the_style = compiler._resolve_style(item)
+        for variant, extra in variants.items():
+            dest = output / _file_name(the_style.name, variant)
+            digest = f"{renderer}-{fingerprint(the_style, extra)}"
+            if _is_current(output, dest, manifest.get(dest.name), digest):
+                skipped.append(dest)
+            else:
+                extra = dict(extra) if extra else None
+                jobs.append(_Job(dest, the_style, extra, digest))
+    prepared = time.perf_counter()
+
+    written: List[Path] = []
+    write_time = 0.0
+    render = partial(_render_job, output=output, use_palette=use_palette)
+    # Styles are sent to the workers rather than names so that styles
+    # passed as dicts or instances need no lookup there.
+    rendered = _fan_out(
+        render, ((job.style, job.extra) for job in jobs), workers, chunk_size=4
+    )
+    try:
+        for job, (qss, icons) in zip(jobs, rendered):
+            before = time.perf_counter()
+            _atomic_write(job.dest, qss.encode("utf-8"), 0o644)
+            stat = job.dest.stat()
+            manifest[job.dest.name] = {
+                "fingerprint": job.fingerprint,
+                "stamp": [stat.st_size, stat.st_mtime_ns],
+                "icons": icons,
+            }
+            written.append(job.dest)
+            write_time += time.perf_counter() - before
+    finally:
+        # Record whatever was written, even if rendering failed midway.
+        if written or not manifest_path.exists():
+            data = {"format": FORMAT, "files": manifest}
+            text = json.dumps(data, indent=1, sort_keys=True) + "\n"
+            _atomic_write(manifest_path, text.encode("utf-8"), 0o644)
+    end = time.perf_counter()
+
+    timings = {
+        "prepare": prepared - start,
+        "render": end - prepared - write_time,
+        "write": write_time,
+        "total": end - start,
+    }
+    return ExportSummary(written, skipped, timings)
+
+
+def format_summary(summary: ExportSummary) -> str:
+    """Returns a one-line description of an export for logs."""
+    t = summary.timings
+    total = len(summary.written) + len(summary.skipped)
+    return (
+        f"wrote {len(summary.written)} of {total} stylesheets "
+        f"({len(summary.skipped)} up to date) in {t['total']:.2f}s: "
+        f"prepare {t['prepare']:.2f}s, render {t['render']:.2f}s, "
+        f"write {t['write']:.2f}s"
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs ``q-materialise export-all``, see :mod:`q_materialise.cli`."""
+    args = sys.argv[1:] if argv is None else argv
+    return cli.main(["export-all", *args])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
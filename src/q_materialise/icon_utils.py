@@ -1,50 +1,38 @@
 # Opt-out / bookkeeping flags
+from __future__ import annotations
+
 import re
+import time
+from collections import OrderedDict
 from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from .binding import QtCore, QtGui, QtWidgets, import_qt_module, is_alive
+from .cache import CacheInfo, LRUCache
+from .compiler import (
+    _ARROW_SOURCES,
+    _ICONS_DIR,
+    _ensure_arrow_icons,
+    _svg_with_missing_fill_added,
+    _write_asset,
+)
 
-from PySide6 import QtCore, QtGui, QtSvg, QtWidgets
-from PySide6.QtCore import QDir, QStandardPaths
-from PySide6.QtWidgets import QApplication
+if TYPE_CHECKING:  # pragma: no cover - QtSvg is imported lazily at run time
+    from PySide6 import QtSvg
 
 _NO_TINT_PROP = "_no_icon_tint"
 _TINTED_PROP = "_icon_tinted"
 
-_ICONS_DIR = Path(__file__).resolve().parent / "icons"
-
-from xml.etree import ElementTree as ET
-
-_SVG_NS = "http://www.w3.org/2000/svg"
-ET.register_namespace("", _SVG_NS)
-
-# Shapes that may appear without explicit fill and default to black
-_SVG_FILLABLE_TAGS = {
-    f"{{{_SVG_NS}}}path",
-    f"{{{_SVG_NS}}}rect",
-    f"{{{_SVG_NS}}}circle",
-    f"{{{_SVG_NS}}}ellipse",
-    f"{{{_SVG_NS}}}polygon",
-    f"{{{_SVG_NS}}}polyline",
-}
+def _flag(obj: QtCore.QObject, name: str) -> bool:
+    """Return True if the dynamic property ``name`` is set to True."""
+    return obj.property(name) is True
 
 def write_svg_with_missing_fill_added(src: Path, dest: Path, fill_hex: str) -> None:
     """
     Read SVG, add fill=fill_hex to elements that *lack* a 'fill' attribute.
     Existing fills (including 'none') are preserved.
     """
-    tree = ET.parse(src)
-    root = tree.getroot()
-
-    for el in root.iter():
-        if el.tag in _SVG_FILLABLE_TAGS:
-            # Leave explicit fills alone (including "none")
-            if "fill" not in el.attrib:
-                el.set("fill", fill_hex)
-
-    # Write back
-    dest.write_text(
-        ET.tostring(root, encoding="unicode", method="xml"),
-        encoding="utf-8",
-    )
+    _write_asset(dest, _svg_with_missing_fill_added(src, fill_hex).encode("utf-8"))
 
 def _icon_uri(rel: str) -> str:
     return (_ICONS_DIR / rel).as_posix()
@@ -54,6 +42,7 @@ def _tint_pixmap(pix: QtGui.QPixmap, color: QtGui.QColor) -> QtGui.QPixmap:
     if pix.isNull():
         return pix
     out = QtGui.QPixmap(pix.size())
+    out.setDevicePixelRatio(pix.devicePixelRatio())
     out.fill(QtCore.Qt.GlobalColor.transparent)
     p = QtGui.QPainter(out)
     p.setCompositionMode(QtGui.QPainter.CompositionMode.CompositionMode_Source)
@@ -63,191 +52,553 @@ def _tint_pixmap(pix: QtGui.QPixmap, color: QtGui.QColor) -> QtGui.QPixmap:
     p.end()
     return out
 
-def _render_svg_tinted(path: Path, size: QtCore.QSize, color: QtGui.QColor) -> QtGui.QPixmap:
+_UNRESOLVED = object()
+_QT_SVG = _UNRESOLVED
+
+def _qt_svg():
+    """Returns the binding's QtSvg module, or ``None`` if not installed.
+
+    QtSvg is only needed once an SVG icon is actually rendered, so it is
+    imported on first use rather than with this module.
+    """
+    global _QT_SVG
+    if _QT_SVG is _UNRESOLVED:
+        _QT_SVG = import_qt_module("QtSvg")
+    return _QT_SVG
+
+class _SvgRendererPool:
+    """Parsed SVG renderers shared by all icon rendering.
+
+    Each file is read and parsed once; renderers are kept in LRU order
+    and evicted once their estimated memory use exceeds the budget.
+    The estimate is the size of the SVG source plus a fixed per-renderer
+    overhead.
+    """
+
+    OVERHEAD = 2048
+
+    def __init__(self, budget_bytes: int = 4 * 1024 * 1024):
+        self._budget = budget_bytes
+        self._used = 0
+        self._entries: "OrderedDict[str, Tuple[QtSvg.QSvgRenderer, int]]" = OrderedDict()
+
+    @property
+    def budget(self) -> int:
+        return self._budget
+
+    @budget.setter
+    def budget(self, budget_bytes: int) -> None:
+        self._budget = max(0, int(budget_bytes))
+        self._evict()
+
+    @property
+    def used(self) -> int:
+        return self._used
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def renderer(self, path: Path) -> "QtSvg.QSvgRenderer":
+        key = str(path)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry[0]
+        try:
+            data = path.read_bytes()
+        except OSError:
+            # Keep Qt's behaviour for unreadable files: an invalid renderer
+            return _qt_svg().QSvgRenderer()
+        renderer = _qt_svg().QSvgRenderer(QtCore.QByteArray(data))
+        cost = len(data) + self.OVERHEAD
+        self._entries[key] = (renderer, cost)
+        self._used += cost
+        self._evict()
+        return renderer
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._used = 0
+
+    def _evict(self) -> None:
+        # Always keep the most recently used renderer
+        while self._used > self._budget and len(self._entries) > 1:
+            _, (_, cost) = self._entries.popitem(last=False)
+            self._used -= cost
+
+_SVG_POOL = _SvgRendererPool()
+
+def set_svg_pool_budget(budget_bytes: int) -> None:
+    """Set the memory budget of the shared SVG renderer pool.
+
+    Bundled icons are parsed once and kept in memory so repaints do not
+    touch the filesystem.  Least recently used renderers are dropped once
+    the estimated size of the pool exceeds *budget_bytes* (default 4 MiB).
+    """
+    _SVG_POOL.budget = budget_bytes
+
+def _render_svg_tinted(path: Path, size: QtCore.QSize, color: QtGui.QColor,
+                       dpr: float = 1.0) -> QtGui.QPixmap:
     w = size.width() if size.width() > 0 else 24
     h = size.height() if size.height() > 0 else 24
+    # Render at device resolution so icons stay crisp on HiDPI screens
+    w, h = max(1, round(w * dpr)), max(1, round(h * dpr))
     pm = QtGui.QPixmap(w, h)
     pm.fill(QtCore.Qt.GlobalColor.transparent)
-    if QtSvg is not None and path.suffix.lower() == ".svg":
-        renderer = QtSvg.QSvgRenderer(str(path))
+    if path.suffix.lower() == ".svg" and _qt_svg() is not None:
+        renderer = _SVG_POOL.renderer(path)
         p = QtGui.QPainter(pm)
         renderer.render(p)
         p.end()
+        pm.setDevicePixelRatio(dpr)
         return _tint_pixmap(pm, color)
     # Fallback: load raster and tint
     base = QtGui.QPixmap(str(path))
     if not base.isNull():
         base = base.scaled(w, h, QtCore.Qt.AspectRatioMode.KeepAspectRatio,
                            QtCore.Qt.TransformationMode.SmoothTransformation)
+        base.setDevicePixelRatio(dpr)
         return _tint_pixmap(base, color)
+    pm.setDevicePixelRatio(dpr)
     return pm
 
-def _colorize_icon(icon: QtGui.QIcon, color: QtGui.QColor,
-                   sizes=(16, 20, 24, 32, 48)) -> QtGui.QIcon:
+class _TintIconEngine(QtGui.QIconEngine):
+    """Icon engine that tints the pixmaps of a source icon on demand.
+
+    Pixmaps are only produced for the sizes, modes and device pixel
+    ratios that are actually painted, and each one is memoised.  Modes
+    other than Normal are derived from the tinted Normal pixmap by the
+    application style, matching how Qt treats plain pixmap icons.
+    """
+
+    def __init__(self, source: QtGui.QIcon, color: QtGui.QColor):
+        super().__init__()
+        self._source = QtGui.QIcon(source)
+        self._color = QtGui.QColor(color)
+        self._pixmaps: Dict[tuple, QtGui.QPixmap] = {}
+
+    def _tinted(self, size: QtCore.QSize, mode, state,
+                scale: float = 1.0) -> QtGui.QPixmap:
+        key = (size.width(), size.height(), mode, state, scale)
+        pm = self._pixmaps.get(key)
+        if pm is not None:
+            return pm
+        normal = QtGui.QIcon.Mode.Normal
+        if scale != 1.0:
+            src = self._source.pixmap(size, scale, normal, state)
+        else:
+            src = self._source.pixmap(size, normal, state)
+        pm = _tint_pixmap(src, self._color)
+        if mode != normal and not pm.isNull():
+            style = QtWidgets.QApplication.style()
+            if style is not None:
+                pm = style.generatedIconPixmap(mode, pm, QtWidgets.QStyleOption())
+        self._pixmaps[key] = pm
+        return pm
+
+    def pixmap(self, size, mode, state):
+        return self._tinted(size, mode, state)
+
+    def scaledPixmap(self, size, mode, state, scale):
+        return self._tinted(size, mode, state, float(scale))
+
+    def paint(self, painter, rect, mode, state):
+        device = painter.device()
+        scale = float(device.devicePixelRatioF()) if device is not None else 1.0
+        painter.drawPixmap(rect, self._tinted(rect.size(), mode, state, scale))
+
+    def actualSize(self, size, mode, state):
+        return self._source.actualSize(size, mode, state)
+
+    def availableSizes(self, mode, state):
+        return self._source.availableSizes(mode, state)
+
+    def isNull(self):
+        return self._source.isNull()
+
+    def key(self):
+        return "qmaterialise-tint"
+
+    def clone(self):
+        engine = _TintIconEngine(self._source, self._color)
+        _keep_engine(engine)
+        return engine
+
+# Engines returned from clone() are owned by Qt, but some bindings would
+# delete them together with their Python wrapper; keep them referenced
+# until Qt has destroyed them.
+_ENGINE_CLONES: List[_TintIconEngine] = []
+
+def _keep_engine(engine: _TintIconEngine) -> None:
+    _ENGINE_CLONES[:] = [e for e in _ENGINE_CLONES if is_alive(e)]
+    _ENGINE_CLONES.append(engine)
+
+# Tinted icons keyed by (source QIcon.cacheKey(), rgba)
+_TINT_CACHE = LRUCache(maxsize=512)
+
+def tint_cache_info() -> CacheInfo:
+    """Return hit/miss statistics of the tinted icon cache.
+
+    Icons shared by several buttons, actions or tabs are tinted once per
+    theme; the counters show how often a tinted icon could be reused.
+    """
+    return _TINT_CACHE.info()
+
+def clear_tint_cache() -> None:
+    """Drop all tinted icons and reset the statistics."""
+    _TINT_CACHE.clear()
+
+def _colorize_icon(icon: QtGui.QIcon, color: QtGui.QColor) -> QtGui.QIcon:
+    """Return *icon* tinted with *color*.
+
+    The result renders lazily through :class:`_TintIconEngine`, so only
+    the sizes that are painted are ever tinted.
+    """
+    key = (icon.cacheKey(), color.rgba())
+    out = _TINT_CACHE.get(key)
+    if out is not None:
+        return out
     if icon.isNull():
         pm = QtGui.QPixmap(24, 24)
         pm.fill(QtCore.Qt.GlobalColor.transparent)
-        return QtGui.QIcon(_tint_pixmap(pm, color))
-    out = QtGui.QIcon()
-    for s in sizes:
-        pm = icon.pixmap(s, s)
-        if pm.isNull():
-            continue
-        out.addPixmap(_tint_pixmap(pm, color))
+        out = QtGui.QIcon(_tint_pixmap(pm, color))
+    else:
+        out = QtGui.QIcon(_TintIconEngine(icon, color))
+    _TINT_CACHE.put(key, out)
+    # Tinting the result again with the same colour is a no-op
+    _TINT_CACHE.put((out.cacheKey(), color.rgba()), out)
     return out
 
+# Standard pixmaps drawn with our bundled icons.  Keyed by enum member name
+# and resolved against QStyle on first use (see ``_standard_icon_files``).
+_STANDARD_ICON_NAMES = {
+    "SP_TitleBarMenuButton": "menu.svg",
+    "SP_TitleBarMinButton": "minimize.svg",
+    "SP_TitleBarMaxButton": "maximize.svg",
+    "SP_TitleBarCloseButton": "close.svg",
+    "SP_TitleBarContextHelpButton": "help_outline.svg",
+    "SP_DockWidgetCloseButton": "close.svg",
+    "SP_MessageBoxInformation": "info_outline.svg",
+    "SP_MessageBoxWarning": "warning.svg",
+    "SP_MessageBoxCritical": "error.svg",
+    "SP_MessageBoxQuestion": "help_outline.svg",
+    "SP_DesktopIcon": "desktop_mac.svg",
+    "SP_TrashIcon": "delete.svg",
+    "SP_ComputerIcon": "computer.svg",
+    "SP_DirOpenIcon": "folder_open.svg",
+    "SP_DirClosedIcon": "folder.svg",
+    "SP_FileIcon": "insert_drive_file.svg",
+    "SP_FileDialogNewFolder": "create_new_folder.svg",
+    "SP_DialogOkButton": "check.svg",
+    "SP_DialogCancelButton": "cancel.svg",
+    "SP_DialogHelpButton": "help_outline.svg",
+    "SP_DialogOpenButton": "folder_open.svg",
+    "SP_DialogSaveButton": "save.svg",
+    "SP_DialogCloseButton": "close.svg",
+    "SP_DialogApplyButton": "done.svg",
+    "SP_DialogResetButton": "refresh.svg",
+    "SP_DialogDiscardButton": "delete.svg",
+    "SP_DialogYesButton": "check.svg",
+    "SP_DialogNoButton": "close.svg",
+    "SP_ArrowUp": "arrow_upward.svg",
+    "SP_ArrowDown": "arrow_downward.svg",
+    "SP_ArrowLeft": "arrow_left.svg",
+    "SP_ArrowRight": "arrow_right.svg",
+    "SP_ArrowBack": "arrow_back.svg",
+    "SP_ArrowForward": "arrow_forward.svg",
+    "SP_DirHomeIcon": "home.svg",
+    "SP_CommandLink": "link.svg",
+    "SP_VistaShield": "shield.svg",
+    "SP_BrowserReload": "refresh.svg",
+    "SP_BrowserStop": "stop.svg",
+    "SP_MediaPlay": "play_arrow.svg",
+    "SP_MediaStop": "stop.svg",
+    "SP_MediaPause": "pause.svg",
+    "SP_MediaSkipForward": "skip_next.svg",
+    "SP_MediaSkipBackward": "skip_previous.svg",
+    "SP_MediaSeekForward": "fast_forward.svg",
+    "SP_MediaSeekBackward": "fast_rewind.svg",
+    "SP_MediaVolume": "volume_up.svg",
+    "SP_MediaVolumeMuted": "volume_off.svg",
+    "SP_LineEditClearButton": "close.svg",
+    "SP_RestoreDefaultsButton": "restore.svg",
+    "SP_TabCloseButton": "close.svg",
+}
+_STANDARD_ICON_FILES: Dict[object, str] = {}
+
+# Rendered standard icons keyed by (file name, size, rgba, device pixel ratio)
+_ICON_CACHE = LRUCache(maxsize=256)
+
+def _standard_icon_files() -> Dict[object, str]:
+    if not _STANDARD_ICON_FILES:
+        for name, file_name in _STANDARD_ICON_NAMES.items():
+            sp = getattr(QtWidgets.QStyle, name, None)
+            if sp is not None:
+                _STANDARD_ICON_FILES[sp] = file_name
+    return _STANDARD_ICON_FILES
+
+def _clear_icon_cache() -> None:
+    _ICON_CACHE.clear()
+
+def _standard_svg_icon(file_name: str, px: int, color: QtGui.QColor,
+                       dpr: float) -> QtGui.QIcon:
+    """Render (once) a bundled SVG as a tinted icon."""
+    key = (file_name, px, color.rgba(), dpr)
+    icon = _ICON_CACHE.get(key)
+    if icon is not None:
+        return icon
+    pm = _render_svg_tinted(_ICONS_DIR / file_name, QtCore.QSize(px, px), color, dpr)
+    icon = QtGui.QIcon(pm)
+    _ICON_CACHE.put(key, icon)
+    return icon
+
+def _device_pixel_ratio(widget=None) -> float:
+    if widget is not None:
+        return float(widget.devicePixelRatioF())
+    app = QtWidgets.QApplication.instance()
+    return float(app.devicePixelRatio()) if app is not None else 1.0
+
+class IconProxyStyle(QtWidgets.QProxyStyle):
+    def __init__(self, base, color: QtGui.QColor, is_dark: bool, default_px: int):
+        super().__init__(base)
+        self.set_theme(color, is_dark, default_px)
+
+    def set_theme(self, color: QtGui.QColor, is_dark: bool, default_px: int) -> None:
+        self._color = color
+        self._is_dark = is_dark
+        self._default_px = default_px
+
+    # Set default icon sizes; explicit setIconSize() still overrides.
+    def pixelMetric(self, metric, option=None, widget=None) -> int:
+        if metric in (
+            QtWidgets.QStyle.PixelMetric.PM_SmallIconSize,
+            QtWidgets.QStyle.PixelMetric.PM_ToolBarIconSize,
+            QtWidgets.QStyle.PixelMetric.PM_MessageBoxIconSize,
+        ):
+            return self._default_px
+        return super().pixelMetric(metric, option, widget)
+
+    def standardIcon(self, sp, option=None, widget=None) -> QtGui.QIcon:
+        # Map common standard pixmaps to our bundled icons
+        icon_name = _standard_icon_files().get(sp)
+        if icon_name:
+            return _standard_svg_icon(
+                icon_name, self._default_px, self._color, _device_pixel_ratio(widget)
+            )
+
+        base = super().standardIcon(sp, option, widget)
+        return _colorize_icon(base, self._color)
+
 def _set_all_icons(
     app: QtWidgets.QApplication,
     text_color: str,
     is_dark: bool,
     default_px: int = 24,
-) -> QApplication:
-    class IconProxyStyle(QtWidgets.QProxyStyle):
-        def __init__(self, base, color: QtGui.QColor, is_dark: bool, default_px: int):
-            super().__init__(base)
-            self._color = color
-            self._is_dark = is_dark
-            self._default_px = default_px
-
-        # Set default icon sizes; explicit setIconSize() still overrides.
-        def pixelMetric(self, metric, option=None, widget=None) -> int:
-            if metric in (
-                QtWidgets.QStyle.PixelMetric.PM_SmallIconSize,
-                QtWidgets.QStyle.PixelMetric.PM_ToolBarIconSize,
-                QtWidgets.QStyle.PixelMetric.PM_MessageBoxIconSize,
-            ):
-                return self._default_px
-            return super().pixelMetric(metric, option, widget)
-
-        def standardIcon(self, sp, option=None, widget=None) -> QtGui.QIcon:
-            # Map common standard pixmaps to our bundled icons
-            mapping = {
-                QtWidgets.QStyle.SP_TitleBarMenuButton: "menu.svg",
-                QtWidgets.QStyle.SP_TitleBarMinButton: "minimize.svg",
-                QtWidgets.QStyle.SP_TitleBarMaxButton: "maximize.svg",
-                QtWidgets.QStyle.SP_TitleBarCloseButton: "close.svg",
-                QtWidgets.QStyle.SP_TitleBarContextHelpButton: "help_outline.svg",
-                QtWidgets.QStyle.SP_DockWidgetCloseButton: "close.svg",
-                QtWidgets.QStyle.SP_MessageBoxInformation: "info_outline.svg",
-                QtWidgets.QStyle.SP_MessageBoxWarning: "warning.svg",
-                QtWidgets.QStyle.SP_MessageBoxCritical: "error.svg",
-                QtWidgets.QStyle.SP_MessageBoxQuestion: "help_outline.svg",
-                QtWidgets.QStyle.SP_DesktopIcon: "desktop_mac.svg",
-                QtWidgets.QStyle.SP_TrashIcon: "delete.svg",
-                QtWidgets.QStyle.SP_ComputerIcon: "computer.svg",
-                QtWidgets.QStyle.SP_DirOpenIcon: "folder_open.svg",
-                QtWidgets.QStyle.SP_DirClosedIcon: "folder.svg",
-                QtWidgets.QStyle.SP_FileIcon: "insert_drive_file.svg",
-                QtWidgets.QStyle.SP_FileDialogNewFolder: "create_new_folder.svg",
-                QtWidgets.QStyle.SP_DialogOkButton: "check.svg",
-                QtWidgets.QStyle.SP_DialogCancelButton: "cancel.svg",
-                QtWidgets.QStyle.SP_DialogHelpButton: "help_outline.svg",
-                QtWidgets.QStyle.SP_DialogOpenButton: "folder_open.svg",
-                QtWidgets.QStyle.SP_DialogSaveButton: "save.svg",
-                QtWidgets.QStyle.SP_DialogCloseButton: "close.svg",
-                QtWidgets.QStyle.SP_DialogApplyButton: "done.svg",
-                QtWidgets.QStyle.SP_DialogResetButton: "refresh.svg",
-                QtWidgets.QStyle.SP_DialogDiscardButton: "delete.svg",
-                QtWidgets.QStyle.SP_DialogYesButton: "check.svg",
-                QtWidgets.QStyle.SP_DialogNoButton: "close.svg",
-                QtWidgets.QStyle.SP_ArrowUp: "arrow_upward.svg",
-                QtWidgets.QStyle.SP_ArrowDown: "arrow_downward.svg",
-                QtWidgets.QStyle.SP_ArrowLeft: "arrow_left.svg",
-                QtWidgets.QStyle.SP_ArrowRight: "arrow_right.svg",
-                QtWidgets.QStyle.SP_ArrowBack: "arrow_back.svg",
-                QtWidgets.QStyle.SP_ArrowForward: "arrow_forward.svg",
-                QtWidgets.QStyle.SP_DirHomeIcon: "home.svg",
-                QtWidgets.QStyle.SP_CommandLink: "link.svg",
-                QtWidgets.QStyle.SP_VistaShield: "shield.svg",
-                QtWidgets.QStyle.SP_BrowserReload: "refresh.svg",
-                QtWidgets.QStyle.SP_BrowserStop: "stop.svg",
-                QtWidgets.QStyle.SP_MediaPlay: "play_arrow.svg",
-                QtWidgets.QStyle.SP_MediaStop: "stop.svg",
-                QtWidgets.QStyle.SP_MediaPause: "pause.svg",
-                QtWidgets.QStyle.SP_MediaSkipForward: "skip_next.svg",
-                QtWidgets.QStyle.SP_MediaSkipBackward: "skip_previous.svg",
-                QtWidgets.QStyle.SP_MediaSeekForward: "fast_forward.svg",
-                QtWidgets.QStyle.SP_MediaSeekBackward: "fast_rewind.svg",
-                QtWidgets.QStyle.SP_MediaVolume: "volume_up.svg",
-                QtWidgets.QStyle.SP_MediaVolumeMuted: "volume_off.svg",
-                QtWidgets.QStyle.SP_LineEditClearButton: "close.svg",
-                QtWidgets.QStyle.SP_RestoreDefaultsButton: "restore.svg",
-                QtWidgets.QStyle.SP_TabCloseButton: "close.svg",
-            }
-
-            icon_name = mapping.get(sp)
-            if icon_name:
-                pm = _render_svg_tinted(
-                    _ICONS_DIR / icon_name,
-                    QtCore.QSize(self._default_px, self._default_px),
-                    self._color,
-                )
-                return QtGui.QIcon(pm)
-
-            base = super().standardIcon(sp, option, widget)
-            return _colorize_icon(base, self._color)
-
-    style = IconProxyStyle(app.style(), QtGui.QColor(text_color), is_dark, default_px)
+) -> QtWidgets.QApplication:
+    # Icons rendered for the previous theme are no longer needed
+    _clear_icon_cache()
+    color = QtGui.QColor(text_color)
+    # Reuse the proxy installed by an earlier call instead of wrapping it
+    # (or the style sheet style Qt puts around it) in yet another proxy.
+    style = getattr(app, "_icon_proxy_style", None)
+    if style is not None and is_alive(style) and is_alive(style.baseStyle()):
+        style.set_theme(color, is_dark, default_px)
+        return app
+    style = IconProxyStyle(app.style(), color, is_dark, default_px)
     app.setStyle(style)
+    app._icon_proxy_style = style
     return app
 
-def _tint_widget_icons(color: QtGui.QColor, default_px: int = 24) -> None:
-    def tint_action(act: QtGui.QAction):
-        if act.property(_NO_TINT_PROP) is True or act.property(_TINTED_PROP) is True:
-            return
-        ic = act.icon()
+def _source_prop(icon: QtGui.QIcon) -> str:
+    # Dynamic property holding the untinted original of a tinted icon
+    return f"_icon_source_{icon.cacheKey()}"
+
+def _tinted_icons(obj: QtCore.QObject, icons: List[QtGui.QIcon],
+                  color: QtGui.QColor) -> List[QtGui.QIcon]:
+    """Return *icons* of *obj* tinted with *color*.
+
+    Icons tinted earlier are tinted again from their untinted originals,
+    which are kept as dynamic properties of *obj*, so theme switches do
+    not wrap tint engines inside each other.
+    """
+    stale = set()
+    sources: Dict[str, QtGui.QIcon] = {}
+    out = []
+    for icon in icons:
+        if icon.isNull():
+            out.append(icon)
+            continue
+        name = _source_prop(icon)
+        source = obj.property(name)
+        if source is None:
+            source = icon
+        else:
+            stale.add(name)
+        tinted = _colorize_icon(source, color)
+        sources[_source_prop(tinted)] = source
+        out.append(tinted)
+    for name in stale - sources.keys():
+        obj.setProperty(name, None)
+    for name, source in sources.items():
+        obj.setProperty(name, source)
+    return out
+
+def _tint_action(act: QtGui.QAction, color: QtGui.QColor) -> None:
+    if _flag(act, _NO_TINT_PROP):
+        return
+    ic = act.icon()
+    if not ic.isNull():
+        tinted = _tinted_icons(act, [ic], color)[0]
+        if tinted.cacheKey() != ic.cacheKey():
+            act.setIcon(tinted)
+        act.setProperty(_TINTED_PROP, True)
+
+def _tint_widget(w: QtWidgets.QWidget, color: QtGui.QColor) -> None:
+    """Tint the icons of a single widget and of the actions it holds."""
+    if _flag(w, _NO_TINT_PROP):
+        return
+
+    # Common containers of actions
+    for act in w.actions():
+        _tint_action(act, color)
+
+    # Buttons
+    if isinstance(w, QtWidgets.QAbstractButton):
+        ic = w.icon()
         if not ic.isNull():
-            act.setIcon(_colorize_icon(ic, color))
-            act.setProperty(_TINTED_PROP, True)
+            tinted = _tinted_icons(w, [ic], color)[0]
+            if tinted.cacheKey() != ic.cacheKey():
+                w.setIcon(tinted)
+            w.setProperty(_TINTED_PROP, True)
+
+    # Tabs
+    if isinstance(w, QtWidgets.QTabBar):
+        icons = [w.tabIcon(i) for i in range(w.count())]
+        for i, (ic, tinted) in enumerate(zip(icons, _tinted_icons(w, icons, color))):
+            if tinted.cacheKey() != ic.cacheKey():
+                w.setTabIcon(i, tinted)
 
+def _tint_widget_icons(color: QtGui.QColor, default_px: int = 24) -> None:
     for w in QtWidgets.QApplication.allWidgets():
-        if w.property(_NO_TINT_PROP) is True:
-            continue
+        _tint_widget(w, color)
+
+# Time budget for one tinting pass, see ``set_tint_time_budget``.
+_TINT_BUDGET_MS = 8.0
 
-        # Common containers of actions
-        for act in w.actions():
-            tint_action(act)
+def set_tint_time_budget(milliseconds: float) -> None:
+    """Set how long one deferred icon tinting pass may run.
 
-        # Buttons
-        if isinstance(w, QtWidgets.QAbstractButton):
-            ic = w.icon()
-            if not ic.isNull() and w.property(_TINTED_PROP) is not True:
-                w.setIcon(_colorize_icon(ic, color))
-                w.setProperty(_TINTED_PROP, True)
+    Widgets and actions waiting to be tinted are processed in slices of
+    at most *milliseconds* per event-loop iteration so very large UIs do
+    not freeze while their icons are tinted.  A value of ``0`` or less
+    disables slicing.  The default is 8 ms.
+    """
+    global _TINT_BUDGET_MS
+    _TINT_BUDGET_MS = float(milliseconds)
 
-        # Tabs
-        if isinstance(w, QtWidgets.QTabBar):
-            for i in range(w.count()):
-                ic = w.tabIcon(i)
-                if not ic.isNull():
-                    w.setTabIcon(i, _colorize_icon(ic, color))
+class _TintScheduler(QtCore.QObject):
+    """Coalesces icon tinting work into deferred, time-sliced passes.
+
+    Widgets and actions are collected into dirty sets (duplicates are
+    ignored) and processed on the next event-loop turn by a single-shot
+    zero-interval timer.  When a pass exceeds the time budget the rest
+    of the work is left for the following turn.
+    """
+
+    def __init__(self, color: QtGui.QColor, parent=None):
+        super().__init__(parent)
+        self.color = color
+        self._widgets: Dict[int, QtWidgets.QWidget] = {}
+        self._actions: Dict[int, QtGui.QAction] = {}
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._run)
+
+    def add_widget(self, widget: QtWidgets.QWidget) -> None:
+        self._widgets[id(widget)] = widget
+        self._schedule()
+
+    def add_action(self, action: QtGui.QAction) -> None:
+        self._actions[id(action)] = action
+        self._schedule()
+
+    def pending(self) -> int:
+        return len(self._widgets) + len(self._actions)
+
+    def flush(self) -> None:
+        """Process all pending work immediately."""
+        self._timer.stop()
+        self._process(deadline=None)
+
+    def _schedule(self) -> None:
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _run(self) -> None:
+        budget = _TINT_BUDGET_MS
+        deadline = time.perf_counter() + budget / 1000.0 if budget > 0 else None
+        self._process(deadline)
+        if self.pending():
+            self._timer.start()
+
+    def _process(self, deadline) -> None:
+        color = self.color
+        queues = ((self._actions, _tint_action), (self._widgets, _tint_widget))
+        for queue, tint in queues:
+            while queue:
+                if deadline is not None and time.perf_counter() >= deadline:
+                    return
+                # Oldest entry first
+                obj = queue.pop(next(iter(queue)))
+                try:
+                    tint(obj, color)
+                except RuntimeError:
+                    # The object was deleted before the pass ran
+                    continue
 
 class _IconTintFilter(QtCore.QObject):
+    """Tints icons of widgets as they are polished, shown or get actions.
+
+    Only the widget (or action) that the event refers to is queued on
+    the scheduler; children receive their own Polish/Show events.  All
+    queued work is tinted together on a later event-loop turn, so
+    constructing a window costs O(N) instead of walking every widget of
+    the application for each event.
+    """
+
     def __init__(self, color: QtGui.QColor, default_px: int = 24, parent=None):
         super().__init__(parent)
+        self._scheduler = _TintScheduler(color, parent=self)
+        self.set_color(color, default_px)
+
+    def set_color(self, color: QtGui.QColor, default_px: int = 24) -> None:
         self._color = color
         self._px = default_px
+        self._scheduler.color = color
 
     def eventFilter(self, obj, ev):
         t = ev.type()
         if t in (QtCore.QEvent.Type.Polish, QtCore.QEvent.Type.Show):
             if isinstance(obj, QtWidgets.QWidget):
-                _tint_widget_icons(self._color, self._px)
-        if t == QtCore.QEvent.Type.ActionAdded:
+                self._scheduler.add_widget(obj)
+        elif t == QtCore.QEvent.Type.ActionAdded:
             if isinstance(obj, QtWidgets.QWidget):
-                for act in obj.actions():
-                    if act.property(_NO_TINT_PROP) is not True and act.property(_TINTED_PROP) is not True:
-                        ic = act.icon()
-                        if not ic.isNull():
-                            act.setIcon(_colorize_icon(ic, self._color))
-                            act.setProperty(_TINTED_PROP, True)
+                self._scheduler.add_action(ev.action())
         return super().eventFilter(obj, ev)
 
 def _apply_global_icon_tint(app: QtWidgets.QApplication,
                             primary_color: str,
                             default_px: int = 24) -> None:
     color = QtGui.QColor(primary_color)
+    # Icons tinted for the previous theme are no longer needed
+    _TINT_CACHE.clear(keep_stats=True)
     _tint_widget_icons(color, default_px)
+    filt = getattr(app, "_icon_tint_filter", None)
+    if filt is not None and is_alive(filt):
+        # Already installed by an earlier call: just switch colour
+        filt.set_color(color, default_px)
+        return
     filt = _IconTintFilter(color, default_px, parent=app)
     app.installEventFilter(filt)
     app._icon_tint_filter = filt  # prevent GC
@@ -260,17 +611,28 @@ def _write_tinted_svg(src: Path, dest: Path, fill_hex: str) -> None:
     dest.write_text(text, encoding="utf-8")
     QtGui.QPixmapCache.remove(str(dest))
 
-def _prepare_arrow_icons(primary_hex: str) -> str:
-    base = Path(QtCore.QStandardPaths.writableLocation(
-        QtCore.QStandardPaths.StandardLocation.AppDataLocation
-    ))
-    outdir = base / "qmaterialise" / "icons" / primary_hex.lstrip("#")
-    outdir.mkdir(parents=True, exist_ok=True)
+def _search_prefix(alias: str) -> str:
+    # QDir search path prefixes may only contain letters and numbers
+    return re.sub(r"[^A-Za-z0-9]", "", alias)
+
+def _use_arrow_icons(alias: str, outdir: Path) -> bool:
+    """Point the *alias* search path at already prepared arrow icons.
 
-    write_svg_with_missing_fill_added(_ICONS_DIR / "arrow_drop_down.svg",
-                                      outdir / "down.svg", primary_hex)
-    write_svg_with_missing_fill_added(_ICONS_DIR / "arrow_drop_up.svg",
-                                      outdir / "up.svg", primary_hex)
+    Returns ``False`` (and leaves the search path alone) if any of the
+    arrow files is missing.
+    """
+    if not all((outdir / name).is_file() for name in _ARROW_SOURCES):
+        return False
+    QtCore.QDir.setSearchPaths(_search_prefix(alias), [str(outdir)])
+    return True
+
+def _prepare_arrow_icons(primary_hex: str, alias: str = "icons") -> str:
+    """Make ``down.svg``/``up.svg`` in *primary_hex* available under *alias*.
 
-    QtCore.QDir.setSearchPaths("icons", [str(outdir)])
-    return "icons:"
\ No newline at end of file
+    Returns the search path prefix (e.g. ``"arrowactive:"``) to prepend to
+    the file names in the stylesheet.
+    """
+    outdir = _ensure_arrow_icons(primary_hex)
+    prefix = _search_prefix(alias)
+    QtCore.QDir.setSearchPaths(prefix, [str(outdir)])
+    return f"{prefix}:"
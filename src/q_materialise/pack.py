@@ -0,0 +1,141 @@
+"""Precompiled pack of the built-in styles.
+
+The built-in styles are edited as one JSON file per style in the
+``styles`` directory.  Reading them all (for a theme gallery, say)
+means one file open, one JSON parse and one round of colour derivation
+per style.  The pack collects every style, with all derived colours
+already computed, into a single ``styles_pack.json`` that the style
+registry loads with one read.
+
+The loose JSON files stay the source of truth.  After editing them,
+rebuild the pack with::
+
+    python -m q_materialise.pack
+
+and verify it with ``python -m q_materialise.pack --check``, which exits
+with a non-zero status if the pack is out of sync.
+
+This module has no dependency on Qt.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from .cache import _atomic_write
+from .style import Style
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+PACK_PATH = _PACKAGE_DIR / "styles_pack.json"
+
+# Bump when the layout of the pack changes; packs in another format are
+# ignored and the loose style files are read instead.
+FORMAT = 1
+
+
+def _compile(directory: Path) -> Dict[str, Dict[str, Any]]:
+    styles: Dict[str, Dict[str, Any]] = {}
+    for path in sorted(directory.glob("*.json")):
+        if path.is_file():
+            with path.open(encoding="utf-8") as f:
+                styles[path.stem] = Style.from_dict(json.load(f)).to_dict()
+    return styles
+
+
+def _dumps(styles: Dict[str, Dict[str, Any]]) -> str:
+    data = {"format": FORMAT, "styles": styles}
+    return json.dumps(data, indent=1, sort_keys=True) + "\n"
+
+
+def read_pack(path: Union[str, Path]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Returns the styles stored in a pack keyed by name.
+
+    Each value is a complete :meth:`Style.to_dict` mapping.  A missing,
+    unreadable or incompatible pack is reported as ``None``.
+    """
+    try:
+        with Path(path).open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("format") != FORMAT:
+        return None
+    styles = data.get("styles")
+    return styles if isinstance(styles, dict) else None
+
+
+def build_pack(
+    directory: Union[str, Path] = _PACKAGE_DIR / "styles",
+    dest: Union[str, Path] = PACK_PATH,
+) -> Path:
+    """Compiles the style files in ``directory`` into a pack.
+
+    Args:
+        directory (Union[str, Path], optional): Directory of style JSON
+            files. Defaults to the built-in styles.
+        dest (Union[str, Path], optional): The pack to write. Defaults
+            to the one bundled with the package.
+
+    Returns:
+        Path: The path of the written pack.
+    """
+    dest = Path(dest)
+    _atomic_write(dest, _dumps(_compile(Path(directory))).encode("utf-8"), 0o644)
+    return dest
+
+
+def check_pack(
+    directory: Union[str, Path] = _PACKAGE_DIR / "styles",
+    pack: Union[str, Path] = PACK_PATH,
+) -> List[str]:
+    """Compares a pack with the style files it was built from.
+
+    Args:
+        directory (Union[str, Path], optional): Directory of style JSON
+            files. Defaults to the built-in styles.
+        pack (Union[str, Path], optional): The pack to check. Defaults
+            to the one bundled with the package.
+
+    Returns:
+        List[str]: Sorted names of the styles that are missing from the
+        pack, differ from their source or no longer have a source.
+        Empty if the pack is in sync.  If the pack cannot be read at
+        all, every source style is reported.
+    """
+    expected = _compile(Path(directory))
+    packed = read_pack(pack) or {}
+    return sorted(
+        name
+        for name in expected.keys() | packed.keys()
+        if expected.get(name) != packed.get(name)
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m q_materialise.pack", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="verify the pack instead of rebuilding it",
+    )
+    args = parser.parse_args(argv)
+    if args.check:
+        stale = check_pack()
+        if stale:
+            names = ", ".join(stale)
+            print(f"{PACK_PATH.name} is out of sync: {names}", file=sys.stderr)
+            return 1
+        print(f"{PACK_PATH.name} is up to date")
+        return 0
+    print(build_pack())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
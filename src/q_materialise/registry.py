@@ -0,0 +1,269 @@
+"""Indexed lookup of style definitions.
+
+Styles are JSON files named after the style, kept in one or more
+directories: the built-in ``styles`` folder and any folders of custom
+styles an application registers.  :class:`StyleRegistry` indexes those
+directories once and keeps every parsed :class:`~q_materialise.style.Style`,
+so repeated calls to :func:`~q_materialise.list_styles` and
+:func:`~q_materialise.get_style` do not touch the filesystem beyond a
+``stat`` per directory and per loaded file.  Those ``stat`` calls
+revalidate the cache: a directory is listed again when its modification
+time changes (a style was added, removed or renamed) and a file is
+parsed again when its modification time or size changes.
+
+A directory can be backed by a pack (see :mod:`q_materialise.pack`).
+While the pack exists it replaces the directory: names and styles are
+read from the pack in one go, and only the pack and the directory are
+revalidated.  When the pack is read, and again whenever the directory
+changes, the style files are checked against it: if any of them is
+newer than the pack, a warning is issued and the files are read
+instead until the pack is rebuilt.  Edits made in place while the
+pack is in use are only noticed once the directory changes.
+
+The cached styles are never handed out; callers receive copies they
+are free to modify.
+
+This module has no dependency on Qt.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import warnings
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .pack import read_pack
+from .style import Style
+
+
+class StyleInfo(NamedTuple):
+    """Where a registered style is defined."""
+
+    name: str
+    path: Path
+
+
+def _copy(style: Style) -> Style:
+    dup = copy.copy(style)
+    dup.extras = copy.deepcopy(style.extras)
+    return dup
+
+
+def _newer_files(directory: Path, mtime_ns: int) -> List[str]:
+    """Returns the sorted names of style files modified after ``mtime_ns``."""
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".json")
+                and entry.is_file()
+                and entry.stat().st_mtime_ns > mtime_ns
+            )
+    except OSError:
+        return []
+
+
+class StyleRegistry:
+    """An index of the style files in a list of directories.
+
+    Directories are searched in order and the first one defining a name
+    wins.  Directories that do not exist are treated as empty, so a
+    user style folder can be registered before it is created.
+
+    Args:
+        directories (Iterable[Union[str, Path]], optional): The
+            directories to index. Defaults to none.
+        packs (Optional[Mapping[Union[str, Path], Union[str, Path]]], optional):
+            Packs to read instead of some of the directories, keyed by
+            directory. Defaults to none.
+    """
+
+    def __init__(
+        self,
+        directories: Iterable[Union[str, Path]] = (),
+        packs: Optional[Mapping[Union[str, Path], Union[str, Path]]] = None,
+    ) -> None:
+        self._directories: List[Path] = [Path(d) for d in directories]
+        self._packs: Dict[Path, Path] = {
+            Path(d): Path(p) for d, p in (packs or {}).items()
+        }
+        # Directory -> (modification time, style name -> file)
+        self._listings: Dict[Path, Tuple[Any, Dict[str, Path]]] = {}
+        # Directory -> stamp of a pack that could not be read or is stale
+        self._rejected: Dict[Path, Any] = {}
+        # File -> packed style, as a mapping until first requested
+        self._packed: Dict[Path, Union[Mapping[str, Any], Style]] = {}
+        # File -> ((modification time, size), parsed style)
+        self._styles: Dict[Path, Tuple[Tuple[int, int], Style]] = {}
+        self._index: Dict[str, StyleInfo] = {}
+        self._index_stamps: Optional[Tuple[Any, ...]] = None
+
+    @property
+    def directories(self) -> Tuple[Path, ...]:
+        """The indexed directories in search order."""
+        return tuple(self._directories)
+
+    def add_directory(self, directory: Union[str, Path]) -> None:
+        """Searches ``directory`` before the directories already indexed.
+
+        Styles in it therefore override styles of the same name defined
+        elsewhere, including the built-in ones.  Adding a directory again
+        moves it to the front.
+        """
+        path = Path(directory)
+        if path in self._directories:
+            self._directories.remove(path)
+        self._directories.insert(0, path)
+        self._index_stamps = None
+
+    def remove_directory(self, directory: Union[str, Path]) -> bool:
+        """Stops indexing ``directory``.
+
+        Returns:
+            bool: ``True`` if the directory was indexed.
+        """
+        path = Path(directory)
+        if path not in self._directories:
+            return False
+        self._directories.remove(path)
+        self._forget_packed(path)
+        self._listings.pop(path, None)
+        self._index_stamps = None
+        return True
+
+    def index(self) -> Dict[str, StyleInfo]:
+        """Returns the registered styles keyed by name.
+
+        The returned mapping must not be modified.
+        """
+        stamps = tuple(self._refresh(directory) for directory in self._directories)
+        if stamps != self._index_stamps:
+            index: Dict[str, StyleInfo] = {}
+            for directory in self._directories:
+                for name, path in self._listings[directory][1].items():
+                    index.setdefault(name, StyleInfo(name, path))
+            self._index = index
+            self._index_stamps = stamps
+        return self._index
+
+    def names(self) -> List[str]:
+        """Returns the sorted names of all registered styles."""
+        return sorted(self.index())
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.index()
+
+    def get(self, name: str) -> Style:
+        """Returns a copy of the style called ``name``.
+
+        Raises:
+            FileNotFoundError: If no directory defines the style.
+            json.JSONDecodeError: If the style file is invalid.
+        """
+        info = self.index().get(name)
+        if info is None:
+            where = ", ".join(str(d) for d in self._directories)
+            raise FileNotFoundError(f"Style '{name}' not found in {where}")
+        style = self._packed.get(info.path)
+        if style is None:
+            style = self._parsed(info.path)
+        elif not isinstance(style, Style):
+            style = self._packed[info.path] = Style.from_dict(style)
+        return _copy(style)
+
+    def clear(self) -> None:
+        """Forgets all listings and parsed styles."""
+        self._listings.clear()
+        self._rejected.clear()
+        self._packed.clear()
+        self._styles.clear()
+        self._index = {}
+        self._index_stamps = None
+
+    def _refresh(self, directory: Path) -> Any:
+        """Lists ``directory`` again if it changed; returns its stamp."""
+        try:
+            stamp: Optional[int] = directory.stat().st_mtime_ns
+        except OSError:
+            stamp = None
+        pack = self._packs.get(directory)
+        if pack is not None:
+            try:
+                stat = pack.stat()
+            except OSError:
+                pass
+            else:
+                # The directory is part of the stamp so that files added
+                # or replaced later are checked against the pack.
+                pack_stamp = (stat.st_mtime_ns, stat.st_size, stamp)
+                if self._rejected.get(directory) != pack_stamp and self._refresh_pack(
+                    directory, pack, pack_stamp
+                ):
+                    return pack_stamp
+        cached = self._listings.get(directory)
+        if cached is None or cached[0] != stamp:
+            self._forget_packed(directory)
+            files: Dict[str, Path] = {}
+            if stamp is not None:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".json") and entry.is_file():
+                            files[entry.name[: -len(".json")]] = Path(entry.path)
+            self._listings[directory] = (stamp, files)
+        return stamp
+
+    def _refresh_pack(self, directory: Path, pack: Path, stamp: Any) -> bool:
+        """Lists a directory from its pack; ``False`` if that is unusable."""
+        cached = self._listings.get(directory)
+        if cached is not None and cached[0] == stamp:
+            return True
+        newer = _newer_files(directory, stamp[0])
+        if newer:
+            warnings.warn(
+                f"{pack} is older than {', '.join(newer)} in {directory}; "
+                "reading the style files instead.  Rebuild the pack with "
+                "python -m q_materialise.pack."
+            )
+            self._rejected[directory] = stamp
+            return False
+        styles = read_pack(pack)
+        if styles is None:
+            self._rejected[directory] = stamp
+            return False
+        self._forget_packed(directory)
+        files = {name: directory / f"{name}.json" for name in styles}
+        for name, path in files.items():
+            self._packed[path] = styles[name]
+        self._listings[directory] = (stamp, files)
+        return True
+
+    def _forget_packed(self, directory: Path) -> None:
+        cached = self._listings.get(directory)
+        if cached is not None:
+            for path in cached[1].values():
+                self._packed.pop(path, None)
+
+    def _parsed(self, path: Path) -> Style:
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._styles.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        with path.open(encoding="utf-8") as f:
+            style = Style.from_dict(json.load(f))
+        self._styles[path] = (stamp, style)
+        return style
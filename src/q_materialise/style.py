@@ -14,13 +14,19 @@ explicitly for full control.
 
 Styles are serialisable to and from JSON to facilitate easy editing and storage.
 See the `Style.to_json` and `Style.from_json` methods for details.
+
+`FrozenStyle` is an immutable, hashable counterpart of `Style` for use as a
+cache key or when holding many styles at once.  Convert between the two with
+`Style.freeze` and `FrozenStyle.thaw`.
 """
 
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field
-from typing import Any, Dict, Mapping, Optional
+import sys
+from dataclasses import FrozenInstanceError, dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NoReturn, Optional, Tuple
 
 from . import utils
 
@@ -173,8 +179,6 @@ class Style:
         # directly to the dataclass constructor. This allows style JSON files
         # to include arbitrary extra keys (e.g. ``danger``, ``warning``, etc.)
         # which will be available via ``style.extras``.
-        from dataclasses import fields
-
         known = {f.name for f in fields(cls)}
         kwargs: Dict[str, Any] = {}
         extras: Dict[str, Any] = {}
@@ -205,3 +209,174 @@ class Style:
         """
         data = json.loads(json_string)
         return cls.from_dict(data)
+
+    def freeze(self) -> "FrozenStyle":
+        """Returns an immutable, hashable copy of the style.
+
+        Returns:
+            FrozenStyle: A `FrozenStyle` with the same attributes.
+        """
+        return FrozenStyle._from_style(self)
+
+
+# Attribute names in declaration order; ``extras`` is last.
+_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(Style))
+# Key order of ``Style.to_dict``.
+_DICT_KEYS: Tuple[str, ...] = tuple(Style("", "#000000", "#000000").to_dict())
+
+
+def _freeze(value: Any) -> Any:
+    """Returns a read-only copy of a JSON-like value."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Reverses :func:`_freeze`."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _hashable(value: Any) -> Any:
+    """Converts a frozen value into something ``hash`` accepts."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    if isinstance(value, tuple):
+        return tuple(_hashable(v) for v in value)
+    return value
+
+
+class FrozenStyle:
+    """An immutable, hashable variant of `Style`.
+
+    A `FrozenStyle` has the same attributes and serialisation methods as
+    `Style` and is accepted wherever a style is, but its attributes cannot
+    be assigned.  It can therefore be used as a dictionary key or set
+    member, e.g. in caches keyed by style.  The hash is computed once on
+    construction and equality compares it before the attributes, so
+    lookups are cheap.
+
+    Instances are slotted and keep their attributes in a single tuple with
+    interned colour strings, so holding thousands of generated variants
+    costs a fraction of the memory of the equivalent `Style` objects.
+
+    The constructor takes the same arguments as `Style` and derives
+    missing colours the same way.  `extras` is a read-only mapping;
+    nested mappings and lists in it become read-only mappings and tuples.
+    """
+
+    __slots__ = ("_values", "_hash", "_fingerprint")
+
+    name: str
+    primary: str
+    secondary: str
+    is_dark: bool
+    background: str
+    surface: str
+    error: str
+    primary_light: str
+    primary_dark: str
+    secondary_light: str
+    secondary_dark: str
+    on_primary: str
+    on_secondary: str
+    on_background: str
+    on_surface: str
+    on_error: str
+    extras: Mapping[str, Any]
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self._assign(Style(*args, **kwargs))
+
+    @classmethod
+    def _from_style(cls, style: Style) -> "FrozenStyle":
+        frozen = cls.__new__(cls)
+        frozen._assign(style)
+        return frozen
+
+    def _assign(self, style: Style) -> None:
+        values = tuple(_freeze(getattr(style, name)) for name in _FIELDS)
+        key = values[:-1] + (_hashable(values[-1]),)
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "_hash", hash(key))
+        # Stable digest of the attributes, filled in by
+        # ``cache.style_fingerprint`` on first use.
+        object.__setattr__(self, "_fingerprint", None)
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> NoReturn:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, FrozenStyle):
+            return NotImplemented
+        return self._hash == other._hash and self._values == other._values
+
+    def __repr__(self) -> str:
+        args = ", ".join(
+            f"{name}={value!r}" for name, value in zip(_FIELDS, self._values)
+        )
+        return f"{type(self).__name__}({args})"
+
+    def __reduce__(self) -> Any:
+        return (type(self).from_dict, (self.to_dict(),))
+
+    def __copy__(self) -> "FrozenStyle":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenStyle":
+        return self
+
+    def thaw(self) -> Style:
+        """Returns a mutable `Style` with the same attributes."""
+        return Style.from_dict(self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a dictionary representation of the style.
+
+        The result is the same as `Style.to_dict` for the thawed style.
+        """
+        data = dict(zip(_FIELDS, self._values))
+        data["extras"] = _thaw(data["extras"])
+        return {key: data[key] for key in _DICT_KEYS}
+
+    def to_json(self, **json_kwargs: Any) -> str:
+        """Serialises the style to a JSON string.
+
+        Additional keyword arguments are passed through to `json.dumps`.
+        """
+        return json.dumps(self.to_dict(), **json_kwargs)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "FrozenStyle":
+        """Constructs a `FrozenStyle` from a mapping, like `Style.from_dict`."""
+        return cls._from_style(Style.from_dict(data))
+
+    @classmethod
+    def from_json(cls, json_string: str) -> "FrozenStyle":
+        """Constructs a `FrozenStyle` from a JSON string."""
+        return cls.from_dict(json.loads(json_string))
+
+
+def _field(index: int) -> property:
+    return property(lambda self: self._values[index])
+
+
+for _index, _name in enumerate(_FIELDS):
+    setattr(FrozenStyle, _name, _field(_index))
+del _index, _name
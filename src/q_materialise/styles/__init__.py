@@ -6,6 +6,12 @@ Additional styles can be added by dropping a `*.json` file into this directory.
 Each file must contain a mapping compatible with the
 `q_materialise.style.Style` constructor.
 
+The styles are loaded from the precompiled ``styles_pack.json`` next to
+this directory.  After adding or editing a file here, rebuild it with
+``python -m q_materialise.pack`` (``--check`` verifies it is in sync).
+Until then the files newer than the pack are noticed, a warning is
+issued and the files are read instead of the pack.
+
 Note:
     You should not import anything from this module directly. Instead, use
     `q_materialise.list_styles` and `q_materialise.get_style` to discover and
@@ -0,0 +1,359 @@
+"""Compiled QSS templates.
+
+The built‑in stylesheet is a large text template using ``str.format``
+syntax: placeholders are written as ``{NAME}`` and literal braces are
+escaped by doubling them (``{{`` and ``}}``).  Formatting the template
+with ``str.format`` re-parses the whole text on every call, which is
+wasteful when the same template is rendered many times (for example
+when switching themes at run time).
+
+:class:`CompiledTemplate` parses the template once into a list of
+literal chunks and placeholder slots.  Rendering is then a single
+``str.join`` over the chunks, and :meth:`CompiledTemplate.patch`
+updates only the slots belonging to the variables that changed.
+:attr:`CompiledTemplate.rules` splits a stylesheet template into its
+rules so callers can tell which rules a change of variables affects,
+and :meth:`CompiledTemplate.substitute` fixes some placeholders to
+constant text, e.g. to refer to palette roles instead of colours.
+
+This module has no dependency on Qt.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+# Escaped braces or a placeholder consisting of a plain identifier.
+# Anything else containing a brace is rejected by the parser below.
+_TOKEN_RE = re.compile(r"\{\{|\}\}|\{([A-Za-z_][A-Za-z0-9_]*)\}|[{}]")
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+# Quoted strings and attribute selectors, which may contain any of the
+# characters the selector helpers below look for.
+_STRING_RE = re.compile(r"\"[^\"]*\"|'[^']*'")
+_ATTRIBUTE_RE = re.compile(r"\[[^\]]*\]")
+_TYPE_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*|\*")
+_PALETTE_RE = re.compile(r"palette\(\s*([A-Za-z-]+)\s*\)")
+
+
+class Rule(NamedTuple):
+    """A single ``selectors { declarations }`` rule of a template.
+
+    Attributes:
+        selectors: The comma separated selectors with comments removed.
+        body: The declaration block, braces included, as a template of
+            its own.
+        names: Placeholder names used in the declaration block.
+        properties: Names of the properties the rule declares.
+        roles: Palette roles the rule refers to with ``palette(...)``.
+    """
+
+    selectors: Tuple[str, ...]
+    body: "CompiledTemplate"
+    names: FrozenSet[str]
+    properties: FrozenSet[str]
+    roles: FrozenSet[str]
+
+
+def _declared_properties(body: "CompiledTemplate") -> FrozenSet[str]:
+    text = _COMMENT_RE.sub("", "".join(body.literals)).strip("{} \n\t")
+    return frozenset(
+        decl.split(":", 1)[0].strip().lower()
+        for decl in text.split(";")
+        if ":" in decl
+    )
+
+
+def _palette_roles(body: "CompiledTemplate") -> FrozenSet[str]:
+    text = _COMMENT_RE.sub("", "".join(body.literals))
+    return frozenset(role.lower() for role in _PALETTE_RE.findall(text))
+
+
+def split_selectors(text: str) -> Tuple[str, ...]:
+    """Splits a selector list at the top-level commas.
+
+    Comments are removed and whitespace is normalised.  Commas inside
+    attribute selectors or quoted strings do not split.
+    """
+    text = _COMMENT_RE.sub(" ", text)
+    selectors: List[str] = []
+    depth = 0
+    quote: Optional[str] = None
+    start = 0
+    for i, ch in enumerate(text):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            selectors.append(text[start:i])
+            start = i + 1
+    selectors.append(text[start:])
+    return tuple(" ".join(sel.split()) for sel in selectors if sel.strip())
+
+
+def selector_subject(selector: str) -> Tuple[str, str, str]:
+    """Splits a selector around the type name of its subject.
+
+    The subject is the last compound selector, i.e. the part after the
+    last descendant or child combinator.  For ``"QMenuBar QMenu::item"``
+    the result is ``("QMenuBar ", "QMenu", "::item")``.  Universal
+    subjects (``*`` or no type name at all) have an empty type name.
+
+    Returns:
+        Tuple[str, str, str]: The text before the subject's type name,
+        the type name and the remainder of the selector.
+    """
+    masked = _ATTRIBUTE_RE.sub(lambda m: "_" * len(m.group(0)), selector)
+    start = max(masked.rfind(" "), masked.rfind(">")) + 1
+    while start < len(selector) and selector[start] == " ":
+        start += 1
+    match = _TYPE_RE.match(selector, start)
+    if match is None:
+        return selector[:start], "", selector[start:]
+    name = match.group(0)
+    return selector[:start], "" if name == "*" else name, selector[match.end() :]
+
+
+def selector_specificity(selector: str) -> Tuple[int, int, int]:
+    """Returns the specificity of a selector as Qt computes it.
+
+    The result counts ID selectors, then attribute selectors, pseudo
+    states and sub-controls, then type names; ``*`` does not count.
+    """
+    text = _STRING_RE.sub('""', selector)
+    attributes = len(_ATTRIBUTE_RE.findall(text))
+    text = _ATTRIBUTE_RE.sub("", text)
+    ids = len(re.findall(r"#[A-Za-z_]", text))
+    pseudos = len(re.findall(r"::?[A-Za-z_]", text))
+    types = 0
+    for compound in re.split(r"[\s>]+", text):
+        match = _TYPE_RE.match(compound)
+        if match is not None and match.group(0) != "*":
+            types += 1
+    return ids, attributes + pseudos, types
+
+
+class CompiledTemplate:
+    """A ``str.format`` style template parsed into literals and slots.
+
+    The rendered output of :meth:`render` is identical to
+    ``source.format(**variables)`` for templates that only use plain
+    ``{NAME}`` placeholders (no format specs, conversions, attribute
+    or index lookups).
+
+    Attributes:
+        source: The template text the instance was compiled from.
+        literals: Literal chunks with escaped braces already collapsed.
+            There is always exactly one more literal than there are
+            slots.
+        slots: Placeholder names in order of appearance.
+        offsets: Offset in ``source`` at which each slot's placeholder
+            starts, parallel to ``slots``.
+    """
+
+    __slots__ = (
+        "source",
+        "literals",
+        "slots",
+        "offsets",
+        "_skeleton",
+        "_index",
+        "_rules",
+    )
+
+    def __init__(self, source: str) -> None:
+        literals: List[str] = []
+        slots: List[str] = []
+        offsets: List[int] = []
+        chunk: List[str] = []
+        pos = 0
+        for match in _TOKEN_RE.finditer(source):
+            token = match.group(0)
+            name = match.group(1)
+            if name is None and len(token) == 1:
+                raise ValueError(
+                    f"Single {token!r} encountered in template at offset "
+                    f"{match.start()}"
+                )
+            chunk.append(source[pos : match.start()])
+            pos = match.end()
+            if name is None:
+                chunk.append(token[0])
+                continue
+            literals.append("".join(chunk))
+            chunk = []
+            slots.append(name)
+            offsets.append(match.start())
+        chunk.append(source[pos:])
+        literals.append("".join(chunk))
+
+        self.source = source
+        self.literals: Tuple[str, ...] = tuple(literals)
+        self.slots: Tuple[str, ...] = tuple(slots)
+        self.offsets: Tuple[int, ...] = tuple(offsets)
+
+        # Interleaved [literal, slot, literal, slot, ..., literal] list
+        # used as the starting point for every render.
+        skeleton: List[str] = [literals[0]]
+        for literal in literals[1:]:
+            skeleton.append("")
+            skeleton.append(literal)
+        self._skeleton = skeleton
+
+        index: Dict[str, List[int]] = {}
+        for i, slot in enumerate(slots):
+            index.setdefault(slot, []).append(2 * i + 1)
+        self._index = {name: tuple(pos) for name, pos in index.items()}
+        self._rules: Optional[Tuple[Rule, ...]] = None
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Distinct placeholder names in order of first appearance."""
+        return tuple(self._index)
+
+    @property
+    def rules(self) -> Tuple[Rule, ...]:
+        """The template's stylesheet rules in source order.
+
+        Every ``{{ ... }}`` block together with the selector text in
+        front of it forms one rule.  Parsed on first access.
+        """
+        if self._rules is None:
+            rules: List[Rule] = []
+            selector_start = 0
+            block_start = -1
+            for match in _TOKEN_RE.finditer(self.source):
+                token = match.group(0)
+                if token == "{{" and block_start < 0:
+                    block_start = match.start()
+                elif token == "}}" and block_start >= 0:
+                    body = CompiledTemplate(self.source[block_start : match.end()])
+                    rules.append(
+                        Rule(
+                            split_selectors(self.source[selector_start:block_start]),
+                            body,
+                            frozenset(body.slots),
+                            _declared_properties(body),
+                            _palette_roles(body),
+                        )
+                    )
+                    selector_start = match.end()
+                    block_start = -1
+            self._rules = tuple(rules)
+        return self._rules
+
+    def substitute(
+        self,
+        values: Mapping[str, str],
+        where: Optional[Callable[[int], bool]] = None,
+    ) -> "CompiledTemplate":
+        """Returns a template with some placeholders replaced by fixed text.
+
+        Args:
+            values (Mapping[str, str]): Replacement text keyed by
+                placeholder name.  Braces in it are escaped.
+            where (Optional[Callable[[int], bool]], optional): Called
+                with the index of each slot of a name in ``values``;
+                only slots for which it returns ``True`` are replaced.
+                Defaults to replacing every such slot.
+
+        Returns:
+            CompiledTemplate: The new template.  Placeholders that were
+            not replaced keep their names.
+        """
+        pieces: List[str] = []
+        pos = 0
+        for i, (name, offset) in enumerate(zip(self.slots, self.offsets)):
+            if name not in values or (where is not None and not where(i)):
+                continue
+            pieces.append(self.source[pos:offset])
+            pieces.append(values[name].replace("{", "{{").replace("}", "}}"))
+            pos = offset + len(name) + 2
+        pieces.append(self.source[pos:])
+        return CompiledTemplate("".join(pieces))
+
+    def slot_positions(self, name: str) -> Tuple[int, ...]:
+        """Returns the indices of ``name``'s slots in a parts list.
+
+        Args:
+            name (str): A placeholder name.
+
+        Returns:
+            Tuple[int, ...]: Indices into the list returned by
+            :meth:`render_parts`.  Empty if ``name`` is not used.
+        """
+        return self._index.get(name, ())
+
+    def render_parts(self, variables: Mapping[str, object]) -> List[str]:
+        """Renders the template into an interleaved list of strings.
+
+        The result alternates literal chunks and substituted values and
+        can be passed to :meth:`patch` for incremental re-rendering.
+
+        Args:
+            variables (Mapping[str, object]): Values for every
+                placeholder.  Values are converted with ``str``.
+
+        Returns:
+            List[str]: The rendered parts; ``"".join(parts)`` is the
+            rendered template.
+
+        Raises:
+            KeyError: If a placeholder has no value in ``variables``.
+        """
+        parts = self._skeleton[:]
+        parts[1::2] = [str(variables[name]) for name in self.slots]
+        return parts
+
+    def render(self, variables: Mapping[str, object]) -> str:
+        """Renders the template to a string.
+
+        Args:
+            variables (Mapping[str, object]): Values for every placeholder.
+
+        Returns:
+            str: The rendered template.
+
+        Raises:
+            KeyError: If a placeholder has no value in ``variables``.
+        """
+        return "".join(self.render_parts(variables))
+
+    def patch(self, parts: List[str], changes: Mapping[str, object]) -> str:
+        """Updates a rendered parts list in place and returns the new text.
+
+        Only the slots belonging to the names in ``changes`` are
+        touched, so re-rendering after a one-variable change costs a
+        handful of list assignments plus the final join.  Names that do
+        not occur in the template are ignored.
+
+        Args:
+            parts (List[str]): A list previously returned by
+                :meth:`render_parts` for this template.
+            changes (Mapping[str, object]): New values keyed by name.
+
+        Returns:
+            str: The re-rendered template.
+        """
+        index = self._index
+        for name, value in changes.items():
+            text = str(value)
+            for pos in index.get(name, ()):
+                parts[pos] = text
+        return "".join(parts)
@@ -4,12 +4,63 @@ This module exposes helpers to convert between hex strings and RGB
 tuples, adjust brightness and compute appropriate contrast colours.
 All functions in this module are pure and independent of any Qt
 classes, making them easy to unit test and reuse.
+
+Internally colours are handled as 24-bit integers packed as
+``0xRRGGBB``.  Parsing a hex string and formatting one are the
+expensive steps of every helper, so both are memoised and the
+arithmetic in between works on the packed integers; deriving a style
+parses each of its colours once however many helpers use it.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Tuple
 
+# Two lowercase hex digits for every channel value.
+_HEX_BYTES = tuple(f"{i:02x}" for i in range(256))
+
+
+@lru_cache(maxsize=1024)
+def _parse(hex_colour: str) -> int:
+    """Parses a hex colour string into a packed ``0xRRGGBB`` integer."""
+    s = hex_colour.strip().lstrip("#")
+    if len(s) == 3:
+        s = "".join(ch * 2 for ch in s)
+    if len(s) != 6:
+        raise ValueError(f"Invalid hex colour: {hex_colour}")
+    try:
+        r = int(s[0:2], 16)
+        g = int(s[2:4], 16)
+        b = int(s[4:6], 16)
+    except ValueError as e:
+        raise ValueError(f"Invalid hex colour: {hex_colour}") from e
+    return (r << 16) | (g << 8) | b
+
+
+@lru_cache(maxsize=1024)
+def _format(packed: int) -> str:
+    """Formats a packed colour as a ``#rrggbb`` string."""
+    return (
+        "#"
+        + _HEX_BYTES[packed >> 16]
+        + _HEX_BYTES[(packed >> 8) & 0xFF]
+        + _HEX_BYTES[packed & 0xFF]
+    )
+
+
+def _unpack(packed: int) -> Tuple[int, int, int]:
+    return packed >> 16, (packed >> 8) & 0xFF, packed & 0xFF
+
+
+def _pack(r: float, g: float, b: float) -> int:
+    """Packs channel values, truncating and clamping them to ``0–255``."""
+    return (
+        (max(0, min(255, int(r))) << 16)
+        | (max(0, min(255, int(g))) << 8)
+        | max(0, min(255, int(b)))
+    )
+
 
 def hex_to_rgb(hex_colour: str) -> Tuple[int, int, int]:
     """Convert a hex colour string to an RGB tuple.
@@ -28,18 +79,7 @@ def hex_to_rgb(hex_colour: str) -> Tuple[int, int, int]:
     Raises:
         ValueError: If the input is not a valid hex colour.
     """
-    s = hex_colour.strip().lstrip("#")
-    if len(s) == 3:
-        s = "".join(ch * 2 for ch in s)
-    if len(s) != 6:
-        raise ValueError(f"Invalid hex colour: {hex_colour}")
-    try:
-        r = int(s[0:2], 16)
-        g = int(s[2:4], 16)
-        b = int(s[4:6], 16)
-    except ValueError as e:
-        raise ValueError(f"Invalid hex colour: {hex_colour}") from e
-    return (r, g, b)
+    return _unpack(_parse(hex_colour))
 
 
 def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
@@ -55,8 +95,7 @@ def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
     Returns:
         str: A hex colour string like ``"#00ff00"``.
     """
-    r, g, b = (max(0, min(255, int(v))) for v in rgb)
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return _format(_pack(*rgb))
 
 
 def lighten(hex_colour: str, factor: float) -> str:
@@ -73,11 +112,10 @@ def lighten(hex_colour: str, factor: float) -> str:
     Returns:
         str: A new hex colour string representing a lighter colour.
     """
-    r, g, b = hex_to_rgb(hex_colour)
-    r = int(r + (255 - r) * factor)
-    g = int(g + (255 - g) * factor)
-    b = int(b + (255 - b) * factor)
-    return rgb_to_hex((r, g, b))
+    r, g, b = _unpack(_parse(hex_colour))
+    return _format(
+        _pack(r + (255 - r) * factor, g + (255 - g) * factor, b + (255 - b) * factor)
+    )
 
 
 def darken(hex_colour: str, factor: float) -> str:
@@ -94,11 +132,8 @@ def darken(hex_colour: str, factor: float) -> str:
     Returns:
         str: A new hex colour string representing a darker colour.
     """
-    r, g, b = hex_to_rgb(hex_colour)
-    r = int(r * (1 - factor))
-    g = int(g * (1 - factor))
-    b = int(b * (1 - factor))
-    return rgb_to_hex((r, g, b))
+    r, g, b = _unpack(_parse(hex_colour))
+    return _format(_pack(r * (1 - factor), g * (1 - factor), b * (1 - factor)))
 
 
 def perceived_brightness(hex_colour: str) -> float:
@@ -113,7 +148,7 @@ def perceived_brightness(hex_colour: str) -> float:
     Returns:
         float: Perceived brightness in the range ``0–255``.
     """
-    r, g, b = hex_to_rgb(hex_colour)
+    r, g, b = _unpack(_parse(hex_colour))
     return 0.299 * r + 0.587 * g + 0.114 * b
 
 
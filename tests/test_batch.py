@@ -0,0 +1,70 @@
+"""Tests for the vectorised colour helpers."""
+
+import random
+import unittest
+
+from q_materialise import utils
+
+try:
+    import numpy as np
+
+    from q_materialise import batch
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestBatchColours(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Build a mix of random and edge-case colours."""
+        rng = random.Random(4321)
+        self.colours = [f"#{rng.randrange(1 << 24):06x}" for _ in range(500)]
+        self.colours += ["#000", "#FFF", " #AbC ", "123456", "#FFFFFF", "#000000"]
+
+    def test_matches_scalar_helpers(self) -> None:
+        for f in (0, 0.1, 0.2, 1 / 3, 0.5, 1, -0.5, 1.5):
+            self.assertEqual(
+                batch.to_hex(batch.lighten(self.colours, f)),
+                [utils.lighten(c, f) for c in self.colours],
+            )
+            self.assertEqual(
+                batch.to_hex(batch.darken(self.colours, f)),
+                [utils.darken(c, f) for c in self.colours],
+            )
+        self.assertEqual(
+            batch.perceived_brightness(self.colours).tolist(),
+            [utils.perceived_brightness(c) for c in self.colours],
+        )
+        self.assertEqual(
+            batch.to_hex(batch.contrast_color(self.colours)),
+            [utils.contrast_color(c) for c in self.colours],
+        )
+
+    def test_round_trips_between_forms(self) -> None:
+        rgb = batch.to_rgb(self.colours)
+        self.assertEqual(rgb.dtype, np.uint8)
+        expected = [utils.hex_to_rgb(c) for c in self.colours]
+        self.assertEqual(rgb.tolist(), [list(c) for c in expected])
+        self.assertEqual(batch.to_hex(rgb), [utils.rgb_to_hex(c) for c in expected])
+        self.assertIs(batch.to_rgb(rgb), rgb)
+        self.assertEqual(batch.to_hex([(-5, 300, 12.7)]), ["#00ff0c"])
+        self.assertEqual(batch.to_rgb([]).shape, (0, 3))
+
+    def test_per_colour_factors(self) -> None:
+        factors = np.linspace(0, 1, len(self.colours))
+        self.assertEqual(
+            batch.to_hex(batch.lighten(self.colours, factors)),
+            [utils.lighten(c, f) for c, f in zip(self.colours, factors.tolist())],
+        )
+
+    def test_invalid_input_raises(self) -> None:
+        for colours in (["#12345"], ["#gggggg"], ["#abcde", "f#123456"]):
+            with self.assertRaises(ValueError):
+                batch.to_rgb(colours)
+        for rgb in (np.zeros((2, 4), dtype=int), [[0, 0, 256]], [[0.5, 0, 0]]):
+            with self.assertRaises(ValueError):
+                batch.lighten(rgb, 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
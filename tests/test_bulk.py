@@ -0,0 +1,61 @@
+"""Tests for generating and rendering styles in bulk."""
+
+import importlib
+import unittest
+
+SEEDS = [
+    ("ocean", "#0055aa", "#ffaa00"),
+    ("forest", "#2e7d32", "#a1887f", True),
+    {
+        "name": "dense",
+        "primary": "#6200ee",
+        "secondary": "#03dac6",
+        "extra": {"density_scale": "-1"},
+    },
+] * 4
+
+
+class TestBulkGeneration(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Import at run time; other test modules purge ``sys.modules``."""
+        # Worker processes look functions up by module path, so the
+        # module must be the one currently in ``sys.modules``.
+        self.bulk = importlib.import_module("q_materialise.bulk")
+        self.compiler = importlib.import_module("q_materialise.compiler")
+
+    def test_matches_single_style_calls(self) -> None:
+        styles = list(self.bulk.generate_styles(SEEDS))
+        self.assertEqual(
+            styles,
+            [
+                self.compiler.generate_style(s.name, s.primary, s.secondary, s.is_dark)
+                for s in map(self.bulk._seed, SEEDS)
+            ],
+        )
+        rendered = list(self.bulk.render_styles(SEEDS, use_palette=True))
+        self.assertEqual([name for name, _ in rendered], [s.name for s in styles])
+        self.assertEqual(
+            rendered[2][1],
+            self.compiler.compile_qss(
+                styles[2], {"density_scale": "-1"}, use_palette=True
+            ),
+        )
+
+    def test_process_pool_keeps_the_order(self) -> None:
+        self.assertEqual(
+            list(self.bulk.render_styles(SEEDS, workers=2, chunk_size=5)),
+            list(self.bulk.render_styles(SEEDS)),
+        )
+
+    def test_invalid_arguments_raise(self) -> None:
+        with self.assertRaises(TypeError):
+            list(self.bulk.generate_styles(["ocean"]))
+        # Raised by the call itself, before any result is requested
+        with self.assertRaises(ValueError):
+            self.bulk.generate_styles(SEEDS, chunk_size=0)
+        with self.assertRaises(ValueError):
+            self.bulk.render_styles(SEEDS, chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
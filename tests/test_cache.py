@@ -0,0 +1,107 @@
+"""Tests for the rendered stylesheet cache."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from q_materialise import core
+from q_materialise.cache import DiskCache, LRUCache, fingerprint
+from q_materialise.style import Style
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_stable_and_order_independent(self) -> None:
+        style = Style(name="a", primary="#ff0000", secondary="#00ff00")
+        same = Style(name="a", primary="#FF0000", secondary="#00ff00")
+        self.assertEqual(
+            fingerprint(style, {"a": 1, "b": 2}), fingerprint(same, {"b": 2, "a": 1})
+        )
+        self.assertEqual(fingerprint(style, None), fingerprint(style, {}))
+        self.assertNotEqual(fingerprint(style), fingerprint(style, {"a": 1}))
+
+    def test_derived_colours_change_fingerprint(self) -> None:
+        style = Style(name="a", primary="#ff0000", secondary="#00ff00")
+        other = Style(name="a", primary="#ff0001", secondary="#00ff00")
+        self.assertNotEqual(fingerprint(style), fingerprint(other))
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_lru_eviction_and_counters(self) -> None:
+        cache = LRUCache(maxsize=2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        self.assertEqual(cache.get("a"), "A")
+        cache.put("c", "C")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.info(), (1, 1, 2, 2))
+        self.assertTrue(cache.invalidate("a"))
+        self.assertNotIn("a", cache)
+        cache.maxsize = 0
+        self.assertEqual(len(cache), 0)
+
+    def test_repeated_render_skips_template(self) -> None:
+        style = core.generate_style("cached", "#336699", "#ff9900")
+        core.clear_stylesheet_cache()
+        with patch.object(core, "_prepare_arrow_icons") as prep, patch.object(
+            core, "_build_qss", wraps=core._build_qss
+        ) as render:
+            prep.side_effect = lambda *args: "icons:"
+            first = core._cached_qss(style, {"font_size": "12px"})
+            second = core._cached_qss(style, {"font_size": "12px"})
+            core.clear_stylesheet_cache(style, {"font_size": "12px"})
+            core._cached_qss(style, {"font_size": "12px"})
+        self.assertEqual(first, second)
+        self.assertEqual(render.call_count, 2)
+        self.assertEqual(core.stylesheet_cache_info().hits, 1)
+        core.clear_stylesheet_cache()
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Create a temporary cache directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_round_trip_and_header_checks(self) -> None:
+        cache = DiskCache(self.directory, "1.0")
+        cache.store("k", "QWidget {}\r\n", {"icons": Path("/icons")})
+        self.assertEqual(cache.load("k"), ("QWidget {}\r\n", {"icons": "/icons"}))
+        self.assertIsNone(DiskCache(self.directory, "2.0").load("k"))
+        self.assertIsNone(cache.load("missing"))
+
+        path = cache.path_for("k")
+        path.write_text(path.read_text(encoding="utf-8")[:-2], encoding="utf-8")
+        self.assertIsNone(cache.load("k"))
+        cache.clear()
+        self.assertFalse(path.exists())
+
+    def test_warm_start_skips_rendering(self) -> None:
+        style = core.generate_style("disk", "#336699", "#ff9900")
+        core.enable_disk_cache(self.directory)
+        try:
+            core.clear_stylesheet_cache()
+            with patch.object(core, "_prepare_arrow_icons") as prep, patch.object(
+                core, "_ensure_arrow_icons", return_value=Path("/icons")
+            ):
+                prep.side_effect = lambda *args: "icons:"
+                cold = core._cached_qss(style)
+            core.clear_stylesheet_cache()
+            with patch.object(core, "_build_qss") as build, patch.object(
+                core, "_use_arrow_icons", return_value=True
+            ) as use_icons:
+                warm = core._cached_qss(style)
+            build.assert_not_called()
+            self.assertEqual(use_icons.call_count, 2)
+            use_icons.assert_any_call("arrow_primary", Path("/icons"))
+            self.assertEqual(cold, warm)
+        finally:
+            core.disable_disk_cache()
+            core.clear_stylesheet_cache()
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution
+    unittest.main()
@@ -0,0 +1,126 @@
+"""Tests for the command-line interface."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+from q_materialise import cli, compiler, export
+
+
+def _run(*argv: str, stdin: str = ""):
+    out, err = io.StringIO(), io.StringIO()
+    with redirect_stdout(out), redirect_stderr(err), patch.object(
+        sys, "stdin", io.StringIO(stdin)
+    ):
+        status = cli.main(list(argv))
+    return status, out.getvalue(), err.getvalue()
+
+
+class TestCommandLine(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Provide a scratch directory."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+    def test_list(self) -> None:
+        status, out, _ = _run("list", "--json")
+        self.assertEqual(status, 0)
+        self.assertEqual(json.loads(out), compiler.list_styles())
+
+    def test_export_by_name_file_and_stdin(self) -> None:
+        extra = {"density_scale": "-1"}
+        expected = compiler.compile_qss("sapphire_day", extra)
+        dest = self.tmp / "out" / "sapphire_day.qss"
+        _run("export", "sapphire_day", "-o", str(dest), "--extra", json.dumps(extra))
+        self.assertEqual(dest.read_text(encoding="utf-8"), expected)
+
+        source = self.tmp / "mine.json"
+        source.write_text(compiler.get_style("sapphire_day").to_json(), "utf-8")
+        extra_file = self.tmp / "extra.json"
+        extra_file.write_text(json.dumps(extra), "utf-8")
+        _, out, _ = _run("export", str(source), "--extra", f"@{extra_file}")
+        self.assertEqual(out, expected)
+        stdin = source.read_text("utf-8")
+        _, out, _ = _run("export", "-", "--extra", json.dumps(extra), stdin=stdin)
+        self.assertEqual(out, expected)
+
+    def test_export_all_and_profile(self) -> None:
+        variants = json.dumps({"dense": {"density_scale": "-1"}})
+        argv = ["export-all", str(self.tmp), "--style", "sapphire_day"]
+        argv += ["--workers", "1"]
+        status, out, err = _run(*argv, "--variants", variants, "--profile")
+        self.assertEqual(status, 0)
+        self.assertIn("wrote 2 of 2 stylesheets", out)
+        self.assertIn("total", err)
+        self.assertTrue((self.tmp / "sapphire_day-dense.qss").is_file())
+        _, out, _ = _run(*argv, "--variants", variants)
+        self.assertIn("wrote 0 of 2 stylesheets (2 up to date)", out)
+
+    def test_invalid_input_exits_with_an_error(self) -> None:
+        for argv, stdin in (
+            (["export", "no_such_style"], ""),
+            (["export", "-"], "[]"),
+            (["export", "sapphire_day", "--extra", "{"], ""),
+            (["bench", "-n", "0"], ""),
+        ):
+            with self.assertRaises(SystemExit) as raised:
+                _run(*argv, stdin=stdin)
+            self.assertEqual(raised.exception.code, 2)
+
+    def test_bench_without_styles_exits_with_an_error(self) -> None:
+        # Patched by name: other tests may have re-imported the package.
+        with patch("q_materialise.compiler.list_styles", return_value=[]):
+            with self.assertRaises(SystemExit) as raised:
+                _run("bench")
+        self.assertEqual(raised.exception.code, 2)
+
+    def test_export_module_runs_export_all(self) -> None:
+        variants = self.tmp / "variants.json"
+        variants.write_text(json.dumps({"dense": {"density_scale": "-1"}}), "utf-8")
+        argv = [str(self.tmp / "qss"), "--style", "sapphire_day", "--workers", "1"]
+        out = io.StringIO()
+        with redirect_stdout(out):
+            status = export.main([*argv, "--variants", f"@{variants}"])
+        self.assertEqual(status, 0)
+        self.assertIn("wrote 2 of 2 stylesheets", out.getvalue())
+
+    def test_does_not_import_qt(self) -> None:
+        code = (
+            "import json, sys\n"
+            "from q_materialise.cli import main\n"
+            "main(['list'])\n"
+            "print(json.dumps(sorted(sys.modules)), file=sys.stderr)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        modules = json.loads(result.stderr)
+        for name in ("PySide6", "q_materialise.binding", "q_materialise.demo"):
+            self.assertNotIn(name, modules)
+
+    def test_closed_pipe_exits_quietly(self) -> None:
+        read_end, write_end = os.pipe()
+        os.close(read_end)
+        try:
+            result = subprocess.run(
+                [sys.executable, "-m", "q_materialise", "list"],
+                stdout=write_end,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        finally:
+            os.close(write_end)
+        self.assertEqual(result.returncode, 1)
+        self.assertEqual(result.stderr, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
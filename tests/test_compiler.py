@@ -0,0 +1,86 @@
+"""Tests for the Qt-free stylesheet compiler."""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from q_materialise import compiler
+
+# Makes every Qt binding unimportable before running the given code.
+_WITHOUT_QT = textwrap.dedent(
+    """
+    import sys
+
+    class _NoQt:
+        def find_spec(self, name, path=None, target=None):
+            if name.split(".")[0] in {
+                "PySide6", "PyQt6", "PySide2", "PyQt5", "shiboken6", "shiboken2"
+            }:
+                raise ImportError(name + " is blocked")
+            return None
+
+    sys.meta_path.insert(0, _NoQt())
+    """
+)
+
+
+class TestCompiler(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Redirect generated assets to a temporary directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.data = Path(self._tmp.name)
+
+    def test_export_runs_without_qt(self) -> None:
+        dest = self.data / "out" / "style.qss"
+        code = _WITHOUT_QT + textwrap.dedent(
+            f"""
+            import json
+            import q_materialise
+
+            q_materialise.export_style("{compiler.list_styles()[0]}", {str(dest)!r})
+            print(json.dumps(sorted(sys.modules)))
+            """
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "XDG_DATA_HOME": str(self.data), "APPDATA": str(self.data)},
+        )
+        modules = json.loads(result.stdout)
+        self.assertNotIn("q_materialise.binding", modules)
+        self.assertNotIn("q_materialise.core", modules)
+
+        qss = dest.read_text(encoding="utf-8")
+        self.assertIn("QPushButton", qss)
+        icons = sorted((self.data / "qmaterialise" / "icons").glob("*/down.svg"))
+        self.assertTrue(icons)
+        self.assertIn(f'image: url("{icons[0].as_posix()}")', qss)
+
+    def test_compile_refers_to_generated_icons(self) -> None:
+        style = compiler.generate_style("compiled", "#336699", "#ff9900")
+        with patch.object(compiler, "_app_data_dir", return_value=self.data), patch.dict(
+            compiler._ARROW_DIRS, clear=True
+        ):
+            qss = compiler.compile_qss(style)
+            primary = compiler._ARROW_DIRS[style.primary]
+        self.assertIn(f'url("{(primary / "down.svg").as_posix()}")', qss)
+        self.assertIn('fill="#336699"', (primary / "up.svg").read_text(encoding="utf-8"))
+
+    def test_app_data_dir_follows_xdg(self) -> None:
+        with patch.object(sys, "platform", "linux"), patch.dict(
+            os.environ, {"XDG_DATA_HOME": str(self.data)}
+        ):
+            self.assertEqual(compiler._app_data_dir(), self.data / "qmaterialise")
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution
+    unittest.main()
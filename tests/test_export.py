@@ -0,0 +1,121 @@
+"""Tests for the incremental bulk export."""
+
+import json
+import os
+import re
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from q_materialise import compiler, export
+
+VARIANTS = {"": None, "dense": {"density_scale": "-1"}}
+STYLES = ["sapphire_day", "crimson_depth"]
+
+
+class TestExportAll(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Export into a fresh directory."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.output = Path(tmp.name) / "qss"
+
+    def _export(self, **kwargs):
+        return export.export_all(self.output, STYLES, VARIANTS, workers=1, **kwargs)
+
+    def test_writes_every_style_and_variant(self) -> None:
+        summary = self._export()
+        self.assertEqual(
+            sorted(p.name for p in summary.written),
+            [
+                "crimson_depth-dense.qss",
+                "crimson_depth.qss",
+                "sapphire_day-dense.qss",
+                "sapphire_day.qss",
+            ],
+        )
+        self.assertEqual(summary.skipped, [])
+        qss = (self.output / "sapphire_day-dense.qss").read_text(encoding="utf-8")
+        # The same stylesheet, with the icons in the output directory
+        data_dir = compiler._app_data_dir().as_posix() + "/"
+        self.assertEqual(
+            qss,
+            compiler.compile_qss("sapphire_day", {"density_scale": "-1"}).replace(
+                data_dir, ""
+            ),
+        )
+        manifest = json.loads((self.output / export.MANIFEST_NAME).read_text("utf-8"))
+        self.assertEqual(len(manifest["files"]), 4)
+        self.assertIn("total", summary.timings)
+
+    def test_icons_are_shipped_with_the_stylesheets(self) -> None:
+        self._export()
+        manifest = json.loads((self.output / export.MANIFEST_NAME).read_text("utf-8"))
+        for name, entry in manifest["files"].items():
+            qss = (self.output / name).read_text(encoding="utf-8")
+            urls = set(re.findall(r'url\("([^"]+)"\)', qss))
+            self.assertEqual(urls, set(entry["icons"]))
+            for url in urls:
+                self.assertTrue(url.startswith(f"{export.ICONS_DIR}/"), url)
+                self.assertTrue((self.output / url).is_file(), url)
+
+        icon = self.output / manifest["files"]["sapphire_day.qss"]["icons"][0]
+        icon.unlink()
+        summary = self._export()
+        self.assertEqual(
+            sorted(p.name for p in summary.written),
+            ["sapphire_day-dense.qss", "sapphire_day.qss"],
+        )
+        self.assertTrue(icon.is_file())
+
+    @unittest.skipIf(os.name != "posix", "POSIX file permissions")
+    def test_outputs_are_world_readable(self) -> None:
+        self._export()
+        for path in self.output.rglob("*"):
+            if path.is_file():
+                self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o644, path.name)
+
+    def test_skips_unchanged_outputs(self) -> None:
+        self._export()
+        summary = self._export()
+        self.assertEqual(summary.written, [])
+        self.assertEqual(len(summary.skipped), 4)
+
+        edited = self.output / "crimson_depth.qss"
+        edited.write_text("/* edited */", encoding="utf-8")
+        (self.output / "sapphire_day-dense.qss").unlink()
+        summary = self._export()
+        self.assertEqual(
+            sorted(p.name for p in summary.written),
+            ["crimson_depth.qss", "sapphire_day-dense.qss"],
+        )
+        self.assertNotEqual(edited.read_text(encoding="utf-8"), "/* edited */")
+        self.assertEqual(len(self._export(force=True).written), 4)
+
+    def test_changed_inputs_are_rendered_again(self) -> None:
+        self._export()
+        style = compiler.get_style("sapphire_day")
+        style.primary = "#123456"
+        summary = export.export_all(self.output, [style], VARIANTS, workers=1)
+        self.assertEqual(len(summary.written), 2)
+        summary = export.export_all(
+            self.output, STYLES, {"dense": {"density_scale": "1"}}, workers=1
+        )
+        self.assertEqual(len(summary.written), 2)
+        summary = self._export(use_palette=True)
+        self.assertEqual(len(summary.written), 4)
+
+    def test_fingerprint_needs_no_source_files(self) -> None:
+        digest = export._renderer_fingerprint(False)
+        # As in byte-code only installs and frozen applications
+        with patch.object(compiler, "__file__", None):
+            self.assertEqual(export._renderer_fingerprint(False), digest)
+        with patch.object(compiler, "_QSS_TEMPLATE", compiler._QSS_TEMPLATE + "\n"):
+            self.assertNotEqual(export._renderer_fingerprint(False), digest)
+        self.assertNotEqual(export._renderer_fingerprint(True), digest)
+
+
+if __name__ == "__main__":
+    unittest.main()
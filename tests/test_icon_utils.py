@@ -0,0 +1,322 @@
+"""Tests for icon rendering and generated icon assets."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Use the offscreen platform to run Qt without a display.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from q_materialise import compiler, icon_utils  # noqa: E402
+
+
+class TestArrowIcons(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Redirect generated assets to a temporary directory."""
+        self._tmp = tempfile.TemporaryDirectory()
+        patcher = patch.object(
+            compiler, "_app_data_dir", return_value=Path(self._tmp.name)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+        registry = patch.dict(compiler._ARROW_DIRS, clear=True)
+        registry.start()
+        self.addCleanup(registry.stop)
+
+    def test_assets_written_once(self) -> None:
+        scheme = icon_utils._prepare_arrow_icons("#123456", "arrow_test")
+        self.assertEqual(scheme, "arrowtest:")
+        outdir = compiler._ARROW_DIRS["#123456"]
+        search_paths = icon_utils.QtCore.QDir.searchPaths("arrowtest")
+        self.assertEqual(search_paths, [str(outdir)])
+        down = (outdir / "down.svg").read_text(encoding="utf-8")
+        self.assertIn('fill="#123456"', down)
+
+        # Registry hit: no filesystem access at all.
+        with patch.object(compiler, "_svg_with_missing_fill_added") as render:
+            icon_utils._prepare_arrow_icons("#123456", "arrow_test")
+        render.assert_not_called()
+
+        # Fresh process (empty registry): files exist with the same checksum.
+        compiler._ARROW_DIRS.clear()
+        with patch.object(compiler, "_atomic_write") as write:
+            self.assertEqual(icon_utils._ensure_arrow_icons("#123456"), outdir)
+        write.assert_not_called()
+
+    def test_corrupt_asset_rewritten(self) -> None:
+        outdir = icon_utils._ensure_arrow_icons("#abcdef")
+        (outdir / "up.svg").write_text("broken", encoding="utf-8")
+        compiler._ARROW_DIRS.clear()
+        icon_utils._ensure_arrow_icons("#abcdef")
+        self.assertIn("#abcdef", (outdir / "up.svg").read_text(encoding="utf-8"))
+        self.assertNotEqual(icon_utils._ensure_arrow_icons("#fedcba"), outdir)
+
+
+class TestStandardIcons(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Create an application and a proxy style."""
+        QtWidgets = icon_utils.QtWidgets
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        self.style = icon_utils.IconProxyStyle(
+            QtWidgets.QCommonStyle(), icon_utils.QtGui.QColor("#336699"), False, 24
+        )
+        icon_utils._clear_icon_cache()
+        self.addCleanup(icon_utils._clear_icon_cache)
+
+    def test_mapped_icon_rendered_once(self) -> None:
+        sp = icon_utils.QtWidgets.QStyle.StandardPixmap.SP_DialogOkButton
+        with patch.object(
+            icon_utils, "_render_svg_tinted", wraps=icon_utils._render_svg_tinted
+        ) as render:
+            first = self.style.standardIcon(sp)
+            second = self.style.standardIcon(sp)
+        self.assertEqual(render.call_count, 1)
+        self.assertEqual(first.cacheKey(), second.cacheKey())
+        self.assertFalse(first.isNull())
+
+    def test_cache_is_bounded(self) -> None:
+        colour = icon_utils.QtGui.QColor("#000000")
+        cache = icon_utils._ICON_CACHE
+        self.addCleanup(setattr, cache, "maxsize", cache.maxsize)
+        cache.maxsize = 2
+        for px in (16, 24, 32):
+            icon_utils._standard_svg_icon("close.svg", px, colour, 1.0)
+        self.assertEqual(len(icon_utils._ICON_CACHE), 2)
+
+
+class TestSvgRendererPool(unittest.TestCase):
+    def test_files_parsed_once_and_evicted_by_budget(self) -> None:
+        pool = icon_utils._SvgRendererPool(budget_bytes=10**6)
+        path = icon_utils._ICONS_DIR / "close.svg"
+        reads = []
+        read_bytes = Path.read_bytes
+
+        def spy(self: Path) -> bytes:
+            reads.append(self)
+            return read_bytes(self)
+
+        with patch.object(Path, "read_bytes", spy):
+            first = pool.renderer(path)
+            self.assertIs(pool.renderer(path), first)
+        self.assertEqual(reads, [path])
+        self.assertTrue(first.isValid())
+
+        pool.renderer(icon_utils._ICONS_DIR / "menu.svg")
+        pool.budget = pool.used - 1
+        self.assertEqual(len(pool), 1)
+        self.assertIsNot(pool.renderer(path), first)
+
+
+class TestIconTintFilter(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Install a tint filter on the application."""
+        QtWidgets = icon_utils.QtWidgets
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        self.filter = icon_utils._IconTintFilter(icon_utils.QtGui.QColor("#ff0000"))
+        self.app.installEventFilter(self.filter)
+        self.addCleanup(self.app.removeEventFilter, self.filter)
+
+    def _icon(self):
+        pm = icon_utils.QtGui.QPixmap(16, 16)
+        pm.fill(icon_utils.QtGui.QColor("#000000"))
+        return icon_utils.QtGui.QIcon(pm)
+
+    def test_only_new_widgets_tinted_in_one_deferred_pass(self) -> None:
+        QtWidgets = icon_utils.QtWidgets
+        window = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(window)
+        buttons = [QtWidgets.QPushButton(self._icon(), str(i)) for i in range(5)]
+        for button in buttons:
+            layout.addWidget(button)
+        # A plain function rather than a mock, whose call records would
+        # keep the widgets alive in reference cycles after the test.
+        tinted = []
+        tint_widget = icon_utils._tint_widget
+
+        def tint(widget, color):
+            tinted.append(id(widget))
+            tint_widget(widget, color)
+
+        # No time budget, so that all the work fits into one pass
+        with patch.object(icon_utils, "_TINT_BUDGET_MS", 0), patch.object(
+            icon_utils, "_tint_widget", tint
+        ):
+            window.show()
+            self.assertEqual(tinted, [])
+            self.app.processEvents()
+        self.assertEqual(len(tinted), len(set(tinted)))
+        self.assertTrue(all(id(b) in tinted for b in buttons))
+        self.assertTrue(all(b.property(icon_utils._TINTED_PROP) for b in buttons))
+        window.close()
+
+    def test_deleted_widget_skipped(self) -> None:
+        button = icon_utils.QtWidgets.QPushButton(self._icon(), "x")
+        button.show()
+        button.deleteLater()
+        self.app.sendPostedEvents(None, icon_utils.QtCore.QEvent.Type.DeferredDelete)
+        self.app.processEvents()
+
+
+class TestRetint(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Create an application and a black source icon."""
+        QtGui = icon_utils.QtGui
+        self.app = (
+            icon_utils.QtWidgets.QApplication.instance()
+            or icon_utils.QtWidgets.QApplication([])
+        )
+        pm = QtGui.QPixmap(16, 16)
+        pm.fill(QtGui.QColor("#000000"))
+        self.icon = QtGui.QIcon(pm)
+        icon_utils.clear_tint_cache()
+        self.addCleanup(icon_utils.clear_tint_cache)
+
+    def test_switches_tint_the_original_icon(self) -> None:
+        QtWidgets = icon_utils.QtWidgets
+        button = QtWidgets.QPushButton(self.icon, "b")
+        button.addAction(icon_utils.QtGui.QAction(self.icon, "a", button))
+        tabs = QtWidgets.QTabBar()
+        tabs.addTab(self.icon, "one")
+        tabs.addTab(self.icon, "two")
+        sources = []
+        engine_init = icon_utils._TintIconEngine.__init__
+
+        def spy(engine, source, color):
+            sources.append(source.cacheKey())
+            engine_init(engine, source, color)
+
+        with patch.object(icon_utils._TintIconEngine, "__init__", spy):
+            for i in range(10):
+                # Each switch drops the tinted icons of the previous theme
+                icon_utils.clear_tint_cache()
+                colour = icon_utils.QtGui.QColor("#ff0000" if i % 2 else "#0000ff")
+                icon_utils._tint_widget(button, colour)
+                icon_utils._tint_widget(tabs, colour)
+        self.assertEqual(set(sources), {self.icon.cacheKey()})
+        self.assertEqual(len(sources), 10)
+        for obj in (button, button.actions()[0], tabs):
+            names = [bytes(n).decode() for n in obj.dynamicPropertyNames()]
+            kept = [n for n in names if n.startswith("_icon_source_")]
+            self.assertEqual(len(kept), 1)
+
+
+class TestTintScheduler(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Create an application and a scheduler."""
+        QtWidgets = icon_utils.QtWidgets
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        self.scheduler = icon_utils._TintScheduler(icon_utils.QtGui.QColor("#00ff00"))
+
+    def test_duplicates_coalesced(self) -> None:
+        QtWidgets = icon_utils.QtWidgets
+        widget = QtWidgets.QWidget()
+        action = icon_utils.QtGui.QAction("a")
+        for _ in range(3):
+            self.scheduler.add_widget(widget)
+            self.scheduler.add_action(action)
+        self.assertEqual(self.scheduler.pending(), 2)
+        tinted = []
+        with patch.object(
+            icon_utils, "_tint_widget", lambda obj, color: tinted.append("widget")
+        ), patch.object(
+            icon_utils, "_tint_action", lambda obj, color: tinted.append("action")
+        ):
+            self.app.processEvents()
+        self.assertEqual(sorted(tinted), ["action", "widget"])
+
+    def test_work_sliced_by_time_budget(self) -> None:
+        widgets = [icon_utils.QtWidgets.QWidget() for _ in range(20)]
+        for widget in widgets:
+            self.scheduler.add_widget(widget)
+
+        def slow_tint(widget, color):
+            icon_utils.time.sleep(0.002)
+
+        with patch.object(icon_utils, "_TINT_BUDGET_MS", 1.0), patch.object(
+            icon_utils, "_tint_widget", slow_tint
+        ):
+            self.scheduler._run()
+            self.assertGreater(self.scheduler.pending(), 0)
+            self.assertLess(self.scheduler.pending(), len(widgets))
+            while self.scheduler.pending():
+                self.app.processEvents()
+
+
+class TestTintCache(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Start from an empty tint cache."""
+        QtWidgets = icon_utils.QtWidgets
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        icon_utils.clear_tint_cache()
+        self.addCleanup(icon_utils.clear_tint_cache)
+
+    def test_shared_icon_tinted_once(self) -> None:
+        pm = icon_utils.QtGui.QPixmap(16, 16)
+        pm.fill(icon_utils.QtGui.QColor("#000000"))
+        icon = icon_utils.QtGui.QIcon(pm)
+        colour = icon_utils.QtGui.QColor("#ff0000")
+        with patch.object(
+            icon_utils, "_tint_pixmap", wraps=icon_utils._tint_pixmap
+        ) as tint:
+            first = icon_utils._colorize_icon(icon, colour)
+            calls = tint.call_count
+            second = icon_utils._colorize_icon(icon, colour)
+            again = icon_utils._colorize_icon(first, colour)
+            self.assertEqual(tint.call_count, calls)
+        self.assertEqual(first.cacheKey(), second.cacheKey())
+        self.assertEqual(again.cacheKey(), first.cacheKey())
+        info = icon_utils.tint_cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+
+        other = icon_utils._colorize_icon(icon, icon_utils.QtGui.QColor("#0000ff"))
+        self.assertNotEqual(other.cacheKey(), first.cacheKey())
+
+
+class TestTintIconEngine(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Create a black source icon."""
+        QtGui = icon_utils.QtGui
+        QtWidgets = icon_utils.QtWidgets
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        pm = QtGui.QPixmap(64, 64)
+        pm.fill(QtGui.QColor("#000000"))
+        self.source = QtGui.QIcon(pm)
+        self.colour = QtGui.QColor("#ff0000")
+
+    def test_pixmaps_tinted_lazily_per_size(self) -> None:
+        with patch.object(
+            icon_utils, "_tint_pixmap", wraps=icon_utils._tint_pixmap
+        ) as tint:
+            icon = icon_utils.QtGui.QIcon(
+                icon_utils._TintIconEngine(self.source, self.colour)
+            )
+            self.assertEqual(tint.call_count, 0)
+            pm = icon.pixmap(icon_utils.QtCore.QSize(16, 16), 1.0)
+            icon.pixmap(icon_utils.QtCore.QSize(16, 16), 1.0)
+            self.assertEqual(tint.call_count, 1)
+        self.assertEqual(pm.size(), icon_utils.QtCore.QSize(16, 16))
+        self.assertEqual(pm.toImage().pixelColor(8, 8).name(), "#ff0000")
+
+    def test_hidpi_pixmaps_rendered_at_device_resolution(self) -> None:
+        icon = icon_utils.QtGui.QIcon(
+            icon_utils._TintIconEngine(self.source, self.colour)
+        )
+        pm = icon.pixmap(icon_utils.QtCore.QSize(16, 16), 2.0)
+        self.assertEqual(pm.size(), icon_utils.QtCore.QSize(32, 32))
+        self.assertEqual(pm.devicePixelRatio(), 2.0)
+
+    def test_detached_copy_survives(self) -> None:
+        icon = icon_utils.QtGui.QIcon(
+            icon_utils._TintIconEngine(self.source, self.colour)
+        )
+        copy = icon_utils.QtGui.QIcon(icon)
+        copy.addPixmap(icon_utils.QtGui.QPixmap(8, 8))  # forces clone()
+        del icon
+        self.assertFalse(copy.pixmap(16, 16).isNull())
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution
+    unittest.main()
@@ -0,0 +1,208 @@
+"""Tests for what importing the package loads and what it costs.
+
+Import costs are taken from ``python -X importtime`` and compared with
+the cost of importing the Qt binding in the same way, so that the tests
+do not depend on how fast the machine is.
+"""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import unittest
+from typing import Any, Dict, Optional
+
+import q_materialise
+
+# Modules that must only be imported when the attributes needing them
+# are first used.
+LAZY_MODULES = (
+    "PySide6",
+    "PyQt6",
+    "PySide2",
+    "PyQt5",
+    "q_materialise.binding",
+    "q_materialise.core",
+    "q_materialise.demo",
+    "q_materialise.icon_utils",
+    "xml.etree.ElementTree",
+    "importlib.metadata",
+)
+
+# Share of the cost of importing a Qt binding that importing the package
+# may take.  The package needs no Qt binding, so this is only exceeded
+# when an import loads one (or something similarly heavy) again.
+PACKAGE_SHARE = 0.5
+
+# Share of the cost of a binding that the icon helpers may add on top of
+# it.  Loading a second Qt stack would at least double the cost.
+ICON_UTILS_SHARE = 1.0
+
+# Fresh interpreters each import cost is measured in; the cheapest counts.
+RUNS = 3
+
+# Binding (QT_API value) -> package.
+BINDINGS = {
+    "pyside6": "PySide6",
+    "pyqt6": "PyQt6",
+    "pyside2": "PySide2",
+    "pyqt5": "PyQt5",
+}
+
+
+def _run(code: str, env: Optional[Dict[str, str]] = None) -> Any:
+    """Runs ``code`` in a new interpreter; returns the JSON it prints."""
+    result = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, **(env or {})},
+    )
+    return json.loads(result.stdout)
+
+
+def _import_costs(
+    statement: str, env: Optional[Dict[str, str]] = None
+) -> Dict[str, int]:
+    """Runs ``statement`` under ``python -X importtime``.
+
+    Returns:
+        Dict[str, int]: Cumulative import time in microseconds of each
+        module ``statement`` imports itself (not of the modules those
+        import), keyed by module.
+    """
+    costs: Dict[str, int] = {}
+    for _ in range(RUNS):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, **(env or {})},
+        )
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or line.count("|") != 2:
+                continue
+            _, cumulative, name = line[len("import time:") :].split("|")
+            # Skip the header and nested imports, which are indented.
+            if not cumulative.strip().isdigit() or name.startswith("  "):
+                continue
+            name = name.strip()
+            costs[name] = min(costs.get(name, int(cumulative)), int(cumulative))
+    return costs
+
+
+def _cost_of(costs: Dict[str, int], package: str) -> int:
+    """Sums the costs of ``package`` and its submodules."""
+    return sum(cost for name, cost in costs.items() if name.split(".")[0] == package)
+
+
+def _qt_statement(package: str) -> str:
+    return f"import {package}.QtCore, {package}.QtGui, {package}.QtWidgets"
+
+
+class TestPackageImport(unittest.TestCase):
+    def test_package_import_defers_heavy_modules(self) -> None:
+        modules = _run(
+            """
+            import json, sys
+            import q_materialise
+            print(json.dumps(sorted(sys.modules)))
+            """
+        )
+        self.assertIn("q_materialise", modules)
+        for name in LAZY_MODULES:
+            self.assertNotIn(name, modules)
+
+    def test_package_import_costs_a_fraction_of_qt(self) -> None:
+        package = next(
+            (p for p in BINDINGS.values() if importlib.util.find_spec(p)), None
+        )
+        if package is None:
+            self.skipTest("no Qt binding is installed")
+        qt = _cost_of(_import_costs(_qt_statement(package)), package)
+        own = _cost_of(_import_costs("import q_materialise"), "q_materialise")
+        self.assertGreater(own, 0)
+        self.assertLess(own, qt * PACKAGE_SHARE)
+
+    def test_builtin_styles_read_from_the_pack_once(self) -> None:
+        reads, parsed, count = _run(
+            """
+            import json
+            from unittest import mock
+            from q_materialise import get_style, list_styles, pack, registry
+
+            with mock.patch.object(
+                registry, "read_pack", wraps=pack.read_pack
+            ) as read, mock.patch.object(
+                registry.StyleRegistry, "_parsed"
+            ) as parsed:
+                names = list_styles()
+                for name in names:
+                    get_style(name)
+                list_styles()
+            print(json.dumps([read.call_count, parsed.call_count, len(names)]))
+            """
+        )
+        self.assertGreater(count, 0)
+        self.assertEqual((reads, parsed), (1, 0))
+
+    def test_lazy_attributes_resolve(self) -> None:
+        self.assertEqual(q_materialise.inject_style.__module__, "q_materialise.core")
+        self.assertEqual(q_materialise.show_demo.__module__, "q_materialise.demo")
+        self.assertTrue(hasattr(q_materialise.QtWidgets, "QApplication"))
+        self.assertIn("show_demo", dir(q_materialise))
+        self.assertIsInstance(q_materialise.__version__, str)
+        with self.assertRaises(AttributeError):
+            q_materialise.no_such_attribute
+
+
+class TestBindingImports(unittest.TestCase):
+    """Modules and import cost of the icon helpers with each binding."""
+
+    def _check_binding(self, name: str) -> None:
+        package = BINDINGS[name]
+        if importlib.util.find_spec(package) is None:
+            self.skipTest(f"{package} is not installed")
+        code = f"""
+            import json, sys
+            from q_materialise import binding, icon_utils
+
+            before = sorted(sys.modules)
+            icon_utils._SVG_POOL.renderer(icon_utils._ICONS_DIR / "menu.svg")
+            print(json.dumps([binding.binding, before, "{package}.QtSvg" in sys.modules]))
+            """
+        env = {"QT_API": name, "QT_QPA_PLATFORM": "offscreen"}
+        selected, modules, svg_loaded = _run(code, env)
+        self.assertEqual(selected, name)
+        loaded = {module.split(".")[0] for module in modules}
+        self.assertEqual(loaded & set(BINDINGS.values()), {package})
+        self.assertNotIn(f"{package}.QtSvg", modules)
+        self.assertTrue(svg_loaded)
+        # What the icon helpers add to importing the binding itself
+        costs = _import_costs(
+            f"{_qt_statement(package)}; import q_materialise.icon_utils", env
+        )
+        qt = _cost_of(costs, package)
+        own = _cost_of(costs, "q_materialise")
+        self.assertGreater(own, 0)
+        self.assertLess(own, qt * ICON_UTILS_SHARE)
+
+    def test_pyside6(self) -> None:
+        self._check_binding("pyside6")
+
+    def test_pyqt6(self) -> None:
+        self._check_binding("pyqt6")
+
+    def test_pyside2(self) -> None:
+        self._check_binding("pyside2")
+
+    def test_pyqt5(self) -> None:
+        self._check_binding("pyqt5")
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution
+    unittest.main()
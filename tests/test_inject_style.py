@@ -0,0 +1,210 @@
+"""Tests for applying styles to a running application."""
+
+import os
+import tempfile
+import unittest
+from contextlib import ExitStack
+from unittest.mock import patch
+
+# Use the offscreen platform to run Qt without a display.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from q_materialise import (  # noqa: E402
+    Style,
+    compiler,
+    core,
+    differential,
+    icon_utils,
+    palette_unsupported,
+)
+from q_materialise.template import CompiledTemplate  # noqa: E402
+from q_materialise.binding import QtCore, QtWidgets  # noqa: E402
+
+
+class TestRepeatedInjection(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Create (or reuse) the application."""
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def test_proxy_style_and_filter_reused(self) -> None:
+        styles = core.list_styles()
+        core.inject_style(self.app, styles[0])
+        proxy = self.app._icon_proxy_style
+        filt = self.app._icon_tint_filter
+        with patch.object(self.app, "installEventFilter") as install:
+            for name in styles[1:4]:
+                core.inject_style(self.app, name)
+        install.assert_not_called()
+        self.assertIs(self.app._icon_proxy_style, proxy)
+        self.assertIs(self.app._icon_tint_filter, filt)
+        last = core.get_style(styles[3])
+        self.assertEqual(proxy._color.name(), core._text_colour(last))
+        self.assertEqual(filt._scheduler.color.name(), last.primary)
+
+    def test_replaced_style_gets_new_proxy(self) -> None:
+        core.inject_style(self.app, core.list_styles()[0])
+        proxy = self.app._icon_proxy_style
+        self.app.setStyle("Fusion")
+        core.inject_style(self.app, core.list_styles()[0])
+        self.assertIsNot(self.app._icon_proxy_style, proxy)
+        self.assertIsInstance(self.app._icon_proxy_style, icon_utils.IconProxyStyle)
+
+
+class TestCachedInjection(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Start from empty stylesheet caches."""
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        self.style = core.generate_style("cached", "#336699", "#ff9900")
+        core.clear_stylesheet_cache()
+        self.addCleanup(core.clear_stylesheet_cache)
+
+    def _inject_counting_work(self):
+        with ExitStack() as stack:
+            svg = stack.enter_context(
+                patch.object(
+                    compiler,
+                    "_svg_with_missing_fill_added",
+                    wraps=compiler._svg_with_missing_fill_added,
+                )
+            )
+            render = stack.enter_context(
+                patch.object(
+                    CompiledTemplate,
+                    "render",
+                    autospec=True,
+                    side_effect=CompiledTemplate.render,
+                )
+            )
+            core.inject_style(self.app, self.style)
+        return svg.call_count, render.call_count
+
+    def test_memory_hit_does_no_svg_or_template_work(self) -> None:
+        core.inject_style(self.app, self.style)
+        self.assertEqual(self._inject_counting_work(), (0, 0))
+
+    def test_warm_disk_start_does_no_svg_or_template_work(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            core.enable_disk_cache(directory)
+            try:
+                core.inject_style(self.app, self.style)
+                # What a new process starts with
+                core.clear_stylesheet_cache()
+                compiler._ARROW_DIRS.clear()
+                self.assertEqual(self._inject_counting_work(), (0, 0))
+            finally:
+                core.disable_disk_cache()
+
+
+class _StyledWindowTestCase(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Create a window with a few widgets styled with a base style."""
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        self.base = core.get_style(core.list_styles()[0])
+        self.accent = Style.from_dict({**self.base.to_dict(), "primary": "#e91e63"})
+        self.window = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(self.window)
+        self.button = QtWidgets.QPushButton("Button")
+        self.label = QtWidgets.QLabel("Label")
+        self.spin = QtWidgets.QSpinBox()
+        self.combo = QtWidgets.QComboBox()
+        self.combo.addItems(["one", "two"])
+        self.disabled = QtWidgets.QPushButton("Disabled")
+        self.disabled.setEnabled(False)
+        for widget in (self.button, self.label, self.spin, self.combo, self.disabled):
+            layout.addWidget(widget)
+        self.window.resize(300, 300)
+        self.window.show()
+        core.inject_style(self.app, self.base)
+        self.app.processEvents()
+
+    def tearDown(self) -> None:
+        self.window.close()
+        self.window.deleteLater()
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete)
+        core.inject_style(self.app, self.base)
+
+    def _inject(self, style, **kwargs) -> int:
+        results = []
+        apply_stylesheet = core.apply_stylesheet
+
+        def record(*args, **kw):
+            results.append(apply_stylesheet(*args, **kw))
+            return results[-1]
+
+        with patch.object(core, "apply_stylesheet", record):
+            core.inject_style(self.app, style, **kwargs)
+        self.app.processEvents()
+        return results[0]
+
+
+class TestDifferentialSwitch(_StyledWindowTestCase):
+    def test_primary_change_only_restyles_affected_widgets(self) -> None:
+        qss = self.app.styleSheet()
+        restyled = self._inject(self.accent, differential=True)
+        self.assertGreater(restyled, 0)
+        self.assertEqual(self.app.styleSheet(), qss)
+        self.assertTrue(self.button.styleSheet().startswith(differential._OVERLAY_MARKER))
+        self.assertEqual(self.label.styleSheet(), "")
+        # Line edits embedded in spin boxes are styled through their parent
+        self.assertEqual(self.spin.lineEdit().styleSheet(), "")
+
+    def test_differential_matches_full_switch(self) -> None:
+        self._inject(self.accent, differential=True)
+        partial = self.window.grab().toImage()
+        self.assertEqual(self._inject(self.accent), -1)
+        full = self.window.grab().toImage()
+        self.assertEqual(partial, full)
+
+    def test_switching_back_removes_overlays(self) -> None:
+        self._inject(self.accent, differential=True)
+        self._inject(self.base, differential=True)
+        for widget in self.app.allWidgets():
+            self.assertFalse(widget.styleSheet().startswith(differential._OVERLAY_MARKER))
+
+    def test_new_widgets_receive_overlay(self) -> None:
+        self._inject(self.accent, differential=True)
+        button = QtWidgets.QPushButton("Late", self.window)
+        button.ensurePolished()
+        self.assertEqual(button.styleSheet(), self.button.styleSheet())
+
+    def test_global_change_falls_back_to_full_switch(self) -> None:
+        other = Style.from_dict({**self.base.to_dict(), "background": "#102030"})
+        self.assertEqual(self._inject(other, differential=True), -1)
+        self.assertNotEqual(self.app._qss_state.base_signature["BACKGROUND"], self.base.background)
+
+    def test_own_stylesheet_falls_back_to_full_switch(self) -> None:
+        self.button.setStyleSheet("QPushButton { font-weight: bold; }")
+        self.assertEqual(self._inject(self.accent, differential=True), -1)
+        self.assertEqual(self.button.styleSheet(), "QPushButton { font-weight: bold; }")
+
+
+class TestPaletteSwitch(_StyledWindowTestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Style the window with the palette referring stylesheet."""
+        super().setUp()
+        self.dark = Style.from_dict({**self.base.to_dict(), "background": "#102030"})
+        self.assertEqual(self._inject(self.base, use_palette=True), -1)
+
+    def test_palette_template_matches_literal_colours(self) -> None:
+        themed = self.window.grab().toImage()
+        self._inject(self.base)
+        self.assertEqual(themed, self.window.grab().toImage())
+
+    def test_colour_change_does_not_reparse_stylesheet(self) -> None:
+        qss = self.app.styleSheet()
+        self.assertEqual(palette_unsupported(self.base, self.dark), [])
+        self.assertGreater(self._inject(self.dark, use_palette=True), 0)
+        self.assertEqual(self.app.styleSheet(), qss)
+        for widget in self.app.allWidgets():
+            self.assertEqual(widget.styleSheet(), "")
+        switched = self.window.grab().toImage()
+        self._inject(self.dark)
+        self.assertEqual(switched, self.window.grab().toImage())
+
+    def test_literal_colour_change_restyles(self) -> None:
+        self.assertIn("PRIMARY", palette_unsupported(self.base, self.accent))
+        self.assertEqual(self._inject(self.accent, use_palette=True), -1)
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution
+    unittest.main()
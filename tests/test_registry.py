@@ -0,0 +1,167 @@
+"""Tests for the indexed style registry."""
+
+import json
+import os
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+from unittest.mock import patch
+
+from q_materialise import compiler, pack, registry
+from q_materialise.registry import StyleRegistry
+
+
+def _write_style(directory: Path, name: str, primary: str) -> Path:
+    path = directory / f"{name}.json"
+    path.write_text(
+        json.dumps({"name": name, "primary": primary, "secondary": "#03dac6"}),
+        encoding="utf-8",
+    )
+    return path
+
+
+def _touch(path: Path, offset: int) -> None:
+    """Moves a file's modification time so the change is always visible."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + offset * 10**9))
+
+
+class TestStyleRegistry(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Create a built-in and a user style directory."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.builtin = Path(tmp.name) / "builtin"
+        self.user = Path(tmp.name) / "user"
+        self.builtin.mkdir()
+        _write_style(self.builtin, "ocean", "#0000ff")
+        _write_style(self.builtin, "forest", "#00ff00")
+        self.registry = StyleRegistry([self.builtin])
+
+    def test_parses_each_file_once(self) -> None:
+        with patch.object(registry.json, "load", wraps=json.load) as load:
+            first = self.registry.get("ocean")
+            second = self.registry.get("ocean")
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_returned_styles_do_not_share_state(self) -> None:
+        style = self.registry.get("ocean")
+        style.primary = "#123456"
+        style.extras["changed"] = True
+        fresh = self.registry.get("ocean")
+        self.assertEqual(fresh.primary, "#0000ff")
+        self.assertEqual(fresh.extras, {})
+
+    def test_changed_file_is_reloaded(self) -> None:
+        self.assertEqual(self.registry.get("ocean").primary, "#0000ff")
+        path = _write_style(self.builtin, "ocean", "#ff0000")
+        _touch(path, 1)
+        self.assertEqual(self.registry.get("ocean").primary, "#ff0000")
+
+    def test_directory_changes_update_the_index(self) -> None:
+        self.assertEqual(self.registry.names(), ["forest", "ocean"])
+        _write_style(self.builtin, "desert", "#c2b280")
+        (self.builtin / "forest.json").unlink()
+        _touch(self.builtin, 1)
+        self.assertEqual(self.registry.names(), ["desert", "ocean"])
+        with self.assertRaises(FileNotFoundError):
+            self.registry.get("forest")
+
+    def test_user_directory_overrides_builtin_styles(self) -> None:
+        self.registry.add_directory(self.user)
+        self.assertEqual(self.registry.names(), ["forest", "ocean"])
+        self.user.mkdir()
+        _write_style(self.user, "ocean", "#abcdef")
+        _write_style(self.user, "sunset", "#ff8800")
+        self.assertEqual(self.registry.names(), ["forest", "ocean", "sunset"])
+        self.assertEqual(self.registry.get("ocean").primary, "#abcdef")
+        self.assertTrue(self.registry.remove_directory(self.user))
+        self.assertEqual(self.registry.get("ocean").primary, "#0000ff")
+        self.assertNotIn("sunset", self.registry)
+
+
+class TestStylePack(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Create a style directory with a pack built from it."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.styles = Path(tmp.name) / "styles"
+        self.styles.mkdir()
+        _write_style(self.styles, "ocean", "#0000ff")
+        _write_style(self.styles, "forest", "#00ff00")
+        self.pack = pack.build_pack(self.styles, Path(tmp.name) / "pack.json")
+        self.registry = StyleRegistry([self.styles], packs={self.styles: self.pack})
+
+    def test_bundled_pack_is_in_sync(self) -> None:
+        self.assertEqual(pack.check_pack(), [])
+
+    def test_check_reports_stale_styles(self) -> None:
+        self.assertEqual(pack.check_pack(self.styles, self.pack), [])
+        _write_style(self.styles, "ocean", "#ff0000")
+        _write_style(self.styles, "desert", "#c2b280")
+        (self.styles / "forest.json").unlink()
+        self.assertEqual(
+            pack.check_pack(self.styles, self.pack), ["desert", "forest", "ocean"]
+        )
+
+    def test_styles_are_served_from_the_pack(self) -> None:
+        source = json.loads((self.styles / "ocean.json").read_text(encoding="utf-8"))
+        with patch.object(registry, "read_pack", wraps=pack.read_pack) as read:
+            with patch.object(StyleRegistry, "_parsed") as parsed:
+                self.assertEqual(self.registry.names(), ["forest", "ocean"])
+                style = self.registry.get("ocean")
+                self.registry.get("forest")
+        self.assertEqual(read.call_count, 1)
+        parsed.assert_not_called()
+        self.assertEqual(style, compiler.Style.from_dict(source))
+
+    def test_unreadable_pack_falls_back_to_files(self) -> None:
+        _write_style(self.styles, "desert", "#c2b280")
+        self.pack.write_text("{", encoding="utf-8")
+        self.assertEqual(self.registry.names(), ["desert", "forest", "ocean"])
+        _write_style(self.styles, "ocean", "#ff0000")
+        pack.build_pack(self.styles, self.pack)
+        _touch(self.pack, 1)
+        with patch.object(StyleRegistry, "_parsed") as parsed:
+            self.assertEqual(self.registry.get("ocean").primary, "#ff0000")
+        parsed.assert_not_called()
+        self.pack.unlink()
+        self.assertEqual(self.registry.get("desert").primary, "#c2b280")
+
+    def test_newer_style_files_replace_the_pack(self) -> None:
+        self.assertEqual(self.registry.get("ocean").primary, "#0000ff")
+        _touch(_write_style(self.styles, "ocean", "#ff0000"), 2)
+        _touch(_write_style(self.styles, "desert", "#c2b280"), 2)
+        _touch(self.styles, 2)
+        with self.assertWarnsRegex(UserWarning, "desert.json, ocean.json"):
+            self.assertEqual(self.registry.names(), ["desert", "forest", "ocean"])
+        self.assertEqual(self.registry.get("ocean").primary, "#ff0000")
+
+        pack.build_pack(self.styles, self.pack)
+        _touch(self.pack, 3)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with patch.object(StyleRegistry, "_parsed") as parsed:
+                self.assertEqual(self.registry.get("desert").primary, "#c2b280")
+        parsed.assert_not_called()
+
+
+class TestStyleDirectories(unittest.TestCase):
+    def test_get_style_finds_user_styles(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            _write_style(Path(tmp), "my_theme", "#336699")
+            compiler.add_style_directory(tmp)
+            try:
+                self.assertIn("my_theme", compiler.list_styles())
+                self.assertEqual(compiler.get_style("my_theme").primary, "#336699")
+            finally:
+                self.assertTrue(compiler.remove_style_directory(tmp))
+        self.assertNotIn("my_theme", compiler.list_styles())
+        self.assertFalse(compiler.remove_style_directory(compiler.THEMES_DIR))
+
+
+if __name__ == "__main__":
+    unittest.main()
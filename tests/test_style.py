@@ -0,0 +1,60 @@
+"""Tests for the immutable style variant."""
+
+import copy
+import pickle
+import unittest
+from dataclasses import FrozenInstanceError
+
+from q_materialise import compiler
+from q_materialise.cache import fingerprint
+from q_materialise.style import FrozenStyle, Style
+
+
+class TestFrozenStyle(unittest.TestCase):
+    def setUp(self) -> None:  # noqa: D401
+        """Use a built-in style with extras."""
+        self.style = compiler.get_style("crimson_depth")
+        self.frozen = self.style.freeze()
+
+    def test_mirrors_the_mutable_style(self) -> None:
+        self.assertEqual(self.frozen.to_dict(), self.style.to_dict())
+        self.assertEqual(list(self.frozen.to_dict()), list(self.style.to_dict()))
+        self.assertEqual(self.frozen.thaw(), self.style)
+        self.assertEqual(self.frozen.primary_light, self.style.primary_light)
+        self.assertEqual(dict(self.frozen.extras), self.style.extras)
+        self.assertEqual(
+            FrozenStyle("a", "#FF0000", "#00ff00").to_dict(),
+            Style("a", "#FF0000", "#00ff00").to_dict(),
+        )
+
+    def test_hashable_and_equal_by_value(self) -> None:
+        other = FrozenStyle.from_dict(self.style.to_dict())
+        self.assertEqual(self.frozen, other)
+        self.assertEqual(hash(self.frozen), hash(other))
+        self.assertEqual(len({self.frozen, other}), 1)
+        changed = FrozenStyle.from_dict({**self.style.to_dict(), "primary": "#000000"})
+        self.assertNotEqual(self.frozen, changed)
+        self.assertNotEqual(self.frozen, self.style)
+
+    def test_cannot_be_modified(self) -> None:
+        with self.assertRaises(FrozenInstanceError):
+            self.frozen.primary = "#000000"  # type: ignore[misc]
+        with self.assertRaises(TypeError):
+            self.frozen.extras["danger"] = "#000000"  # type: ignore[index]
+        self.assertFalse(hasattr(self.frozen, "__dict__"))
+        self.style.extras["danger"] = "#000000"
+        self.assertEqual(self.frozen.extras["danger"], "#dc3545")
+
+    def test_copy_and_pickle(self) -> None:
+        self.assertIs(copy.deepcopy(self.frozen), self.frozen)
+        restored = pickle.loads(pickle.dumps(self.frozen))
+        self.assertEqual(restored, self.frozen)
+        self.assertEqual(hash(restored), hash(self.frozen))
+
+    def test_accepted_in_place_of_a_style(self) -> None:
+        self.assertEqual(fingerprint(self.frozen), fingerprint(self.style))
+        self.assertEqual(compiler.compile_qss(self.frozen), compiler.compile_qss(self.style))
+
+
+if __name__ == "__main__":
+    unittest.main()
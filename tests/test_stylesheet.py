@@ -22,22 +22,30 @@ qt.QtCore = qtcore
 qt.QtGui = qtgui
 qt.QtWidgets = qtwidgets
 qt.QtSvg = qtsvg
-sys.modules.update(
-    {
-        "PySide6": qt,
-        "PySide6.QtCore": qtcore,
-        "PySide6.QtGui": qtgui,
-        "PySide6.QtWidgets": qtwidgets,
-        "PySide6.QtSvg": qtsvg,
-        # Prevent q_materialise.__init__ from importing the real demo module
-        "q_materialise.demo": types.ModuleType("q_materialise.demo"),
-    }
-)
+_stubs = {
+    "PySide6": qt,
+    "PySide6.QtCore": qtcore,
+    "PySide6.QtGui": qtgui,
+    "PySide6.QtWidgets": qtwidgets,
+    "PySide6.QtSvg": qtsvg,
+    # Prevent q_materialise.__init__ from importing the real demo module
+    "q_materialise.demo": types.ModuleType("q_materialise.demo"),
+}
+_saved = {name: sys.modules.get(name) for name in _stubs}
+sys.modules.update(_stubs)
 
 sys.modules["q_materialise.demo"].show_demo = lambda: None
 
 from q_materialise.core import _build_qss, generate_style  # noqa: E402
 
+# Restore the previous modules so the stubs do not leak into other test
+# modules that use the real binding.
+for _name, _module in _saved.items():
+    if _module is None:
+        sys.modules.pop(_name, None)
+    else:
+        sys.modules[_name] = _module
+
 
 class TestStyleSheet(unittest.TestCase):
     def setUp(self) -> None:  # noqa: D401
@@ -65,7 +73,7 @@ class TestStyleSheet(unittest.TestCase):
         qss = self._patched_qss()
         self.assertRegex(
             qss,
-            r"QLCDNumber \{[^}]*qproperty-segmentStyle: QLCDNumber::Flat;",
+            r"QLCDNumber \{[^}]*qproperty-segmentStyle: Flat;",
         )
 
     def test_keysequenceedit_included(self) -> None:
@@ -0,0 +1,113 @@
+"""Tests for the compiled QSS template engine."""
+
+import unittest
+
+from q_materialise.template import (
+    CompiledTemplate,
+    selector_specificity,
+    selector_subject,
+    split_selectors,
+)
+
+
+class TestCompiledTemplate(unittest.TestCase):
+    SOURCE = "A {{x: {FOO};}}\nB {{y: {BAR}; z: {FOO};}}\n"
+
+    def setUp(self) -> None:  # noqa: D401
+        """Compile the sample template."""
+        self.template = CompiledTemplate(self.SOURCE)
+
+    def test_matches_str_format(self) -> None:
+        values = {"FOO": "#ff0000", "BAR": 12}
+        self.assertEqual(self.template.render(values), self.SOURCE.format(**values))
+
+    def test_slots_and_offsets(self) -> None:
+        self.assertEqual(self.template.slots, ("FOO", "BAR", "FOO"))
+        self.assertEqual(self.template.names, ("FOO", "BAR"))
+        for name, offset in zip(self.template.slots, self.template.offsets):
+            self.assertTrue(self.SOURCE.startswith(f"{{{name}}}", offset))
+
+    def test_patch_only_changes_named_slots(self) -> None:
+        values = {"FOO": "a", "BAR": "b"}
+        parts = self.template.render_parts(values)
+        patched = self.template.patch(parts, {"FOO": "c", "UNUSED": "d"})
+        self.assertEqual(patched, self.SOURCE.format(FOO="c", BAR="b"))
+
+    def test_missing_variable_raises(self) -> None:
+        with self.assertRaises(KeyError):
+            self.template.render({"FOO": "a"})
+
+    def test_unbalanced_brace_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            CompiledTemplate("QWidget { color: {FOO}; }")
+
+    def test_builtin_template_matches_str_format(self) -> None:
+        from q_materialise.core import _COMPILED_QSS, _QSS_TEMPLATE
+
+        values = {name: f"<{name}>" for name in _COMPILED_QSS.names}
+        self.assertEqual(_COMPILED_QSS.render(values), _QSS_TEMPLATE.format(**values))
+
+
+class TestTemplateRules(unittest.TestCase):
+    SOURCE = (
+        "/* Buttons */\nQPushButton, QToolButton:hover {{color: {FOO}; border: 0;}}\n"
+        'QFrame[shape="a, b"] {{background-color: {BAR};}}\n'
+    )
+
+    def test_rules_split_selectors_and_bodies(self) -> None:
+        rules = CompiledTemplate(self.SOURCE).rules
+        self.assertEqual(len(rules), 2)
+        self.assertEqual(rules[0].selectors, ("QPushButton", "QToolButton:hover"))
+        self.assertEqual(rules[0].names, {"FOO"})
+        self.assertEqual(rules[0].properties, {"color", "border"})
+        self.assertEqual(rules[0].body.render({"FOO": "red"}), "{color: red; border: 0;}")
+        self.assertEqual(rules[1].selectors, ('QFrame[shape="a, b"]',))
+        self.assertEqual(rules[1].properties, {"background-color"})
+
+    def test_substitute_fixes_selected_slots(self) -> None:
+        template = CompiledTemplate(self.SOURCE).substitute(
+            {"FOO": "palette(highlight)", "BAR": "x"}, where=lambda i: i == 0
+        )
+        self.assertEqual(template.slots, ("BAR",))
+        rules = template.rules
+        self.assertEqual(rules[0].roles, {"highlight"})
+        self.assertEqual(rules[0].names, frozenset())
+        self.assertEqual(rules[1].roles, frozenset())
+        self.assertEqual(
+            template.render({"BAR": "red"}),
+            CompiledTemplate(self.SOURCE).render({"FOO": "palette(highlight)", "BAR": "red"}),
+        )
+
+    def test_selector_subject(self) -> None:
+        self.assertEqual(
+            selector_subject("QMenuBar QMenu::item:selected"),
+            ("QMenuBar ", "QMenu", "::item:selected"),
+        )
+        self.assertEqual(
+            selector_subject("QScrollArea > QWidget"), ("QScrollArea > ", "QWidget", "")
+        )
+        self.assertEqual(selector_subject("*:disabled"), ("", "", ":disabled"))
+        self.assertEqual(
+            selector_subject('QFrame[a="x y"]'), ("", "QFrame", '[a="x y"]')
+        )
+
+    def test_selector_specificity(self) -> None:
+        self.assertEqual(selector_specificity("*"), (0, 0, 0))
+        self.assertEqual(selector_specificity("*:disabled"), (0, 1, 0))
+        self.assertEqual(selector_specificity("QMenuBar QMenu::item:selected"), (0, 2, 2))
+        self.assertEqual(selector_specificity('QPushButton#ok[flat="true"]'), (1, 1, 1))
+
+    def test_split_selectors_ignores_comments(self) -> None:
+        self.assertEqual(
+            split_selectors("/* a, b */ QLabel,\n  QFrame /* c */"), ("QLabel", "QFrame")
+        )
+
+    def test_builtin_template_rules_cover_all_slots(self) -> None:
+        from q_materialise.core import _COMPILED_QSS
+
+        slots = [slot for rule in _COMPILED_QSS.rules for slot in rule.body.slots]
+        self.assertEqual(tuple(slots), _COMPILED_QSS.slots)
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution
+    unittest.main()
@@ -0,0 +1,67 @@
+"""Tests for the colour helpers."""
+
+import random
+import unittest
+
+from q_materialise import utils
+
+
+def _reference_rgb(hex_colour):
+    s = hex_colour.strip().lstrip("#")
+    if len(s) == 3:
+        s = "".join(ch * 2 for ch in s)
+    return int(s[0:2], 16), int(s[2:4], 16), int(s[4:6], 16)
+
+
+def _reference_hex(rgb):
+    r, g, b = (max(0, min(255, int(v))) for v in rgb)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+class TestColourHelpers(unittest.TestCase):
+    def test_matches_string_arithmetic(self) -> None:
+        rng = random.Random(1234)
+        colours = [f"#{rng.randrange(1 << 24):06x}" for _ in range(500)]
+        colours += ["#000", "#FFF", " #AbC ", "123456", "#ffffff", "#000000"]
+        factors = [0, 0.1, 0.2, 0.25, 1 / 3, 0.5, 1, -0.5, 1.5]
+        for colour in colours:
+            r, g, b = _reference_rgb(colour)
+            self.assertEqual(utils.hex_to_rgb(colour), (r, g, b))
+            self.assertEqual(
+                utils.perceived_brightness(colour), 0.299 * r + 0.587 * g + 0.114 * b
+            )
+            self.assertEqual(
+                utils.contrast_color(colour),
+                "#000000" if 0.299 * r + 0.587 * g + 0.114 * b >= 186 else "#ffffff",
+            )
+            for f in factors:
+                self.assertEqual(
+                    utils.lighten(colour, f),
+                    _reference_hex(
+                        (
+                            int(r + (255 - r) * f),
+                            int(g + (255 - g) * f),
+                            int(b + (255 - b) * f),
+                        )
+                    ),
+                )
+                self.assertEqual(
+                    utils.darken(colour, f),
+                    _reference_hex(
+                        (int(r * (1 - f)), int(g * (1 - f)), int(b * (1 - f)))
+                    ),
+                )
+
+    def test_rgb_to_hex_clamps(self) -> None:
+        self.assertEqual(utils.rgb_to_hex((-5, 300, 12.7)), "#00ff0c")
+
+    def test_invalid_colours_raise(self) -> None:
+        for colour in ("", "#12345", "#gggggg", "#1234567"):
+            with self.assertRaises(ValueError):
+                utils.hex_to_rgb(colour)
+            with self.assertRaises(ValueError):
+                utils.lighten(colour, 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()